@@ -1,50 +1,104 @@
-import anytree
-import Bio
-import dendropy
+import collections
 import contextlib
 from deprecated.sphinx import deprecated
-from functools import lru_cache
-import networkx as nx
-import pandas
+import functools
+import importlib
+import io
+from iterpop import iterpop as ip
+import mmap
+import opytional as opyt
 import pathlib
-import treeswift
+import sys
 import typing
 import typing_extensions
 import validators
 import warnings
+import weakref
 import yarl
 
-from ._impl import alifestd_validate as alifestd_validate
-from ._impl import ete3
-from ._impl import phytrack_Systematics
+from ._impl import mmap_file as _mmap_file
+from ._impl import open_text_source as _open_text_source
 from ._impl import robust_isinstance
 
-from .alife_dataframe_to_biopython_tree \
-    import alife_dataframe_to_biopython_tree
-from .alife_dataframe_to_dendropy_tree \
-    import alife_dataframe_to_dendropy_tree
-from .alife_dataframe_to_ete_tree \
-    import alife_dataframe_to_ete_tree
-from .alife_dataframe_to_treeswift_tree \
-    import alife_dataframe_to_treeswift_tree
-from .alife_dataframe_to_networkx_digraph \
-    import alife_dataframe_to_networkx_digraph
-from .alife_dataframe_to_phylotrack_systematics \
-    import alife_dataframe_to_phylotrack_systematics
-from .anytree_tree_to_alife_dataframe \
-    import anytree_tree_to_alife_dataframe
-from .biopython_tree_to_alife_dataframe \
-    import biopython_tree_to_alife_dataframe
-from .dendropy_tree_to_alife_dataframe \
-    import dendropy_tree_to_alife_dataframe
-from .ete_tree_to_alife_dataframe \
-    import ete_tree_to_alife_dataframe
-from .networkx_digraph_to_alife_dataframe \
-    import networkx_digraph_to_alife_dataframe
-from .phylotrack_systematics_to_alife_dataframe \
-    import phylotrack_systematics_to_alife_dataframe
-from .treeswift_tree_to_alife_dataframe \
-    import treeswift_tree_to_alife_dataframe
+# backends are imported on first use, so that working with trees of one
+# library does not pay for importing all the others
+if typing.TYPE_CHECKING:
+    import anytree
+    import Bio
+    import dendropy
+    import networkx as nx
+    import pandas
+    import treeswift
+
+    from ._impl import CompactTree
+    from ._impl import ete3
+    from ._impl import phytrack_Systematics
+
+
+def _is_backend_instance(obj: object, module: str, classname: str) -> bool:
+    """Is `obj` an instance of class `classname` from backend `module`?
+
+    Backends that have not been imported cannot have made `obj`, so they are
+    ruled out without importing them.
+    """
+    return module in sys.modules and robust_isinstance(
+        obj, getattr(sys.modules[module], classname, None),
+    )
+
+
+def _lazy_converter(name: str, **kwargs: typing.Any) -> typing.Callable:
+    """Wrap this package's conversion function `name`, importing its module
+    on first call and forwarding `kwargs`."""
+
+    def converter(tree: typing.Any) -> typing.Any:
+        module = importlib.import_module(f".{name}", __package__)
+        return getattr(module, name)(tree, **kwargs)
+
+    return converter
+
+
+def _cached(method: typing.Callable) -> typing.Callable:
+    """Cache result of conversion `method` within the instance, subject to
+    its cache budget."""
+
+    @functools.wraps(method)
+    def wrapper(self: "RosettaTree") -> typing.Any:
+        return self._get_cached(method.__name__, lambda: method(self))
+
+    return wrapper
+
+
+def _passthrough(kind: str) -> typing.Callable:
+    """Serve conversion `method` from the retained source tree instead, if
+    it is of backend `kind`."""
+
+    def decorator(method: typing.Callable) -> typing.Callable:
+        @functools.wraps(method)
+        def wrapper(self: "RosettaTree") -> typing.Any:
+            source = self._get_source(kind)
+            return method(self) if source is None else source
+
+        return wrapper
+
+    return decorator
+
+
+def _direct(**converters: typing.Callable) -> typing.Callable:
+    """Serve conversion `method` by converting the retained source tree
+    directly, bypassing alife standard format, if `converters` has an entry
+    for its backend kind."""
+
+    def decorator(method: typing.Callable) -> typing.Callable:
+        @functools.wraps(method)
+        def wrapper(self: "RosettaTree") -> typing.Any:
+            source = self._get_source(self._source_kind)
+            if source is None or self._source_kind not in converters:
+                return method(self)
+            return converters[self._source_kind](source)
+
+        return wrapper
+
+    return decorator
 
 
 class RosettaTree:
@@ -54,24 +108,40 @@ class RosettaTree:
     Enables user to translate across tree implementations without repeatedly
     calling the individual conversion functions. This allows users to accept
     any such tree as an argument in a library-agnostic way.
+
+    By default, trees from other libraries are held by reference, not
+    copied, and converted only as other representations are requested. So,
+    later modifications to the source tree carry over into representations
+    not yet converted or cached, as well as into the source tree itself
+    being returned as its library's representation. Pass
+    `retain_source="none"` to snapshot the source tree in alife standard
+    format on construction instead.
     """
 
-    _tree: pandas.DataFrame
+    _source: typing.Any
+    _source_kind: typing.Optional[str]
+    _validation_timings: typing.Dict[str, float]
+    _cache: typing.OrderedDict[typing.Hashable, typing.Any]
+    _cache_size: typing.Optional[int]
 
     def __init__(
         self,
         tree: typing.Union[
-            anytree.NodeMixin,
-            dendropy.Tree,
-            ete3.Tree,
-            ete3.TreeNode,
-            nx.DiGraph,
-            pandas.DataFrame,
-            Bio.Phylo.BaseTree.Tree,
-            phytrack_Systematics,
-            treeswift.Tree
+            "anytree.NodeMixin",
+            "dendropy.Tree",
+            "ete3.Tree",
+            "ete3.TreeNode",
+            "nx.DiGraph",
+            "pandas.DataFrame",
+            "Bio.Phylo.BaseTree.Tree",
+            "phytrack_Systematics",
+            "treeswift.Tree"
         ],
         validate: typing.Literal["warn", "error", "ignore"] = "warn",
+        validate_mode: typing.Literal["schema", "sample", "full"] = "full",
+        validate_sample_frac: float = 0.01,
+        cache_size: typing.Optional[int] = None,
+        retain_source: typing.Literal["strong", "weak", "none"] = "strong",
     ) -> None:
         """Load phylogeny from any supported data structure.
 
@@ -83,41 +153,107 @@ class RosettaTree:
         - `networkx.Digraph`
         - `pandas.DataFrame` (alife standard format)
         - `phylotrackpy.systematics.Systematics`
+
+        Alife standard dataframes are validated according to `validate`, with
+        thoroughness set by `validate_mode`: "schema" checks only columns
+        and dtypes, "sample" additionally checks a `validate_sample_frac`
+        fraction of rows, and "full" checks all rows. Seconds elapsed by each
+        validation stage are available afterwards as `validation_timings`.
+
+        Converted trees and serialized text are cached within the instance,
+        holding at most `cache_size` entries, least recently used first to be
+        evicted. Entries are counted regardless of their size in memory. If
+        None, cache is unbounded. See `clear_cache`.
+
+        Trees from other libraries are retained according to `retain_source`,
+        and returned as is when a tree of the same library is requested. If
+        "strong", conversion to alife standard format is deferred until some
+        other representation is needed, so the source tree should not be
+        modified in the meantime. If "weak", the source tree is converted
+        immediately and returned only while it is otherwise kept alive. If
+        "none", the source tree is converted immediately and not retained.
+        While retained, ete, biopython, and networkx source trees are
+        converted to dendropy, and dendropy source trees to treeswift,
+        directly rather than through alife standard format.
         """
+        assert cache_size is None or cache_size >= 0
+        assert retain_source in ("strong", "weak", "none")
+        self._validation_timings = {}
+        self._cache = collections.OrderedDict()
+        self._cache_size = cache_size
+        self._source, self._source_kind = None, None
         # convert any supported tree format to ALife format,
         # as this is our interal representation
-        if robust_isinstance(tree, anytree.node.NodeMixin):
+        if _is_backend_instance(tree, "anytree", "NodeMixin"):
             # is an AnyTree tree
-            self._tree = anytree_tree_to_alife_dataframe(tree)
-        elif robust_isinstance(tree, dendropy.Tree):
+            self._retain_source(
+                tree, "anytree",
+                _lazy_converter("anytree_tree_to_alife_dataframe"),
+                retain_source,
+            )
+        elif _is_backend_instance(tree, "dendropy", "Tree"):
             # is a Dendropy Tree
-            self._tree = dendropy_tree_to_alife_dataframe(tree)
-        elif robust_isinstance(tree, (ete3.Tree, ete3.TreeNode)):
+            self._retain_source(
+                tree, "dendropy",
+                _lazy_converter("dendropy_tree_to_alife_dataframe"),
+                retain_source,
+            )
+        elif _is_backend_instance(tree, "ete3", "TreeNode"):
             # is a ete Tree
-            self._tree = ete_tree_to_alife_dataframe(tree)
-        elif robust_isinstance(tree, Bio.Phylo.BaseTree.Tree):
+            self._retain_source(
+                tree, "ete", _lazy_converter("ete_tree_to_alife_dataframe"),
+                retain_source,
+            )
+        elif _is_backend_instance(tree, "Bio.Phylo.BaseTree", "Tree"):
             # is a biopython tree
-            self._tree = biopython_tree_to_alife_dataframe(
-                tree, {'name': 'taxon_label'}
+            self._retain_source(
+                tree,
+                "biopython",
+                _lazy_converter(
+                    "biopython_tree_to_alife_dataframe",
+                    exportattrs={'name': 'taxon_label'},
+                ),
+                retain_source,
             )
-        elif robust_isinstance(tree, nx.DiGraph):
+        elif _is_backend_instance(tree, "networkx", "DiGraph"):
             # is a networkx digraph
-            self._tree = networkx_digraph_to_alife_dataframe(tree)
-        elif robust_isinstance(tree, phytrack_Systematics):
-            # is a phylotrack Systematics object
-            self._tree = phylotrack_systematics_to_alife_dataframe(tree)
-        elif robust_isinstance(tree, treeswift.Tree):
+            self._retain_source(
+                tree, "networkx",
+                _lazy_converter("networkx_digraph_to_alife_dataframe"),
+                retain_source,
+            )
+        elif _is_backend_instance(
+            tree, "phylotrackpy.systematics", "Systematics",
+        ):
             # is a phylotrack Systematics object
-            self._tree = treeswift_tree_to_alife_dataframe(tree)
+            self._retain_source(
+                tree, "phylotrack",
+                _lazy_converter("phylotrack_systematics_to_alife_dataframe"),
+                retain_source,
+            )
+        elif _is_backend_instance(tree, "treeswift", "Tree"):
+            # is a treeswift tree
+            self._retain_source(
+                tree, "treeswift",
+                _lazy_converter("treeswift_tree_to_alife_dataframe"),
+                retain_source,
+            )
         elif (
-            robust_isinstance(tree, pandas.DataFrame)
+            _is_backend_instance(tree, "pandas", "DataFrame")
             and "id" in tree.columns
             # i.e., ancestor_id or ancestor_list
             and tree.columns.str.startswith("ancestor_").any()
         ):
+            from ._impl import alifestd_validate
+
             if validate == "ignore":
                 pass
-            elif not alifestd_validate(tree):
+            elif not alifestd_validate(
+                tree,
+                mode=validate_mode,
+                sample_frac=validate_sample_frac,
+                timings=self._validation_timings,
+            ):
                 if validate == "error":
                     raise ValueError(
                         "Tree does not comply with alife data standards.",
@@ -132,64 +268,223 @@ class RosettaTree:
                 f"Unsupported tree format tree={tree} of type {type(tree)}",
             )
 
+    def _retain_source(
+        self: "RosettaTree",
+        tree: typing.Any,
+        kind: str,
+        converter: typing.Callable[[typing.Any], "pandas.DataFrame"],
+        retain_source: typing.Literal["strong", "weak", "none"],
+    ) -> None:
+        """Hold on to source `tree` of backend `kind`, converting it to
+        alife standard format with `converter` now or on first use."""
+        self._source_kind = kind
+        if retain_source == "strong":
+            self._source = tree
+            self._source_converter = converter
+            return
+        elif retain_source == "weak":
+            try:
+                self._source = weakref.ref(tree)
+            except TypeError:  # type does not support weak references
+                pass
+        self._tree = converter(tree)
+
+    def _get_source(self: "RosettaTree", kind: str) -> typing.Any:
+        """Return retained source tree if it is of backend `kind` and still
+        exists, otherwise None."""
+        if self._source_kind != kind:
+            return None
+        elif isinstance(self._source, weakref.ref):
+            return self._source()
+        else:
+            return self._source
+
+    @functools.cached_property
+    def _tree(self: "RosettaTree") -> "pandas.DataFrame":
+        """Stored tree in alife standard format, converted from strongly
+        retained source tree on first use."""
+        return self._source_converter(self._source)
+
+    @functools.cached_property
+    def _compact_tree(
+        self: "RosettaTree",
+    ) -> typing.Optional["CompactTree"]:
+        """Array-backed topology of stored tree, set up on first use and
+        shared by all tree conversions.
+
+        Holds topology only, so the stored dataframe is kept alongside it as
+        the source of node attributes.
+
+        Not available if any organism has multiple ancestors or if ancestor
+        lists are malformed, in which case errors surface on conversion.
+        """
+        from ._impl import CompactTree
+
+        try:
+            return CompactTree.from_alife_dataframe(self._tree)
+        except (AssertionError, ValueError):
+            return None
+
+    def _get_compact_tree(self: "RosettaTree") -> "CompactTree":
+        """Return array-backed topology of stored tree, raising ValueError if
+        stored tree is not representable as a tree."""
+        from ._impl import CompactTree
+
+        return opyt.or_else(
+            self._compact_tree,
+            lambda: CompactTree.from_alife_dataframe(self._tree),
+        )
+
+    def _is_caching(self: "RosettaTree") -> bool:
+        """Is caching of conversions enabled?"""
+        return self._cache_size is None or self._cache_size > 0
+
+    def _get_cached(
+        self: "RosettaTree",
+        key: typing.Hashable,
+        make: typing.Callable[[], typing.Any],
+    ) -> typing.Any:
+        """Return value cached at `key`, otherwise calling `make` and caching
+        its result subject to cache budget."""
+        cache = self._cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        res = make()
+        if self._is_caching():
+            cache[key] = res
+            if self._cache_size is not None and len(cache) > self._cache_size:
+                cache.popitem(last=False)  # evict least recently used
+        return res
+
+    def _is_empty(self: "RosettaTree") -> bool:
+        """Does the stored tree have no nodes?
+
+        Answered from the retained source tree, if available, so that
+        deferred conversion to alife standard format is not forced.
+        """
+        source = self._get_source(self._source_kind)
+        if source is None or "_tree" in vars(self):
+            return len(self._get_compact_tree()) == 0
+        elif self._source_kind == "networkx":
+            return len(source.nodes) == 0
+        elif self._source_kind == "phylotrack":
+            return source.get_num_taxa() == 0
+        else:
+            return False  # trees of other libraries always have a root
+
+    def clear_cache(self: "RosettaTree") -> None:
+        """Release all cached tree conversions and serializations."""
+        self._cache.clear()
+
     @property
-    @lru_cache(maxsize=None)
+    def validation_timings(self: "RosettaTree") -> typing.Dict[str, float]:
+        """Seconds elapsed by each stage of input validation, if any."""
+        return dict(self._validation_timings)
+
+    @property
+    @_passthrough("biopython")
+    @_cached
     def as_biopython(
         self: "RosettaTree",
-    ) -> typing.Optional[Bio.Phylo.BaseTree.Tree]:
+    ) -> typing.Optional["Bio.Phylo.BaseTree.Tree"]:
         """Return stored tree as a BioPython tree."""
-        return alife_dataframe_to_biopython_tree(
-            self._tree, setup_branch_lengths=True
+        from .alife_dataframe_to_biopython_trees \
+            import _alife_dataframe_to_biopython_trees
+
+        return ip.poursingleton(
+            _alife_dataframe_to_biopython_trees(
+                self._tree, self._get_compact_tree(), setup_branch_lengths=True
+            ),
         )
 
     @property
-    @lru_cache(maxsize=None)
-    def as_dendropy(self: "RosettaTree") -> typing.Optional[dendropy.Tree]:
+    @_passthrough("dendropy")
+    @_cached
+    @_direct(
+        biopython=_lazy_converter("biopython_tree_to_dendropy_tree"),
+        ete=_lazy_converter("ete_tree_to_dendropy_tree"),
+        networkx=_lazy_converter("networkx_digraph_to_dendropy_tree"),
+    )
+    def as_dendropy(self: "RosettaTree") -> typing.Optional["dendropy.Tree"]:
         """Return stored tree as a DendroPy tree."""
-        return alife_dataframe_to_dendropy_tree(
-            self._tree, setup_edge_lengths=True
+        from .alife_dataframe_to_dendropy_trees \
+            import _alife_dataframe_to_dendropy_trees
+
+        return ip.poursingleton(
+            _alife_dataframe_to_dendropy_trees(
+                self._tree, self._get_compact_tree(), setup_edge_lengths=True
+            ),
         )
 
     @property
-    @lru_cache(maxsize=None)
-    def as_ete(self: "RosettaTree") -> typing.Optional[ete3.Tree]:
+    @_passthrough("ete")
+    @_cached
+    def as_ete(self: "RosettaTree") -> typing.Optional["ete3.Tree"]:
         """Return stored tree as an ete tree."""
-        return alife_dataframe_to_ete_tree(
-            self._tree, setup_dists=True
+        from .alife_dataframe_to_ete_trees import _alife_dataframe_to_ete_trees
+
+        return ip.poursingleton(
+            _alife_dataframe_to_ete_trees(
+                self._tree, self._get_compact_tree(), setup_dists=True
+            ),
         )
 
     @property
-    @lru_cache(maxsize=None)
-    def as_networkx(self: "RosettaTree") -> nx.DiGraph:
+    @_passthrough("networkx")
+    @_cached
+    def as_networkx(self: "RosettaTree") -> "nx.DiGraph":
         """Return stored tree as a NetworkX DiGraph tree."""
-        return alife_dataframe_to_networkx_digraph(
-            self._tree, setup_edge_lengths=True
+        from ._impl import CompactTree
+        from .alife_dataframe_to_dict_of_lists \
+            import alife_dataframe_to_dict_of_lists
+        from .alife_dataframe_to_networkx_digraph \
+            import _alife_dataframe_to_networkx_digraph
+
+        return _alife_dataframe_to_networkx_digraph(
+            self._tree,
+            opyt.apply_if_or_else(
+                self._compact_tree,
+                CompactTree.to_dict_of_lists,
+                lambda: alife_dataframe_to_dict_of_lists(self._tree),
+            ),
+            setup_edge_lengths=True,
         )
 
     @property
-    @lru_cache(maxsize=None)
-    def as_phylotrack(self: "RosettaTree") -> phytrack_Systematics:
+    @_passthrough("phylotrack")
+    @_cached
+    def as_phylotrack(self: "RosettaTree") -> "phytrack_Systematics":
         """Return stored tree as a phylotrack Systematics object."""
+        from .alife_dataframe_to_phylotrack_systematics \
+            import alife_dataframe_to_phylotrack_systematics
+
         return alife_dataframe_to_phylotrack_systematics(self._tree)
 
     @property
-    @lru_cache(maxsize=None)
-    def as_treeswift(self: "RosettaTree") -> phytrack_Systematics:
+    @_passthrough("treeswift")
+    @_cached
+    @_direct(dendropy=_lazy_converter("dendropy_tree_to_treeswift_tree"))
+    def as_treeswift(self: "RosettaTree") -> "treeswift.Tree":
         """Return stored tree as a treeswift object."""
-        return alife_dataframe_to_treeswift_tree(
-            self._tree, setup_edge_lengths=True
+        from .alife_dataframe_to_treeswift_trees \
+            import _alife_dataframe_to_treeswift_trees
+
+        return ip.poursingleton(
+            _alife_dataframe_to_treeswift_trees(
+                self._tree, self._get_compact_tree(), setup_edge_lengths=True
+            ),
         )
 
     @property
     @deprecated(version="0.15.0", reason="Use to_newick instead.")
-    @lru_cache(maxsize=None)
     def as_newick(self: "RosettaTree") -> str:
         """Return stored tree as a Newick string."""
         return self.to_newick()
 
     @property
-    @lru_cache(maxsize=None)
-    def as_alife(self: "RosettaTree") -> pandas.DataFrame:
+    def as_alife(self: "RosettaTree") -> "pandas.DataFrame":
         """Return stored tree as a dataframe in alife standard format."""
         return self._tree
 
@@ -202,27 +497,97 @@ class RosettaTree:
         ],
         file: typing.Union[None, str, pathlib.Path, typing.IO] = None,
     ) -> typing.Optional[str]:
-        """Serialize the stored tree to `schema` format."""
-        if len(self._tree) == 0:
+        """Serialize the stored tree to `schema` format.
+
+        Returned text is cached within the instance alongside tree
+        conversions, and reused by repeat serializations to the same schema.
+        Output to `file` is streamed without holding serialized text, unless
+        cached text is already available, and is not itself cached.
+        """
+        if self._is_empty():
             if file is None:
                 return None
             else:
                 raise ValueError(
                     f"Schema {schema} cannot represent an empty tree.",
                 )
+        # output depends only on schema, as no other options are taken
+        key = ("to_schema", schema)
         try:
             if file is None:
-                return self.as_dendropy.as_string(schema=schema)
-            elif isinstance(file, (str, pathlib.Path)):
-                self.as_dendropy.write_to_path(dest=file, schema=schema)
+                return self._get_cached(
+                    key, lambda: self._serialize_schema(schema),
+                )
+            elif key not in self._cache:
+                self._write_schema(schema, file)
+                return None
+
+            self._cache.move_to_end(key)
+            text = self._cache[key]
+            if isinstance(file, (str, pathlib.Path)):
+                with open(file, "w") as sink:
+                    sink.write(text)
             else:
-                self.as_dendropy.write_to_stream(dest=file, schema=schema)
+                file.write(text)
         except Exception as e:
             raise ValueError(
                 f"Exception '{e}' ocurred. If provided, argument file={file} "
                 "must be file path or stream handle.",
             )
 
+    def _serialize_schema(
+        self: "RosettaTree",
+        schema: typing_extensions.Literal["newick", "nexus", "nexml"],
+    ) -> str:
+        """Serialize the stored tree to `schema` format text."""
+        if schema == "newick":
+            return self._to_newick(None)
+        else:
+            return self.as_dendropy.as_string(schema=schema)
+
+    def _write_schema(
+        self: "RosettaTree",
+        schema: typing_extensions.Literal["newick", "nexus", "nexml"],
+        file: typing.Union[str, pathlib.Path, typing.IO],
+    ) -> None:
+        """Stream the stored tree to `file` in `schema` format."""
+        if schema == "newick":
+            self._to_newick(file)
+        elif isinstance(file, (str, pathlib.Path)):
+            self.as_dendropy.write_to_path(dest=file, schema=schema)
+        else:
+            self.as_dendropy.write_to_stream(dest=file, schema=schema)
+
+    def _to_newick(
+        self: "RosettaTree",
+        file: typing.Union[None, str, pathlib.Path, typing.IO],
+    ) -> typing.Optional[str]:
+        """Serialize the stored tree to Newick format directly from the
+        stored dataframe, without constructing a dendropy tree."""
+        from .alife_dataframe_to_newick import _alife_dataframe_to_newick
+
+        compact_tree = self._get_compact_tree()
+        if len(compact_tree.roots) != 1:
+            raise ValueError(
+                "Newick serialization requires exactly one root, "
+                f"but tree has {len(compact_tree.roots)}.",
+            )
+        write = functools.partial(
+            _alife_dataframe_to_newick,
+            self._tree,
+            compact_tree,
+            setup_edge_lengths=True,
+        )
+        if file is None:
+            sink = io.StringIO()
+            write(sink)
+            return sink.getvalue()
+        elif isinstance(file, (str, pathlib.Path)):
+            with open(file, "w") as sink:
+                write(sink)
+        else:
+            write(file)
+
     def to_newick(
         self: "RosettaTree",
         file: typing.Union[None, str, pathlib.Path, typing.IO] = None,
@@ -244,17 +609,12 @@ class RosettaTree:
         """Convert the stored tree to Nexml format."""
         return self.to_schema(schema="nexml", file=file)
 
-    @classmethod
-    def from_schema(
-        self: "RosettaTree",
-        schema: typing_extensions.Literal[
-            "newick",
-            "nexus",
-            "nexml",
-        ],
+    @staticmethod
+    def _resolve_source(
         source: typing.Union[None, str, pathlib.Path, yarl.URL, typing.IO],
-    ) -> "RosettaTree":
-        """Serialize the stored tree to `schema` format."""
+    ) -> typing.Dict[str, typing.Any]:
+        """Identify `source` as a path, url, data string, or file, returned
+        as keyword argument to `dendropy.Tree.get`."""
 
         def safe_is_file() -> bool:
             with contextlib.suppress(Exception):
@@ -262,27 +622,120 @@ class RosettaTree:
             return False
 
         if isinstance(source, pathlib.Path):
-            tree = dendropy.Tree.get(path=str(source), schema=schema)
+            return {"path": str(source)}
         elif isinstance(source, yarl.URL):
-            tree = dendropy.Tree.get(url=str(source), schema=schema)
+            return {"url": str(source)}
         elif isinstance(source, str) and safe_is_file():
             warnings.warn(
                 f"String source={source} is ambiguous, interpreting as path. "
                 "Pass argument as pathlib.Path object to suppress warning."
             )
-            tree = dendropy.Tree.get(path=source, schema=schema)
+            return {"path": source}
         elif isinstance(source, str) and validators.url(source):
             warnings.warn(
                 f"String source={source} is ambiguous, interpreting as url. "
                 "Pass argument as yarl.URL object to suppress warning."
             )
-            tree = dendropy.Tree.get(url=source, schema=schema)
+            return {"url": source}
         elif isinstance(source, str):
-            tree = dendropy.Tree.get(data=source, schema=schema)
+            return {"data": source}
         else:
-            tree = dendropy.Tree.get(file=source, schema=schema)
+            return {"file": source}
 
-        return RosettaTree(tree)
+    @staticmethod
+    @contextlib.contextmanager
+    def _open_newick_source(
+        source_kwargs: typing.Dict[str, typing.Any],
+    ) -> typing.Iterator[typing.Union[typing.IO, mmap.mmap]]:
+        """Open resolved `source_kwargs` for Newick parsing, memory-mapping
+        file paths so that large files are scanned in place."""
+        with _open_text_source(**source_kwargs) as stream:
+            if "path" in source_kwargs:
+                with _mmap_file(stream) as mapped:
+                    yield opyt.or_value(mapped, stream)
+            else:
+                yield stream
+
+    @classmethod
+    def from_schema(
+        self: "RosettaTree",
+        schema: typing_extensions.Literal[
+            "newick",
+            "nexus",
+            "nexml",
+        ],
+        source: typing.Union[None, str, pathlib.Path, yarl.URL, typing.IO],
+    ) -> "RosettaTree":
+        """Serialize the stored tree to `schema` format."""
+        source_kwargs = RosettaTree._resolve_source(source)
+        if schema == "newick":
+            from .newick_to_alife_dataframe import newick_to_alife_dataframe
+
+            # parse directly to alife standard format, skipping dendropy
+            with RosettaTree._open_newick_source(source_kwargs) as newick:
+                return RosettaTree(
+                    newick_to_alife_dataframe(newick), validate="ignore",
+                )
+        else:
+            import dendropy
+
+            return RosettaTree(
+                dendropy.Tree.get(**source_kwargs, schema=schema),
+            )
+
+    @classmethod
+    def iter_from_schema(
+        cls: typing.Type,
+        schema: typing_extensions.Literal[
+            "newick",
+            "nexus",
+            "nexml",
+        ],
+        source: typing.Union[None, str, pathlib.Path, yarl.URL, typing.IO],
+        *,
+        as_alife: bool = False,
+        max_workers: typing.Optional[int] = 1,
+    ) -> typing.Iterator[typing.Union["RosettaTree", "pandas.DataFrame"]]:
+        """Open each tree in `schema` format data, one at a time.
+
+        Trees are read lazily as iteration proceeds, so memory use is
+        bounded by the largest tree rather than the number of trees.
+
+        Parameters
+        ----------
+        schema:
+            Format of source data.
+        source:
+            Path, url, data string, or text stream to read.
+        as_alife: bool, optional
+            Should we yield dataframes in alife standard format instead of
+            RosettaTree objects?
+        max_workers: int, optional
+            Number of worker processes to parse Newick data with, yielding
+            trees in order. If None, one worker is used per processor. Other
+            schemas are parsed in the calling process.
+        """
+        source_kwargs = cls._resolve_source(source)
+        if schema == "newick":
+            from .newick_to_alife_dataframes import newick_to_alife_dataframes
+
+            with cls._open_newick_source(source_kwargs) as newick:
+                for df in newick_to_alife_dataframes(
+                    newick, max_workers=max_workers,
+                ):
+                    yield df if as_alife else cls(df, validate="ignore")
+        else:
+            import dendropy
+
+            from .dendropy_tree_to_alife_dataframe \
+                import dendropy_tree_to_alife_dataframe
+
+            with _open_text_source(**source_kwargs) as stream:
+                for tree in dendropy.Tree.yield_from_files(
+                    [stream], schema=schema,
+                ):
+                    df = dendropy_tree_to_alife_dataframe(tree)
+                    yield df if as_alife else cls(df, validate="ignore")
 
     @classmethod
     def from_newick(
@@ -307,3 +760,43 @@ class RosettaTree:
     ) -> "RosettaTree":
         """Open data in Nexml format."""
         return cls.from_schema(schema="nexml", source=source)
+
+    @classmethod
+    def iter_from_newick(
+        cls: typing.Type,
+        source: typing.Union[None, str, pathlib.Path, yarl.URL, typing.IO],
+        *,
+        as_alife: bool = False,
+        max_workers: typing.Optional[int] = 1,
+    ) -> typing.Iterator[typing.Union["RosettaTree", "pandas.DataFrame"]]:
+        """Open each tree in data in Newick format, one at a time."""
+        return cls.iter_from_schema(
+            schema="newick",
+            source=source,
+            as_alife=as_alife,
+            max_workers=max_workers,
+        )
+
+    @classmethod
+    def iter_from_nexus(
+        cls: typing.Type,
+        source: typing.Union[None, str, pathlib.Path, yarl.URL, typing.IO],
+        *,
+        as_alife: bool = False,
+    ) -> typing.Iterator[typing.Union["RosettaTree", "pandas.DataFrame"]]:
+        """Open each tree in data in Nexus format, one at a time."""
+        return cls.iter_from_schema(
+            schema="nexus", source=source, as_alife=as_alife,
+        )
+
+    @classmethod
+    def iter_from_nexml(
+        cls: typing.Type,
+        source: typing.Union[None, str, pathlib.Path, yarl.URL, typing.IO],
+        *,
+        as_alife: bool = False,
+    ) -> typing.Iterator[typing.Union["RosettaTree", "pandas.DataFrame"]]:
+        """Open each tree in data in Nexml format, one at a time."""
+        return cls.iter_from_schema(
+            schema="nexml", source=source, as_alife=as_alife,
+        )
@@ -0,0 +1,137 @@
+import typing
+
+import numpy as np
+import pandas as pd
+
+from .alifestd_parse_ancestors import alifestd_parse_ancestors
+
+
+class CompactTree:
+    """Array-backed topology of an asexual alife standard phylogeny, cached
+    alongside its source dataframe so conversions skip re-parsing ancestry.
+
+    Nodes are referred to by their row index in the source dataframe. All
+    members are contiguous NumPy arrays:
+        * `ids`: organism id of each row,
+        * `ancestor_ids`: organism id of each row's parent, or own id if none,
+        * `parent_index`: row index of each row's parent, or -1 if none,
+        * `roots`: row indices of organisms with no ancestor,
+        * `child_offsets` and `children`: compressed sparse row (CSR) child
+          lists, with children of row `i` at
+          `children[child_offsets[i]:child_offsets[i + 1]]` in row order.
+
+    Rows whose ancestor id is missing from the phylogeny have no parent and
+    are not roots.
+
+    Only topology is held. Node attributes, like origin times and labels,
+    are read from the source dataframe, which must be kept: it is returned
+    as is in alife standard format, may carry arbitrary extra columns
+    requested through `setattrs`, and fixes attribute dtypes, e.g., integer
+    origin times giving integer edge lengths.
+    """
+
+    ids: np.ndarray
+    ancestor_ids: np.ndarray
+    parent_index: np.ndarray
+    roots: np.ndarray
+    child_offsets: np.ndarray
+    children: np.ndarray
+
+    def __init__(
+        self: "CompactTree",
+        ids: np.ndarray,
+        ancestor_ids: np.ndarray,
+        parent_index: typing.Optional[np.ndarray] = None,
+    ) -> None:
+        """Set up topology from per-row `ids` and `ancestor_ids`, with roots
+        listed as their own ancestor.
+
+        If already known, rows' `parent_index` may be provided to skip
+        looking up parent rows by id.
+        """
+        num_nodes = len(ids)
+        index_dtype = np.int32 if num_nodes < 2**31 else np.int64
+
+        self.ids = ids
+        self.ancestor_ids = ancestor_ids
+
+        if parent_index is None:
+            # look up parent rows by id
+            sorter = np.argsort(ids, kind="stable")
+            positions = np.minimum(
+                np.searchsorted(ids, ancestor_ids, sorter=sorter),
+                max(num_nodes - 1, 0),
+            )
+            candidates = sorter[positions]
+            has_ancestor = ancestor_ids != ids
+            has_parent = has_ancestor & (ids[candidates] == ancestor_ids)
+            parent_index = np.where(has_parent, candidates, -1)
+        else:
+            has_parent = has_ancestor = parent_index >= 0
+        self.parent_index = parent_index.astype(index_dtype)
+        self.roots = np.flatnonzero(~has_ancestor).astype(index_dtype)
+
+        # group child rows by parent row, preserving row order
+        child_rows = np.flatnonzero(has_parent)
+        child_parents = self.parent_index[child_rows]
+        self.children = child_rows[
+            np.argsort(child_parents, kind="stable")
+        ].astype(index_dtype)
+        self.child_offsets = np.zeros(num_nodes + 1, dtype=index_dtype)
+        np.cumsum(
+            np.bincount(child_parents, minlength=num_nodes),
+            out=self.child_offsets[1:],
+        )
+
+    @classmethod
+    def from_alife_dataframe(
+        cls: typing.Type,
+        phylogeny_df: pd.DataFrame,
+    ) -> "CompactTree":
+        """Extract topology from an asexual alife standard dataframe.
+
+        Raises ValueError if any organism has more than one ancestor. Input
+        dataframe is not mutated by this operation.
+        """
+        ancestor_offsets, ancestor_ids = alifestd_parse_ancestors(phylogeny_df)
+        num_ancestors = np.diff(ancestor_offsets)
+        if (num_ancestors > 1).any():
+            raise ValueError(
+                "Phylogeny with multiple ancestors per organism "
+                "cannot be represented as a tree.",
+            )
+
+        ids = phylogeny_df["id"].to_numpy(dtype=np.int64)
+        own_ancestor_ids = ids.copy()
+        own_ancestor_ids[num_ancestors.astype(bool)] = ancestor_ids
+        return cls(ids, own_ancestor_ids)
+
+    @classmethod
+    def from_parent_indices(
+        cls: typing.Type,
+        ids: np.ndarray,
+        parent_indices: np.ndarray,
+    ) -> "CompactTree":
+        """Set up topology from per-node `ids` and `parent_indices`, giving
+        each node's parent position or -1 if it is a root.
+
+        Ids are only carried along, so they need not be unique or sorted.
+        """
+        ancestor_ids = ids.copy()
+        has_parent = parent_indices >= 0
+        ancestor_ids[has_parent] = ids[parent_indices[has_parent]]
+        return cls(ids, ancestor_ids, parent_index=parent_indices)
+
+    def __len__(self: "CompactTree") -> int:
+        return len(self.ids)
+
+    def to_dict_of_lists(
+        self: "CompactTree",
+    ) -> typing.Dict[int, typing.List[int]]:
+        """Map each organism id to a list of its ancestors' ids."""
+        return {
+            id: [ancestor_id] if id != ancestor_id else []
+            for id, ancestor_id in zip(
+                self.ids.tolist(), self.ancestor_ids.tolist()
+            )
+        }
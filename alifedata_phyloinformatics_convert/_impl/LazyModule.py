@@ -0,0 +1,43 @@
+import importlib
+import types
+import typing
+
+
+class LazyModule(types.ModuleType):
+    """Package module whose attributes are imported from submodules on
+    first access.
+
+    Packages opt in by defining `_lazy_attrs`, which maps each attribute
+    name to the relative name of the submodule defining it, then assigning
+    `LazyModule` as the `__class__` of their module object.
+    """
+
+    _lazy_attrs: typing.Dict[str, str]
+
+    def __getattr__(self: "LazyModule", name: str) -> typing.Any:
+        try:
+            submodule = self._lazy_attrs[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {self.__name__!r} has no attribute {name!r}",
+            ) from None
+
+        value = getattr(
+            importlib.import_module(f".{submodule}", self.__name__), name,
+        )
+        super().__setattr__(name, value)
+        return value
+
+    def __setattr__(self: "LazyModule", name: str, value: typing.Any) -> None:
+        # importing a submodule binds it onto its package, which would
+        # otherwise shadow the like-named attribute it defines
+        if (
+            self._lazy_attrs.get(name) == name
+            and isinstance(value, types.ModuleType)
+            and value.__name__ == f"{self.__name__}.{name}"
+        ):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+    def __dir__(self: "LazyModule") -> typing.List[str]:
+        return sorted({*super().__dir__(), *self._lazy_attrs})
@@ -1,13 +1,43 @@
-from .alifestd_is_asexual import alifestd_is_asexual
-from .alifestd_is_sexual import alifestd_is_sexual
-from .alifestd_make_ancestor_id_col import alifestd_make_ancestor_id_col
-from .alifestd_make_ancestor_list_col import alifestd_make_ancestor_list_col
-from .alifestd_validate import alifestd_validate
-from .all_unique import all_unique
-from .ete3 import ete3
-from .is_subset import is_subset
-from .keydefaultdict import keydefaultdict
-from .parse_ancestor_list import parse_ancestor_list
-from .phytrack_Systematcs import phytrack_Systematics
-from .rgetattr import rgetattr
-from .robust_isinstance import robust_isinstance
+import sys
+
+from .LazyModule import LazyModule
+
+# maps each attribute to the submodule defining it, imported on first access
+_lazy_attrs = {
+    "alifestd_is_asexual": "alifestd_is_asexual",
+    "alifestd_is_sexual": "alifestd_is_sexual",
+    "alifestd_make_ancestor_id_col": "alifestd_make_ancestor_id_col",
+    "alifestd_make_ancestor_list_col": "alifestd_make_ancestor_list_col",
+    "alifestd_has_ancestor_id_col": "alifestd_parse_ancestors",
+    "alifestd_parse_ancestors": "alifestd_parse_ancestors",
+    "alifestd_validate": "alifestd_validate",
+    "all_unique": "all_unique",
+    "calc_edge_lengths": "calc_edge_lengths",
+    "CompactTree": "CompactTree",
+    "complete_edge_lengths": "complete_edge_lengths",
+    "concat_alife_dataframes": "concat_alife_dataframes",
+    "ete3": "ete3",
+    "format_ancestor_lists": "format_ancestor_lists",
+    "get_column_values": "get_column_values",
+    "get_setattrs_columns": "get_setattrs_columns",
+    "is_subset": "is_subset",
+    "iter_newick_statements": "iter_newick_statements",
+    "iter_newick_buffer_tokens": "iter_newick_tokens",
+    "iter_newick_tokens": "iter_newick_tokens",
+    "keydefaultdict": "keydefaultdict",
+    "make_alife_dataframe": "make_alife_dataframe",
+    "make_dendropy_tree": "make_dendropy_tree",
+    "mmap_file": "mmap_file",
+    "open_compressed": "open_compressed",
+    "open_text_source": "open_text_source",
+    "parse_ancestor_lists": "parse_ancestor_lists",
+    "phytrack_Systematics": "phytrack_Systematcs",
+    "ram_temporary_file": "ram_temporary_file",
+    "read_alife_csv_chunked": "read_alife_csv_chunked",
+    "read_alife_dataframe": "read_alife_dataframe",
+    "rgetattr": "rgetattr",
+    "robust_isinstance": "robust_isinstance",
+    "setup_origin_times": "setup_origin_times",
+}
+
+sys.modules[__name__].__class__ = LazyModule
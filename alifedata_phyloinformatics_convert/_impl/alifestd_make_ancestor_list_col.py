@@ -6,6 +6,8 @@
 
 import pandas as pd
 
+from .format_ancestor_lists import format_ancestor_lists
+
 
 def alifestd_make_ancestor_list_col(
     ids: pd.Series, ancestor_ids: pd.Series
@@ -13,7 +15,9 @@ def alifestd_make_ancestor_list_col(
     """Translate a column of integer ancestor id values into alife standard
     `ancestor_list` representation."""
 
-    res = ancestor_ids.map("[{}]".format)
-    res[ids == ancestor_ids] = "[none]"
-
-    return res
+    return pd.Series(
+        format_ancestor_lists(ids.to_numpy(), ancestor_ids.to_numpy()),
+        index=ancestor_ids.index,
+        name=ancestor_ids.name,
+        dtype=object,
+    )
@@ -0,0 +1,70 @@
+import typing
+
+import numpy as np
+import pandas as pd
+
+from .is_subset import is_subset
+from .parse_ancestor_lists import parse_ancestor_lists
+
+
+# ancestor_list spellings of a root
+_empty_ancestor_lists = ("[none]", "[]")
+
+
+def alifestd_has_ancestor_id_col(phylogeny_df: pd.DataFrame) -> bool:
+    """Does the phylogeny carry an integer `ancestor_id` column usable in
+    place of `ancestor_list`?
+
+    Roots must be listed as their own ancestor, and all other ancestor ids
+    must be present among organism ids. If `ancestor_list` is also present,
+    it must list no ancestors for those roots. Other root markers, like -1,
+    leave `ancestor_list` to be parsed instead.
+    """
+    if "ancestor_id" not in phylogeny_df or not (
+        pd.api.types.is_integer_dtype(phylogeny_df["ancestor_id"])
+    ):
+        return False
+    elif phylogeny_df["ancestor_id"].hasnans:  # e.g., nullable None roots
+        return False
+    elif "ancestor_list" not in phylogeny_df:
+        return True
+
+    ids = phylogeny_df["id"].to_numpy()
+    ancestor_ids = phylogeny_df["ancestor_id"].to_numpy(dtype=np.int64)
+    is_root = ancestor_ids == ids
+    if not is_subset(ancestor_ids[~is_root], ids):
+        return False
+
+    # only root rows are compared, to keep check cheaper than parsing
+    root_ancestor_lists = phylogeny_df["ancestor_list"].to_numpy()[is_root]
+    return all(
+        str(ancestor_list).strip().lower() in _empty_ancestor_lists
+        for ancestor_list in root_ancestor_lists
+    )
+
+
+def alifestd_parse_ancestors(
+    phylogeny_df: pd.DataFrame,
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """Extract each organism's immediate ancestors as a compressed sparse row
+    (CSR) pair of `offsets` and flattened `ancestor_ids` arrays.
+
+    If a usable integer `ancestor_id` column is present, parent links are
+    taken straight from it, with organisms listed as their own ancestor
+    treated as roots. Otherwise, the `ancestor_list` column is parsed. Input
+    dataframe is not mutated by this operation.
+
+    See Also
+    --------
+    parse_ancestor_lists
+    """
+    if not alifestd_has_ancestor_id_col(phylogeny_df):
+        return parse_ancestor_lists(phylogeny_df["ancestor_list"])
+
+    ids = phylogeny_df["id"].to_numpy()
+    ancestor_ids = phylogeny_df["ancestor_id"].to_numpy()
+    has_ancestor = ancestor_ids != ids
+
+    offsets = np.zeros(len(phylogeny_df) + 1, dtype=np.int64)
+    np.cumsum(has_ancestor, out=offsets[1:])
+    return offsets, ancestor_ids[has_ancestor].astype(np.int64, copy=False)
@@ -1,9 +1,12 @@
 # This file has been copied from hstrat (https://github.com/mmore500/hstrat/blob/b3eddc813a29485123777f415a973e9c7cf7cfd2/hstrat/_auxiliary_lib/_alifestd_validate.py).
 # Eventually, it should be migrated to a standalone library.
 
+import math
+import time
 import typing
 import warnings
 
+import numpy as np
 import pandas as pd
 
 from .alifestd_is_asexual import alifestd_is_asexual
@@ -11,18 +14,14 @@ from .alifestd_make_ancestor_id_col import alifestd_make_ancestor_id_col
 from .alifestd_make_ancestor_list_col import alifestd_make_ancestor_list_col
 from .all_unique import all_unique
 from .is_subset import is_subset
-
-
-def __alifestd_parse_ancestor_ids(ancestor_list_str: str) -> typing.List[int]:
-    """Parse ancestor ids from an `ancestor_list` field."""
-    if ancestor_list_str.lower() == "[none]":
-        return []
-    else:
-        return eval(ancestor_list_str)
+from .parse_ancestor_lists import parse_ancestor_lists
 
 
 def _validate_ancestors_asexual(
-    phylogeny_df: pd.DataFrame, mutate: bool, warn: typing.Callable
+    phylogeny_df: pd.DataFrame,
+    ids: np.ndarray,
+    mutate: bool,
+    warn: typing.Callable,
 ) -> bool:
     if "ancestor_id" not in phylogeny_df:
         if not mutate:
@@ -52,8 +51,7 @@ def _validate_ancestors_asexual(
             return False
 
     ancestor_ids_are_subset = is_subset(
-        phylogeny_df["ancestor_id"].to_numpy(),
-        phylogeny_df["id"].astype("int").to_numpy(),
+        phylogeny_df["ancestor_id"].to_numpy(), ids
     )
     if not ancestor_ids_are_subset:
         warn(
@@ -65,15 +63,20 @@ def _validate_ancestors_asexual(
 
 def _validate_ancestors_sexual(
     phylogeny_df: pd.DataFrame,
+    ids: np.ndarray,
     warn: typing.Callable,
 ) -> bool:
-    ids = set(phylogeny_df["id"])
-    ancestor_ids_are_subset = all(
-        ancestor_id in ids
-        for ancestor_list_str in phylogeny_df["ancestor_list"]
-        for ancestor_id in _alifestd_parse_ancestor_ids(ancestor_list_str)
-        if ancestor_id is not None
-    )
+    ancestor_lists = phylogeny_df["ancestor_list"]
+    # tolerate whitespace separated ancestor lists, e.g., "[1, 2]"
+    if ancestor_lists.str.contains(r"\s").any():
+        ancestor_lists = ancestor_lists.str.replace(r"\s", "", regex=True)
+    try:
+        __, ancestor_ids = parse_ancestor_lists(ancestor_lists)
+    except ValueError as e:
+        warn(f"alifestd_validate sexual: invalid ancestor_list syntax, {e}")
+        return False
+
+    ancestor_ids_are_subset = is_subset(ancestor_ids, ids)
     if not ancestor_ids_are_subset:
         warn(
             "alifestd_validate sexual: "
@@ -82,10 +85,23 @@ def _validate_ancestors_sexual(
     return ancestor_ids_are_subset
 
 
-def _alifestd_validate(
-    phylogeny_df: pd.DataFrame,
-    mutate: bool,
-    warn: typing.Callable,
+def _timed(
+    stage: str,
+    check: typing.Callable[[], bool],
+    timings: typing.Optional[typing.Dict[str, float]],
+) -> bool:
+    """Run validation `check`, recording its duration as `stage` in
+    `timings`, if provided."""
+    start = time.perf_counter()
+    try:
+        return check()
+    finally:
+        if timings is not None:
+            timings[stage] = time.perf_counter() - start
+
+
+def _validate_schema(
+    phylogeny_df: pd.DataFrame, warn: typing.Callable
 ) -> bool:
     has_mandatory_columns = (
         "id" in phylogeny_df and "ancestor_list" in phylogeny_df
@@ -94,30 +110,80 @@ def _alifestd_validate(
         warn("alifestd_validate: missing mandatory columns")
         return False
 
-    ids_valid = (
-        len(phylogeny_df) == 0
-        or pd.api.types.is_integer_dtype(phylogeny_df["id"])
-        and (phylogeny_df["id"] >= 0).all()
-        and all_unique(phylogeny_df["id"].to_numpy())
-    )
-    if not ids_valid:
+    if len(phylogeny_df) == 0:
+        return True
+
+    if not pd.api.types.is_integer_dtype(phylogeny_df["id"]):
         warn("alifestd_validate: invalid id detected")
         return False
 
+    if not pd.api.types.is_string_dtype(phylogeny_df["ancestor_list"]):
+        warn("alifestd_validate: invalid ancestor_list syntax detected")
+        return False
+
+    return True
+
+
+def _validate_ids(phylogeny_df: pd.DataFrame, warn: typing.Callable) -> bool:
+    ids = phylogeny_df["id"].to_numpy()
+    ids_valid = (ids >= 0).all() and all_unique(ids)
+    if not ids_valid:
+        warn("alifestd_validate: invalid id detected")
+    return ids_valid
+
+
+def _validate_ancestor_lists_syntax(
+    phylogeny_df: pd.DataFrame, warn: typing.Callable
+) -> bool:
     ancestor_lists_syntax_valid = (
-        len(phylogeny_df) == 0
-        or pd.api.types.is_string_dtype(phylogeny_df["ancestor_list"])
-        and phylogeny_df["ancestor_list"].str.startswith("[").all()
+        phylogeny_df["ancestor_list"].str.startswith("[").all()
         and phylogeny_df["ancestor_list"].str.endswith("]").all()
     )
     if not ancestor_lists_syntax_valid:
         warn("alifestd_validate: invalid ancestor_list syntax detected")
+    return ancestor_lists_syntax_valid
+
+
+def _alifestd_validate(
+    phylogeny_df: pd.DataFrame,
+    mutate: bool,
+    warn: typing.Callable,
+    mode: str,
+    sample_frac: float,
+    timings: typing.Optional[typing.Dict[str, float]],
+) -> bool:
+    assert mode in ("schema", "sample", "full"), mode
+    if not _timed(
+        "schema", lambda: _validate_schema(phylogeny_df, warn), timings
+    ):
         return False
+    if mode == "schema" or len(phylogeny_df) == 0:
+        return True
+
+    ids = phylogeny_df["id"].astype("int").to_numpy()
+    if mode == "sample":
+        assert 0 < sample_frac <= 1, sample_frac
+        # sampled rows are checked against all ids
+        phylogeny_df = phylogeny_df.sample(
+            n=math.ceil(sample_frac * len(phylogeny_df)),
+        )
 
     return (
-        _validate_ancestors_asexual(phylogeny_df, mutate, warn)
-        if alifestd_is_asexual(phylogeny_df)
-        else _validate_ancestors_sexual(phylogeny_df, warn)
+        _timed("ids", lambda: _validate_ids(phylogeny_df, warn), timings)
+        and _timed(
+            "ancestor_list_syntax",
+            lambda: _validate_ancestor_lists_syntax(phylogeny_df, warn),
+            timings,
+        )
+        and _timed(
+            "ancestors",
+            lambda: (
+                _validate_ancestors_asexual(phylogeny_df, ids, mutate, warn)
+                if alifestd_is_asexual(phylogeny_df)
+                else _validate_ancestors_sexual(phylogeny_df, ids, warn)
+            ),
+            timings,
+        )
     )
 
 
@@ -125,17 +191,33 @@ def alifestd_validate(
     phylogeny_df: pd.DataFrame,
     mutate: bool = False,
     diagnose: bool = True,
+    mode: typing.Literal["schema", "sample", "full"] = "full",
+    sample_frac: float = 0.01,
+    timings: typing.Optional[typing.Dict[str, float]] = None,
 ) -> bool:
     """Is the phylogeny compliant to alife data standards?
 
     Input dataframe is not mutated by this operation unless `mutate` set True.
     If `diagnose` is set, the failing validation subcheck will warn.
+
+    Validation `mode` may be
+        * "schema", to check only presence and dtypes of mandatory columns,
+        * "sample", to additionally check a random `sample_frac` fraction of
+          rows, with ancestor ids checked against all ids, or
+        * "full", to check all rows.
+    Sampled checks may miss violations, e.g., duplicate ids, and do not
+    mutate the input dataframe.
+
+    If `timings` is provided, seconds elapsed by each validation stage run
+    are recorded into it, keyed by stage name.
     """
 
     warn = warnings.warn if diagnose else lambda x: x
 
     try:
-        return _alifestd_validate(phylogeny_df, mutate, warn)
+        return _alifestd_validate(
+            phylogeny_df, mutate, warn, mode, sample_frac, timings
+        )
     except Exception as exception:
         warn(f"alifestd_validate: {exception=} occured")
         return False
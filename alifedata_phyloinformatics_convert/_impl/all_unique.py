@@ -2,16 +2,33 @@
 # <https://github.com/mmore500/hstrat/blob/47fe9048d6b327ca40f77424e3cf9392f7980689/hstrat/_auxiliary_lib/_all_unique.py>.
 # It is up to date as of commit
 # [1ce7a0e](https://github.com/mmore500/hstrat/commit/1ce7a0e).
+# It has since been modified to use vectorized NumPy operations.
 # Eventually, it should be migrated to a standalone library.
 import numpy as np
 
 
 def all_unique(array: np.array) -> bool:
     """Are all values in `array` unique?"""
-    seen_unique = set()
-    for idx, val in enumerate(array):
-        seen_unique.add(val)
-        if idx + 1 != len(seen_unique):
-            return False
+    array = np.asarray(array)
+    if array.dtype == object:
+        seen_unique = set()
+        for idx, val in enumerate(array):
+            seen_unique.add(val)
+            if idx + 1 != len(seen_unique):
+                return False
 
-    return True
+        return True
+
+    # fast path for strictly increasing values, e.g., sorted ids
+    if len(array) < 2 or (array[1:] > array[:-1]).all():
+        return True
+
+    # tally occurrences directly if integer values span a compact range
+    if np.issubdtype(array.dtype, np.integer):
+        min_value, max_value = int(array.min()), int(array.max())
+        if max_value - min_value < 4 * len(array):
+            offsets = (array - min_value).astype(np.intp, copy=False)
+            return np.bincount(offsets).max() <= 1
+
+    sorted_array = np.sort(array)
+    return not (sorted_array[1:] == sorted_array[:-1]).any()
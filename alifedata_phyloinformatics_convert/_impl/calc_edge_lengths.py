@@ -0,0 +1,71 @@
+import typing
+
+import numpy as np
+import pandas as pd
+
+from .CompactTree import CompactTree
+
+
+def calc_edge_lengths(
+    compact_tree: CompactTree,
+    origin_times: pd.Series,
+    where: typing.Optional[np.ndarray] = None,
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """Calculate edge lengths as the difference between each node's origin
+    time and its parent's origin time, in one vectorized pass.
+
+    Roots take their own origin time as edge length. Numeric dtype of
+    `origin_times` is preserved, so integer times yield integer lengths.
+
+    Parameters
+    ----------
+    compact_tree:
+        Topology to calculate edge lengths over.
+    origin_times:
+        Origin time of each node, in row order.
+    where: optional
+        Boolean mask of nodes to calculate edge lengths for. Defaults to all.
+
+    Returns
+    -------
+    edge_lengths : np.ndarray
+        Calculated edge length of each node, meaningful only where
+        `is_calculated`.
+    is_calculated : np.ndarray of bool
+        Mask of nodes within `where` that are roots or have a parent, and
+        whose own and parent origin times are known.
+    """
+    if not pd.api.types.is_numeric_dtype(origin_times):
+        origin_times = pd.to_numeric(origin_times)
+    origin_times = origin_times.to_numpy()
+
+    has_parent = compact_tree.parent_index >= 0
+    is_root = np.zeros(len(compact_tree), dtype=bool)
+    is_root[compact_tree.roots] = True
+
+    # parentless nodes gather their own origin time, as a placeholder
+    parent_origin_times = origin_times[
+        np.where(
+            has_parent,
+            compact_tree.parent_index,
+            np.arange(len(compact_tree)),
+        )
+    ]
+    edge_lengths = np.where(
+        has_parent, origin_times - parent_origin_times, origin_times
+    )
+    is_calculated = (
+        (has_parent | is_root)
+        & ~pd.isna(origin_times)
+        & ~pd.isna(parent_origin_times)
+    )
+    if where is not None:
+        is_calculated &= where
+
+    is_negative = is_calculated & has_parent & (edge_lengths < 0)
+    assert not is_negative.any(), (
+        "Child origin_time precedes parent origin_time for ids "
+        f"{compact_tree.ids[is_negative].tolist()}"
+    )
+
+    return edge_lengths, is_calculated
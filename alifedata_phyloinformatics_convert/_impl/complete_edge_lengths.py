@@ -0,0 +1,45 @@
+import typing
+
+from nanto import nantonone
+import numpy as np
+import pandas as pd
+
+from .calc_edge_lengths import calc_edge_lengths
+from .CompactTree import CompactTree
+
+
+def complete_edge_lengths(
+    ids: typing.Sequence[int],
+    parent_indices: typing.Sequence[int],
+    origin_times: typing.Sequence[typing.Optional[float]],
+    edge_lengths: typing.Sequence[typing.Optional[float]],
+) -> typing.List[typing.Optional[float]]:
+    """Fill in missing edge lengths from origin times with
+    `calc_edge_lengths`, for per-node values not held in a dataframe.
+
+    Nodes are referred to by position, with `parent_indices` giving each
+    node's parent position, or -1 for the root. Missing values are None or
+    NaN, and are returned as None. Values are typed as they would be in
+    alife standard dataframe columns. Edge lengths stay missing where the
+    node's own or its parent's origin time is missing.
+    """
+    # infer dtypes as alife dataframe columns do, so integral values given
+    # with missing values become floats
+    edge_lengths = [*map(nantonone, pd.Series(edge_lengths).tolist())]
+    compact_tree = CompactTree.from_parent_indices(
+        np.asarray(ids),
+        np.asarray(parent_indices, dtype=np.int64),
+    )
+    calculated_lengths, is_calculated = calc_edge_lengths(
+        compact_tree,
+        pd.Series(origin_times),
+        where=np.array([edge_length is None for edge_length in edge_lengths]),
+    )
+    return [
+        calculated_length if is_calculated_ else edge_length
+        for edge_length, calculated_length, is_calculated_ in zip(
+            edge_lengths,
+            calculated_lengths.tolist(),
+            is_calculated.tolist(),
+        )
+    ]
@@ -0,0 +1,59 @@
+import typing
+
+import numpy as np
+import pandas as pd
+
+from .alifestd_parse_ancestors import alifestd_parse_ancestors
+from .format_ancestor_lists import format_ancestor_lists
+
+
+def concat_alife_dataframes(
+    dfs: typing.Iterable[pd.DataFrame],
+    ancestor_id_only: bool = False,
+) -> pd.DataFrame:
+    """Combine asexual alife standard dataframes of separate phylogenies into
+    a single dataframe.
+
+    Ids within each dataframe are offset past the largest id of preceding
+    dataframes, so that they remain unique. A `tree_index` column records
+    each organism's source dataframe. Ancestry is emitted as `ancestor_list`,
+    or as integer `ancestor_id` if `ancestor_id_only` is set.
+    """
+    frames, offset = [], 0
+    for tree_index, df in enumerate(dfs):
+        ancestor_offsets, ancestor_ids = alifestd_parse_ancestors(df)
+        has_ancestor = np.diff(ancestor_offsets)
+        assert (has_ancestor <= 1).all(), "Organisms must be asexual."
+
+        ids = df["id"].to_numpy(dtype=np.int64)
+        own_ancestor_ids = ids.copy()
+        own_ancestor_ids[has_ancestor.astype(bool)] = ancestor_ids
+        frames.append(
+            df.drop(columns=["ancestor_list", "ancestor_id"], errors="ignore")
+            .assign(
+                id=ids + offset,
+                ancestor_id=own_ancestor_ids + offset,
+                tree_index=tree_index,
+            ),
+        )
+        offset += int(ids.max(initial=-1)) + 1
+
+    if not frames:
+        frames.append(
+            pd.DataFrame({"id": [], "ancestor_id": [], "tree_index": []}),
+        )
+    res = pd.concat(frames, ignore_index=True)
+
+    # move ancestry column after id, as in exporter output
+    ancestor_ids = res.pop("ancestor_id").astype(np.int64)
+    if ancestor_id_only:
+        res.insert(1, "ancestor_id", ancestor_ids)
+    else:
+        res.insert(
+            1,
+            "ancestor_list",
+            format_ancestor_lists(
+                res["id"], ancestor_ids, no_ancestor_token="None",
+            ),
+        )
+    return res.astype({"id": np.int64, "tree_index": np.int64})
@@ -0,0 +1,61 @@
+import typing
+
+import numpy as np
+
+
+def format_ancestor_lists(
+    ids: typing.Union[np.ndarray, typing.Sequence[int]],
+    ancestor_ids: typing.Union[np.ndarray, typing.Sequence[int]],
+    no_ancestor_token: str = "none",
+) -> typing.List[str]:
+    """Format integer ancestor ids as alife standard `ancestor_list` strings.
+
+    Organisms with no ancestor are indicated by listing their own id as
+    ancestor id, and are formatted as `[<no_ancestor_token>]`. Negative
+    ancestor ids are formatted with a leading minus sign. The whole column is
+    formatted at once, into a single byte buffer.
+    """
+    ids = np.asarray(ids, dtype=np.int64)
+    ancestor_ids = np.asarray(ancestor_ids, dtype=np.int64)
+    if len(ids) == 0:
+        return []
+
+    has_ancestor = ids != ancestor_ids
+    values = ancestor_ids[has_ancestor]
+    is_negative = values < 0
+    values = np.abs(values)
+
+    # count decimal digits of each ancestor id
+    num_digits = np.ones(len(values), dtype=np.int64)
+    threshold, max_value = 10, int(values.max(initial=0))
+    while threshold <= max_value:
+        num_digits += values >= threshold
+        threshold *= 10
+
+    # lay out rows as "[...]\n", then split buffer on newlines
+    token_lens = np.full(len(ids), len(no_ancestor_token), dtype=np.int64)
+    token_lens[has_ancestor] = num_digits + is_negative
+    row_lens = token_lens + 3
+    row_stops = np.cumsum(row_lens)
+    row_starts = row_stops - row_lens
+
+    buf = np.empty(row_stops[-1], dtype=np.uint8)
+    buf[row_starts] = ord("[")
+    buf[row_stops - 2] = ord("]")
+    buf[row_stops - 1] = ord("\n")
+    buf[row_starts[has_ancestor][is_negative] + 1] = ord("-")
+
+    # write digits, least significant first, dropping exhausted ids
+    positions = (row_stops - 3)[has_ancestor]
+    while len(values):
+        buf[positions] = ord("0") + values % 10
+        values = values // 10
+        remaining = values > 0
+        positions, values = positions[remaining] - 1, values[remaining]
+
+    buf[
+        row_starts[~has_ancestor, None]
+        + np.arange(1, len(no_ancestor_token) + 1)
+    ] = np.frombuffer(no_ancestor_token.encode("ascii"), dtype=np.uint8)
+
+    return buf.tobytes().decode("ascii").split("\n")[:-1]
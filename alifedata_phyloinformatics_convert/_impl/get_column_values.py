@@ -0,0 +1,16 @@
+import typing
+
+import pandas as pd
+
+
+def get_column_values(
+    df: pd.DataFrame,
+    column: str,
+    default: typing.Any = None,
+) -> typing.List:
+    """Extract `column` of `df` as a list of Python scalars, or a list filled
+    with `default` if `df` has no such column."""
+    if column in df:
+        return df[column].tolist()
+    else:
+        return [default] * len(df)
@@ -0,0 +1,36 @@
+from collections.abc import Mapping
+import typing
+
+import opytional as opyt
+import pandas as pd
+
+
+def get_setattrs_columns(
+    df: pd.DataFrame,
+    setattrs: typing.Optional[typing.Union[
+        typing.Iterable[str],
+        typing.Mapping[str, str],
+    ]],
+    reserved_attr_names: typing.Iterable[str],
+    probe_node: object,
+) -> typing.List[typing.Tuple[str, typing.List]]:
+    """Pair each requested attr name with its column values from `df`.
+
+    If a map is provided as `setattrs`, values at columns in keys will be
+    paired with the corresponding value as the attr name. Attr names must be
+    unique, not among `reserved_attr_names`, and not already present on
+    `probe_node`. Raises KeyError if a requested column is missing from
+    `df`.
+    """
+    res = [
+        (
+            setattrs[col_name] if isinstance(setattrs, Mapping) else col_name,
+            df[col_name].tolist(),
+        )
+        for col_name in opyt.or_value(setattrs, [])
+    ]
+    attr_names = [attr_name for attr_name, __ in res]
+    assert len(set(attr_names)) == len(attr_names)
+    assert not set(attr_names) & set(reserved_attr_names)
+    assert not any(hasattr(probe_node, attr_name) for attr_name in attr_names)
+    return res
@@ -2,15 +2,46 @@
 # <https://github.com/mmore500/hstrat/blob/47fe9048d6b327ca40f77424e3cf9392f7980689/hstrat/_auxiliary_lib/_is_subset.py>.
 # It is up to date as of commit
 # [1ce7a0e](https://github.com/mmore500/hstrat/commit/1ce7a0e).
+# It has since been modified to use vectorized NumPy operations.
 # Eventually, it should be migrated to a standalone library.
 import numpy as np
 
 
 def is_subset(subset: np.array, superset: np.array) -> bool:
     """Are all values in `subset` contained in `superset`?"""
-    superset_lookup = set(superset)
-    for val in subset:
-        if val not in superset_lookup:
-            return False
+    subset, superset = np.asarray(subset), np.asarray(superset)
+    if object in (subset.dtype, superset.dtype):
+        superset_lookup = set(superset)
+        for val in subset:
+            if val not in superset_lookup:
+                return False
 
-    return True
+        return True
+
+    if len(subset) == 0:
+        return True
+    elif len(superset) == 0:
+        return False
+
+    # early exit if any value falls outside superset range
+    min_value, max_value = superset.min(), superset.max()
+    if subset.min() < min_value or subset.max() > max_value:
+        return False
+
+    # look up membership directly if integer values span a compact range
+    if (
+        np.issubdtype(subset.dtype, np.integer)
+        and np.issubdtype(superset.dtype, np.integer)
+        and int(max_value) - int(min_value) < 4 * len(superset)
+    ):
+        is_member = np.zeros(int(max_value) - int(min_value) + 1, dtype=bool)
+        is_member[superset - min_value] = True
+        return is_member[subset - min_value].all()
+
+    # sorted queries keep binary search cache friendly
+    sorted_superset, sorted_subset = np.sort(superset), np.sort(subset)
+    positions = np.minimum(
+        np.searchsorted(sorted_superset, sorted_subset),
+        len(sorted_superset) - 1,
+    )
+    return (sorted_superset[positions] == sorted_subset).all()
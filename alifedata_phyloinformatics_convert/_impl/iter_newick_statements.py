@@ -0,0 +1,63 @@
+import re
+import typing
+
+
+_significant_re = re.compile(r"[';\[\]]")
+
+
+def iter_newick_statements(
+    stream: typing.IO,
+    chunk_size: int = 1 << 20,
+) -> typing.Iterator[str]:
+    """Split Newick text read from `stream` into pieces that each end with a
+    top-level semicolon, except possibly the last.
+
+    Consecutive tree statements are grouped until a piece holds at least
+    `chunk_size` characters. Semicolons within quoted labels and comments are
+    not treated as statement boundaries. As in dendropy's tokenizer, a single
+    quote only opens a quoted label at the start of a token.
+    """
+    pieces, piece_size = [], 0
+    in_quote, comment_depth = False, 0
+    prev_char = ";"  # last character of preceding chunk
+    quote_pending = False  # quote closing preceding chunk may be escaped
+    for chunk in iter(lambda: stream.read(chunk_size), ""):
+        start, skip = 0, 0
+        if quote_pending:
+            quote_pending = False
+            if chunk[0] == "'":
+                skip = 1  # escaped quote
+            else:
+                in_quote = False
+
+        for match in _significant_re.finditer(chunk):
+            pos, char = match.start(), match.group()
+            if pos < skip:
+                continue
+            elif in_quote:
+                if char != "'":
+                    pass
+                elif pos + 1 == len(chunk):
+                    quote_pending = True
+                elif chunk[pos + 1] == "'":
+                    skip = pos + 2  # escaped quote
+                else:
+                    in_quote = False
+            elif comment_depth:
+                comment_depth += (char == "[") - (char == "]")
+            elif char == "[":
+                comment_depth = 1
+            elif char == "'":
+                preceding = chunk[pos - 1] if pos else prev_char
+                in_quote = preceding in ' \t\n\r(),;:{}=\\"'
+            elif char == ";" and piece_size + pos + 1 - start >= chunk_size:
+                pieces.append(chunk[start:pos + 1])
+                yield "".join(pieces)
+                pieces, piece_size, start = [], 0, pos + 1
+
+        pieces.append(chunk[start:])
+        piece_size += len(chunk) - start
+        prev_char = chunk[-1]
+
+    if piece_size:
+        yield "".join(pieces)
@@ -0,0 +1,199 @@
+import mmap
+import re
+import typing
+
+
+# matches one token after optional whitespace: a grammar delimiter, a quoted
+# label, an unquoted label run (up to any comment), or a comment opener
+_token_pattern = r"""[ \t\n\r]*(?:
+    ([(),;:])
+    |([{}=\\"])
+    |'((?:[^']|'')*)'(?!')
+    |([^ \t\n\r(),;:{}=\\"'\[][^ \t\n\r(),;:{}=\\"\[]*)
+    |(\[)
+)"""
+_run_pattern = r'[^ \t\n\r(),;:{}=\\"\[]+'
+_bracket_pattern = r"[\[\]]"
+_whitespace_pattern = r"[ \t\n\r]*"
+
+_token_re = re.compile(_token_pattern, re.VERBOSE)
+_run_re = re.compile(_run_pattern)
+_bracket_re = re.compile(_bracket_pattern)
+_whitespace_re = re.compile(_whitespace_pattern)
+
+# byte-level counterparts, for scanning buffers in place; multibyte UTF-8
+# sequences never contain the ASCII bytes matched specially
+_token_bytes_re = re.compile(_token_pattern.encode(), re.VERBOSE)
+_run_bytes_re = re.compile(_run_pattern.encode())
+_bracket_bytes_re = re.compile(_bracket_pattern.encode())
+_whitespace_bytes_re = re.compile(_whitespace_pattern.encode())
+
+
+class _NewickTokenizer:
+    """Chunked tokenizer state over a text stream."""
+
+    def __init__(self, stream: typing.IO, chunk_size: int) -> None:
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Append next chunk of stream to buffer, dropping consumed text.
+
+        Returns False if stream is exhausted.
+        """
+        chunk = "" if self.eof else self.stream.read(self.chunk_size)
+        self.eof = not chunk
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return not self.eof
+
+    def skip_comment(self) -> None:
+        """Consume possibly-nested comment opened at current position.
+
+        Unterminated comments run to end of stream.
+        """
+        depth = 0
+        while True:
+            match = _bracket_re.search(self.buf, self.pos)
+            if match is None:
+                self.pos = len(self.buf)
+                if not self.fill():
+                    return
+                continue
+            depth += 1 if match.group() == "[" else -1
+            self.pos = match.end()
+            if depth <= 0:
+                return
+
+    def read_unquoted(self) -> str:
+        """Consume unquoted token containing comments, from its start."""
+        parts = []
+        while True:
+            if self.pos == len(self.buf) and not self.fill():
+                break
+            char = self.buf[self.pos]
+            if char == "[":
+                self.skip_comment()
+            elif char in " \t\n\r":
+                self.pos += 1
+                break
+            elif char in '(),;:{}=\\"':
+                break
+            else:
+                match = _run_re.match(self.buf, self.pos)
+                parts.append(match.group())
+                self.pos = match.end()
+        return "".join(parts).replace("_", " ")
+
+
+def iter_newick_tokens(
+    stream: typing.IO,
+    chunk_size: int = 1 << 20,
+) -> typing.Iterator[typing.Tuple[str, bool]]:
+    """Split Newick text read from `stream` into `(token, is_delimiter)`
+    pairs, where grammar delimiters `(),;:` are flagged.
+
+    Text is read in chunks of `chunk_size` characters. Tokenization follows
+    dendropy's Newick reader: quoted labels are delimited by single quotes,
+    with doubled quotes as escapes; unquoted labels have underscores read as
+    spaces; and bracketed comments, which may nest, are discarded. Raises
+    ValueError on unterminated quotes.
+    """
+    tokenizer = _NewickTokenizer(stream, chunk_size)
+    while True:
+        buf, pos = tokenizer.buf, tokenizer.pos
+        for match in iter(_token_re.scanner(buf, pos).match, None):
+            if match.end() == len(buf) and not tokenizer.eof:
+                # match may be truncated by chunk boundary
+                tokenizer.pos = pos
+                tokenizer.fill()
+                break
+
+            kind = match.lastindex
+            if kind == 1:
+                yield match.group(1), True
+            elif kind == 2:
+                yield match.group(2), False
+            elif kind == 3:
+                yield match.group(3).replace("''", "'"), False
+            elif kind == 4 and not buf.startswith("[", match.end()):
+                yield match.group(4).replace("_", " "), False
+            else:
+                # unquoted token containing comments
+                tokenizer.pos = match.start(kind)
+                token = tokenizer.read_unquoted()
+                if token:
+                    yield token, False
+                break
+            pos = match.end()
+        else:
+            # remaining text is whitespace or an incomplete quote
+            if not tokenizer.eof:
+                tokenizer.pos = pos
+                tokenizer.fill()
+            elif _whitespace_re.match(buf, pos).end() < len(buf):
+                raise ValueError("Unterminated quote in Newick source.")
+            else:
+                return
+
+
+def iter_newick_buffer_tokens(
+    buffer: typing.Union[bytes, bytearray, memoryview, mmap.mmap],
+    encoding: str = "utf-8",
+) -> typing.Iterator[typing.Tuple[str, bool]]:
+    """Split Newick text encoded in `buffer` into `(token, is_delimiter)`
+    pairs, as `iter_newick_tokens`.
+
+    Buffer is scanned in place, so a memory-mapped file is paged in as
+    needed and only token text is copied out and decoded.
+    """
+    pos = 0
+    while True:
+        for match in iter(_token_bytes_re.scanner(buffer, pos).match, None):
+            kind = match.lastindex
+            if kind == 1:
+                yield match.group(1).decode(), True
+            elif kind == 2:
+                yield match.group(2).decode(), False
+            elif kind == 3:
+                yield match.group(3).decode(encoding).replace("''", "'"), False
+            elif kind == 4 and buffer[match.end():match.end() + 1] != b"[":
+                yield match.group(4).decode(encoding).replace("_", " "), False
+            else:
+                # unquoted token containing comments
+                pos, parts = match.start(kind), []
+                while True:
+                    run = _run_bytes_re.match(buffer, pos)
+                    if run is not None:
+                        parts.append(run.group())
+                        pos = run.end()
+                    elif buffer[pos:pos + 1] == b"[":
+                        pos = _skip_buffer_comment(buffer, pos)
+                    else:
+                        break
+                token = b"".join(parts).decode(encoding).replace("_", " ")
+                if token:
+                    yield token, False
+                break
+            pos = match.end()
+        else:
+            # remaining text is whitespace or an incomplete quote
+            if _whitespace_bytes_re.match(buffer, pos).end() < len(buffer):
+                raise ValueError("Unterminated quote in Newick source.")
+            return
+
+
+def _skip_buffer_comment(
+    buffer: typing.Union[bytes, bytearray, memoryview, mmap.mmap],
+    pos: int,
+) -> int:
+    """Find end of possibly-nested comment opened at `pos` in `buffer`."""
+    depth = 0
+    for match in _bracket_bytes_re.finditer(buffer, pos):
+        depth += 1 if match.group() == b"[" else -1
+        if depth <= 0:
+            return match.end()
+    return len(buffer)
@@ -0,0 +1,37 @@
+import typing
+
+import numpy as np
+import pandas as pd
+
+from .format_ancestor_lists import format_ancestor_lists
+
+
+def make_alife_dataframe(
+    ids: typing.Sequence[int],
+    ancestor_ids: typing.Sequence[int],
+    columns: typing.Mapping[str, typing.Sequence],
+    ancestor_id_only: bool = False,
+) -> pd.DataFrame:
+    """Assemble an alife standard dataframe from per-organism column values.
+
+    Organisms with no ancestor should list their own id in `ancestor_ids`.
+    Resulting columns are `id` and `ancestor_list`, followed by `columns` in
+    order. If `ancestor_id_only` is set, an integer `ancestor_id` column is
+    emitted in place of `ancestor_list`. Column dtypes are inferred from
+    values, as with `pd.DataFrame.from_records`.
+    """
+    ids = np.asarray(ids, dtype=np.int64)
+    ancestor_ids = np.asarray(ancestor_ids, dtype=np.int64)
+    return pd.DataFrame({
+        "id": ids,
+        **(
+            {"ancestor_id": ancestor_ids}
+            if ancestor_id_only
+            else {
+                "ancestor_list": format_ancestor_lists(
+                    ids, ancestor_ids, no_ancestor_token="None"
+                ),
+            }
+        ),
+        **columns,
+    })
@@ -0,0 +1,51 @@
+import typing
+
+import dendropy
+from nanto import nantonone
+
+from .complete_edge_lengths import complete_edge_lengths
+
+
+def make_dendropy_tree(
+    ids: typing.Sequence[int],
+    parent_indices: typing.Sequence[int],
+    origin_times: typing.Sequence[typing.Optional[float]],
+    edge_lengths: typing.Sequence[typing.Optional[float]],
+    labels: typing.Sequence[typing.Optional[str]],
+    taxon_labels: typing.Sequence[typing.Optional[str]],
+) -> dendropy.Tree:
+    """Assemble a rooted dendropy tree from per-node attribute values.
+
+    Nodes are referred to by position, with `parent_indices` giving each
+    node's parent position, or -1 for the root. Children are attached in
+    position order. Node attributes are set up as by
+    `alife_dataframe_to_dendropy_tree` with `setup_edge_lengths`, so missing
+    edge lengths are calculated from origin times.
+    """
+    origin_times = [*map(nantonone, origin_times)]
+    edge_lengths = complete_edge_lengths(
+        ids, parent_indices, origin_times, edge_lengths,
+    )
+
+    nodes = []
+    for id, origin_time, edge_length, label, taxon_label in zip(
+        ids, origin_times, edge_lengths, labels, taxon_labels,
+    ):
+        node = dendropy.Node(label=label, edge_length=edge_length)
+        node.id = id
+        node.origin_time = origin_time
+        if taxon_label not in ('None', None):
+            node.taxon = dendropy.Taxon(label=taxon_label)
+        nodes.append(node)
+
+    root_nodes = []
+    for node, parent_index in zip(nodes, parent_indices):
+        if parent_index >= 0:
+            nodes[parent_index].add_child(node)
+        else:
+            root_nodes.append(node)
+    assert len(root_nodes) == 1
+
+    res = dendropy.Tree(seed_node=root_nodes[0])
+    res.is_rooted = True
+    return res
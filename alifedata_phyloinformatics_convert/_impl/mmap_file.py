@@ -0,0 +1,36 @@
+import contextlib
+import io
+import mmap
+import typing
+
+
+@contextlib.contextmanager
+def mmap_file(file: typing.IO) -> typing.Iterator[typing.Optional[mmap.mmap]]:
+    """Map full contents of open `file` into memory, read only.
+
+    Yields None if `file` cannot be mapped, e.g., if it is a pipe, an
+    in-memory stream, empty, or decompressed from its underlying file.
+    Mapping is closed on exit.
+    """
+    try:
+        # text streams decode from a buffer, which must read file directly
+        buffer = getattr(file, "buffer", file)
+        if not isinstance(buffer, (io.BufferedReader, io.FileIO)):
+            raise io.UnsupportedOperation
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        mapped = None
+
+    if mapped is None:
+        yield None
+        return
+
+    try:
+        yield mapped
+    finally:
+        try:
+            mapped.close()
+        except BufferError:
+            # views into mapping remain, e.g., held by traceback of an
+            # exception in flight; mapping is closed once they are released
+            pass
@@ -0,0 +1,117 @@
+import bz2
+import contextlib
+import gzip
+import io
+import lzma
+import os
+import sys
+import typing
+
+
+# leading bytes identifying compressed data
+_magic_numbers = {
+    "gzip": b"\x1f\x8b",
+    "bz2": b"BZh",
+    "xz": b"\xfd7zXZ\x00",
+    "zstd": b"\x28\xb5\x2f\xfd",
+}
+
+_extensions = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".zst": "zstd",
+}
+
+
+def _open_codec(
+    binary: typing.BinaryIO,
+    mode: str,
+    compression: str,
+    threads: int,
+) -> typing.BinaryIO:
+    """Wrap `binary` stream to decompress or compress it, leaving `binary`
+    open when the returned stream is closed."""
+    if compression == "gzip":
+        # omit file name from header, which may be a temporary name
+        return gzip.GzipFile(filename="", fileobj=binary, mode=mode + "b")
+    elif compression == "bz2":
+        return bz2.BZ2File(binary, mode)
+    elif compression == "xz":
+        return lzma.LZMAFile(binary, mode)
+
+    assert compression == "zstd"
+    try:
+        import zstandard
+    except ImportError:  # pragma: no cover
+        raise ImportError(
+            "zstd compressed data requires the zstandard package.",
+        ) from None
+    if mode == "r":
+        return zstandard.ZstdDecompressor().stream_reader(
+            binary, closefd=False,
+        )
+    else:
+        return zstandard.ZstdCompressor(
+            threads=0 if threads == 1 else threads,
+        ).stream_writer(binary, closefd=False)
+
+
+@contextlib.contextmanager
+def open_compressed(
+    path: str,
+    mode: str = "r",
+    *,
+    threads: int = 1,
+) -> typing.Iterator[typing.TextIO]:
+    """Open text stream over file at `path`, or over stdin or stdout if
+    `path` is "-", transparently decompressing or compressing gzip, bz2, xz,
+    or zstd data as it is streamed.
+
+    Compression of input is detected from its leading bytes, and compression
+    of output from the file extension. Output to stdout is not compressed.
+    Zstd compression uses `threads` worker threads; other codecs compress on
+    the calling thread. Zstd support requires the zstandard package.
+    """
+    assert mode in ("r", "w")
+    with contextlib.ExitStack() as stack:
+        if path == "-":
+            binary = (sys.stdin if mode == "r" else sys.stdout).buffer
+        else:
+            binary = stack.enter_context(open(path, mode + "b"))
+
+        if mode == "w":
+            compression = (
+                None if path == "-"
+                else _extensions.get(os.path.splitext(path)[1].lower())
+            )
+        else:
+            if not hasattr(binary, "peek"):
+                binary = io.BufferedReader(binary)
+            head = binary.peek(max(map(len, _magic_numbers.values())))
+            compression = next(
+                (
+                    compression
+                    for compression, magic in _magic_numbers.items()
+                    if head.startswith(magic)
+                ),
+                None,
+            )
+
+        if compression is not None:
+            binary = stack.enter_context(
+                _open_codec(binary, mode, compression, threads),
+            )
+
+        stream = io.TextIOWrapper(binary)
+        try:
+            yield stream
+        finally:
+            # leave closing of underlying streams to exit stack, unless
+            # consumer already closed stream
+            if not stream.closed:
+                if mode == "w":
+                    stream.flush()
+                stream.detach()
+                if mode == "w":
+                    binary.flush()
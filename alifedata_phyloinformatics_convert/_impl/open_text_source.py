@@ -0,0 +1,31 @@
+import contextlib
+import io
+import typing
+import urllib.request
+
+
+@contextlib.contextmanager
+def open_text_source(
+    *,
+    path: typing.Optional[str] = None,
+    url: typing.Optional[str] = None,
+    data: typing.Optional[str] = None,
+    file: typing.Optional[typing.IO] = None,
+) -> typing.Iterator[typing.IO]:
+    """Open exactly one of a file `path`, a `url`, a `data` string, or an
+    already-open `file` as a text stream.
+
+    Keyword arguments follow those of `dendropy.Tree.get`. Streams opened
+    here are closed on exit; a provided `file` is left open.
+    """
+    assert sum(arg is not None for arg in (path, url, data, file)) == 1
+    if path is not None:
+        with open(path, "r") as stream:
+            yield stream
+    elif url is not None:
+        with urllib.request.urlopen(url) as response:
+            yield io.TextIOWrapper(response, encoding="utf-8")
+    elif data is not None:
+        yield io.StringIO(data)
+    else:
+        yield file
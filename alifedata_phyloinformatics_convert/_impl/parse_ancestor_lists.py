@@ -0,0 +1,118 @@
+import typing
+
+import numpy as np
+import pandas as pd
+
+
+def parse_ancestor_lists(
+    raw: typing.Union[pd.Series, typing.Sequence[str]],
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """Parse a column of alife standard `ancestor_list` strings into a
+    compressed sparse row (CSR) representation.
+
+    The whole column is parsed at once, as a single byte buffer. Lists hold
+    comma-separated integer ids. Placeholder words, like `none`, `None`, or
+    `NONE`, stand for no ancestor wherever they appear, so `[None]` and `[]`
+    list no ancestors. Raises ValueError if any list is whitespace
+    separated, not enclosed in square brackets, or holds empty or otherwise
+    malformed entries.
+
+    Returns
+    -------
+    offsets : np.ndarray of int64
+        Array of length `len(raw) + 1`. Ancestors of row `i` are
+        `ancestor_ids[offsets[i]:offsets[i + 1]]`.
+    ancestor_ids : np.ndarray of int64
+        Ancestor ids of all rows, flattened in row order.
+    """
+    strs = list(raw)
+    if len(strs) == 0:
+        return np.zeros(1, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    buf = np.frombuffer("".join(strs).encode("ascii"), dtype=np.uint8)
+    row_lens = np.fromiter(map(len, strs), dtype=np.int64, count=len(strs))
+    row_stops = np.cumsum(row_lens)
+    row_starts = row_stops - row_lens
+
+    if np.isin(
+        buf, np.frombuffer(b" \t\n\r\x0b\x0c", dtype=np.uint8)
+    ).any():
+        raise ValueError("Whitespace separated ancestor list not supported.")
+    if not (
+        (row_lens >= 2).all()
+        and (buf[row_starts] == ord("[")).all()
+        and (buf[row_stops - 1] == ord("]")).all()
+    ):
+        raise ValueError("Ancestor list must be enclosed in square brackets.")
+
+    # rows are laid out back to back, so all but brackets is list content
+    is_body = np.ones(len(buf), dtype=bool)
+    is_body[row_starts] = False
+    is_body[row_stops - 1] = False
+
+    # set ASCII lowercase bit to classify letters case insensitively
+    lowered = buf | 0x20
+    is_word_char = (
+        (lowered >= ord("a")) & (lowered <= ord("z")) | (buf == ord("_"))
+    )
+    is_digit = (buf >= ord("0")) & (buf <= ord("9"))
+    is_minus = buf == ord("-")
+    is_comma = is_body & (buf == ord(","))
+    is_token = is_body & ~is_comma
+
+    # entries are runs of non-comma bytes, which must not be empty
+    comma_positions = np.flatnonzero(is_comma)
+    if not (
+        is_token[comma_positions - 1] & is_token[comma_positions + 1]
+    ).all():
+        raise ValueError("Ancestor list must not hold empty entries.")
+    if (is_token & ~is_digit & ~is_word_char & ~is_minus).any():
+        raise ValueError("Ancestor list must hold comma-separated ids.")
+
+    boundaries = np.flatnonzero(
+        np.diff(is_token, prepend=False, append=False),
+    )
+    token_starts, token_stops = boundaries[::2], boundaries[1::2]
+
+    # words are placeholders, and ids are digits with optional leading minus
+    is_word = is_word_char[token_starts]
+    is_negative = is_minus[token_starts]
+    is_token_start = np.zeros(len(buf), dtype=bool)
+    is_token_start[token_starts] = True
+    # spread each token's kind over its bytes, false before the first token
+    is_word_byte = (
+        np.append(False, is_word)[np.cumsum(is_token_start)] & is_token
+    )
+    if (
+        (is_minus & ~is_token_start).any()
+        or (is_word_char & is_token & ~is_word_byte).any()
+        or (token_stops - token_starts == is_negative).any()
+    ):
+        raise ValueError("Ancestor list must hold comma-separated ids.")
+
+    is_id = ~is_word
+    # accumulate id values from place-weighted digits
+    id_starts = token_starts[is_id] + is_negative[is_id]
+    id_stops = token_stops[is_id]
+    id_lens = id_stops - id_starts
+    id_offsets = np.cumsum(id_lens) - id_lens
+    digit_positions = (
+        np.repeat(id_starts - id_offsets, id_lens) + np.arange(id_lens.sum())
+    )
+    place_values = np.power(
+        10,
+        np.repeat(id_stops - 1, id_lens) - digit_positions,
+        dtype=np.int64,
+    )
+    ancestor_ids = np.add.reduceat(
+        (buf[digit_positions].astype(np.int64) - ord("0")) * place_values,
+        id_offsets,
+    ) if len(id_starts) else np.zeros(0, dtype=np.int64)
+    ancestor_ids[is_negative[is_id]] *= -1
+
+    # tally ids falling within each row's span of the buffer
+    id_rows = np.searchsorted(row_starts, id_starts, side="right") - 1
+    offsets = np.zeros(len(strs) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(id_rows, minlength=len(strs)), out=offsets[1:])
+
+    return offsets, ancestor_ids.astype(np.int64, copy=False)
@@ -0,0 +1,21 @@
+import os
+import tempfile
+import typing
+
+
+# memory-backed filesystem available on most Linux systems
+_ram_dir = "/dev/shm"
+
+
+def ram_temporary_file(**kwargs: typing.Any) -> typing.IO:
+    """Create a named temporary file in memory-backed storage, so that
+    handing data to libraries that only read and write paths does not touch
+    disk.
+
+    Falls back to the default temporary directory if no memory-backed
+    storage is writable. Keyword arguments are forwarded to
+    `tempfile.NamedTemporaryFile`.
+    """
+    if os.path.isdir(_ram_dir) and os.access(_ram_dir, os.W_OK | os.X_OK):
+        kwargs.setdefault("dir", _ram_dir)
+    return tempfile.NamedTemporaryFile(**kwargs)
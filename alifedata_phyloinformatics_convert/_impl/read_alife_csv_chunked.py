@@ -0,0 +1,73 @@
+import typing
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from .alifestd_parse_ancestors import alifestd_parse_ancestors
+from .read_alife_dataframe import conversion_columns, conversion_dtypes
+
+
+_time_columns = ("origin_time", "edge_length")
+_label_columns = ("label", "taxon_label")
+
+
+def read_alife_csv_chunked(
+    file: typing.Union[str, typing.IO],
+    chunksize: int,
+) -> pd.DataFrame:
+    """Read an asexual alife standard phylogeny from CSV, `chunksize` rows at
+    a time, keeping only columns needed for conversion in compact form.
+
+    Other columns are never materialized, and `conversion_dtypes` are
+    applied as values are parsed. Ancestry is reduced to an integer
+    `ancestor_id` column as chunks are read, so `ancestor_list` strings are
+    discarded. Numeric columns are promoted across chunks as if read whole.
+    Label columns are interned as categoricals.
+
+    Raises ValueError if any organism has more than one ancestor.
+    """
+    ids, ancestor_ids = [], []
+    columns = {}
+    for chunk in pd.read_csv(
+        file,
+        chunksize=chunksize,
+        dtype=conversion_dtypes,
+        usecols=conversion_columns.__contains__,
+    ):
+        chunk_ids = chunk["id"].to_numpy(dtype=np.int64)
+        ancestor_offsets, chunk_ancestor_ids = alifestd_parse_ancestors(chunk)
+        num_ancestors = np.diff(ancestor_offsets)
+        if (num_ancestors > 1).any():
+            raise ValueError(
+                "Phylogeny with multiple ancestors per organism "
+                "cannot be represented as a tree.",
+            )
+        own_ancestor_ids = chunk_ids.copy()
+        own_ancestor_ids[num_ancestors.astype(bool)] = chunk_ancestor_ids
+
+        ids.append(chunk_ids)
+        ancestor_ids.append(own_ancestor_ids)
+        for column in (*_time_columns, *_label_columns):
+            if column in chunk:
+                columns.setdefault(column, []).append(chunk[column])
+
+    res = pd.DataFrame({
+        "id": np.concatenate(ids) if ids else np.zeros(0, dtype=np.int64),
+        "ancestor_id": (
+            np.concatenate(ancestor_ids)
+            if ancestor_ids
+            else np.zeros(0, dtype=np.int64)
+        ),
+    })
+    for column in _time_columns:
+        if column in columns:
+            res[column] = np.concatenate([
+                values.to_numpy() for values in columns[column]
+            ])
+    for column in _label_columns:
+        if column in columns:
+            res[column] = union_categoricals([
+                values.astype("category") for values in columns[column]
+            ])
+    return res
@@ -0,0 +1,68 @@
+import typing
+
+import numpy as np
+import pandas as pd
+
+
+# columns read by conversions from alife standard data
+conversion_columns = (
+    "id",
+    "ancestor_list",
+    "ancestor_id",
+    "origin_time",
+    "edge_length",
+    "label",
+    "taxon_label",
+)
+
+# compact dtypes for conversion columns, applied where readers support it;
+# times keep their inferred dtype, as integer times yield integer lengths
+conversion_dtypes = {
+    "id": np.int64,
+    "ancestor_id": np.int64,
+    "label": str,
+    "taxon_label": str,
+}
+
+# pandas readers and whether each supports `usecols` and `dtype` pushdown
+_readers = {
+    "csv": (pd.read_csv, True),
+    "fwf": (pd.read_fwf, True),
+    "json": (pd.read_json, False),
+    "html": (pd.read_html, False),
+    "excel": (pd.read_excel, True),
+    "hdf": (pd.read_hdf, False),
+    "feather": (pd.read_feather, False),
+    "parquet": (pd.read_parquet, False),
+    "orc": (pd.read_orc, False),
+    "stata": (pd.read_stata, False),
+    "sass": (pd.read_sas, False),
+    "spss": (pd.read_spss, False),
+    "pickle": (pd.read_pickle, False),
+    "sql": (pd.read_sql, False),
+    "gbq": (pd.read_gbq, False),
+}
+
+
+def read_alife_dataframe(
+    file: typing.Union[str, typing.IO],
+    input_format: str,
+) -> pd.DataFrame:
+    """Read alife standard phylogeny data in `input_format`, keeping only
+    columns needed for conversion.
+
+    For text formats, unneeded columns are skipped by the reader and
+    `conversion_dtypes` are applied as values are parsed, so label columns
+    are read as text. For other formats, unneeded columns are dropped
+    directly after reading.
+    """
+    reader, is_pushdown = _readers[input_format]
+    if is_pushdown:
+        return reader(
+            file,
+            dtype=conversion_dtypes,
+            usecols=conversion_columns.__contains__,
+        )
+
+    df = reader(file)
+    return df[[column for column in df if column in conversion_columns]]
@@ -0,0 +1,38 @@
+import typing
+
+from nanto import isanan
+import opytional as opyt
+
+
+def setup_origin_times(
+    parent_indices: typing.Sequence[int],
+    origin_times: typing.Sequence[typing.Optional[float]],
+    edge_lengths: typing.Sequence[typing.Optional[float]],
+    where: typing.Sequence[bool],
+) -> typing.List[typing.Optional[float]]:
+    """Derive origin times from edge lengths as tree exporters, like
+    `dendropy_tree_to_alife_dataframe`, set them up, for per-node values not
+    held in a tree.
+
+    Nodes are referred to by position, with `parent_indices` giving each
+    node's parent position, or -1 for the root. Parents must precede their
+    children. Origin times of nodes in `where` are derived: roots take their
+    own edge length, or 0 if missing, and other nodes add their edge length
+    to their parent's origin time. Origin times stay missing, as None, where
+    either is missing. Other nodes keep their origin time.
+    """
+    res = []
+    for parent_index, origin_time, edge_length, where_ in zip(
+        parent_indices, origin_times, edge_lengths, where,
+    ):
+        if not where_:
+            res.append(origin_time)
+        elif parent_index < 0:
+            res.append(opyt.or_value(edge_length, 0))
+        elif None not in (
+            res[parent_index], edge_length,
+        ) and not isanan(res[parent_index]):
+            res.append(res[parent_index] + edge_length)
+        else:
+            res.append(None)
+    return res
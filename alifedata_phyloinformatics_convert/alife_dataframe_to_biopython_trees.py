@@ -1,12 +1,91 @@
 from Bio import Phylo
-from iterpop import iterpop as ip
-from nanto import isanan, nantonone
+from nanto import nantonone
 import pandas as pd
 import string
 import typing
 
-from ._impl import parse_ancestor_list as _parse_ancestor_list
-from ._impl import keydefaultdict
+from ._impl import calc_edge_lengths as _calc_edge_lengths
+from ._impl import CompactTree as _CompactTree
+from ._impl import get_column_values as _get_column_values
+from ._impl import get_setattrs_columns as _get_setattrs_columns
+
+def _alife_dataframe_to_biopython_trees(
+    df: pd.DataFrame,
+    compact_tree: _CompactTree,
+    setattrs: typing.Optional[typing.Union[
+        typing.Iterable[str],
+        typing.Mapping[str, str],
+    ]] = None,
+    setup_branch_lengths: bool = False,
+    *,
+    progress_wrap: typing.Callable = lambda x, **_: x,
+):
+    """Implementation of `alife_dataframe_to_biopython_trees`, over precomputed
+    `compact_tree` topology of `df`."""
+
+    # maps row index to node
+    def setup_node(id: int) -> Phylo.BaseTree.Clade:
+        res = Phylo.BaseTree.Clade()
+        res.id = id
+        return res
+    nodes = [setup_node(id) for id in compact_tree.ids.tolist()]
+
+    attr_columns = _get_setattrs_columns(
+        df,
+        setattrs,
+        reserved_attr_names=(
+            'name',
+            'branch_length',
+            'origin_time',
+        ),
+        probe_node=setup_node(None),
+    )
+    for attr_name, values in attr_columns:
+        for node, value in zip(nodes, values):
+            setattr(node, attr_name, value)
+
+    rows = zip(
+        nodes,
+        compact_tree.parent_index.tolist(),
+        _get_column_values(df, 'origin_time'),
+        _get_column_values(df, 'name'),
+        _get_column_values(df, 'branch_length'),
+    )
+    for (
+        node, parent_index, origin_time, name, branch_length,
+    ) in progress_wrap(rows, total=len(df)):
+        node.origin_time = nantonone(origin_time)
+        node.name = name
+        node.branch_length = nantonone(branch_length)
+
+        if parent_index >= 0:
+            nodes[parent_index].clades.append(node)
+
+    root_nodes = [nodes[index] for index in compact_tree.roots.tolist()]
+
+    # set up branch lengths
+    if setup_branch_lengths and 'origin_time' in df:
+        edge_lengths, is_calculated = _calc_edge_lengths(
+            compact_tree,
+            df['origin_time'],
+            where=(
+                df['branch_length'].isna().to_numpy()
+                if 'branch_length' in df
+                else None
+            ),
+        )
+        for node, edge_length, is_calculated_ in progress_wrap(
+            zip(nodes, edge_lengths.tolist(), is_calculated.tolist()),
+            total=len(nodes),
+        ):
+            if is_calculated_:
+                node.branch_length = edge_length
+
+    return([
+        Phylo.BaseTree.Tree(root=root_node)
+        for root_node in root_nodes
+    ])
+
 
 def alife_dataframe_to_biopython_trees(
     df: pd.DataFrame,
@@ -22,6 +101,9 @@ def alife_dataframe_to_biopython_trees(
     data format standards as zero or more biopython trees, depending on the
     number of clades with no common ancestor.
 
+    If an integer `ancestor_id` column is present, it is used to link
+    organisms in place of `ancestor_list`.
+
     The following columns will automatically be applied as attributes to
     generated Clade objects:
         * branch_length,
@@ -42,70 +124,10 @@ def alife_dataframe_to_biopython_trees(
         Will not override if branch_length is provided as a column of df.
     """
 
-    df = df.copy()
-
-    df['parsed_ancestor_list'] \
-        = df['ancestor_list'].apply(_parse_ancestor_list)
-
-    # maps id to node
-    def setup_node(id: int) -> Phylo.BaseTree.Clade:
-        res = Phylo.BaseTree.Clade()
-        res.id = id
-        return res
-    nodes = keydefaultdict(setup_node)
-
-    # maps id to origin time
-    root_nodes = []
-
-    for __, row in progress_wrap(df.iterrows(), total=len(df)):
-        node = nodes[row['id']]
-
-        if setattrs is not None:
-            for col_name in setattrs:
-                attr_name: str
-                try:
-                    attr_name = setattrs[col_name]
-                except TypeError:
-                    attr_name = col_name
-                assert attr_name not in (
-                    'name',
-                    'branch_length',
-                    'origin_time',
-                )
-                assert not hasattr(node, attr_name)
-                setattr(node, attr_name, row[col_name])
-
-        node.origin_time = nantonone(row.get('origin_time', default=None))
-        node.name = row.get('name', default=None)
-        node.branch_length = nantonone(row.get('branch_length', None))
-
-        if row['parsed_ancestor_list']:
-            ancestor_id = ip.popsingleton(row['parsed_ancestor_list'])
-            nodes[ancestor_id].clades.append(node)
-        else:
-            root_nodes.append(node)
-
-    # set up branch lengths
-    if setup_branch_lengths:
-        for id, parent_node in progress_wrap(nodes.items(), total=len(nodes)):
-            for child_node in parent_node.clades:
-                if child_node.branch_length is None and None not in (
-                    getattr(child_node, 'origin_time', None),
-                    getattr(parent_node, 'origin_time', None),
-                ):
-                    assert child_node.origin_time >= parent_node.origin_time
-                    child_node.branch_length \
-                        = child_node.origin_time - parent_node.origin_time
-
-        for root_node in root_nodes:
-            if (
-                root_node.branch_length is None
-                and getattr(root_node, 'origin_time', None) is not None
-            ):
-                assert not isanan(root_node.origin_time)
-                root_node.branch_length = root_node.origin_time
-
-    return([
-        Phylo.BaseTree.Tree(root=root_node)
-        for root_node in root_nodes
-    ])
+    return _alife_dataframe_to_biopython_trees(
+        df,
+        _CompactTree.from_alife_dataframe(df),
+        setattrs=setattrs,
+        setup_branch_lengths=setup_branch_lengths,
+        progress_wrap=progress_wrap,
+    )
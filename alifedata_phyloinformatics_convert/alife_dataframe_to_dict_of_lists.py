@@ -2,7 +2,7 @@ import opytional as opyt
 import pandas as pd
 import typing
 
-from ._impl import parse_ancestor_list as _parse_ancestor_list
+from ._impl import alifestd_parse_ancestors as _alifestd_parse_ancestors
 
 
 def alife_dataframe_to_dict_of_lists(
@@ -10,6 +10,9 @@ def alife_dataframe_to_dict_of_lists(
 ) -> typing.Dict[int, typing.List[int]]:
     """Extract an adjacency representation for an alife standard dataframe.
 
+    If an integer `ancestor_id` column is present, it is used in place of
+    `ancestor_list`.
+
     Returns
     -------
     dict of int : list of int
@@ -17,9 +20,13 @@ def alife_dataframe_to_dict_of_lists(
         lists of organisms' ancestors.
     """
 
-    df = df.copy()
-
-    df['parsed_ancestor_list'] \
-        = df['ancestor_list'].apply(_parse_ancestor_list)
+    ancestor_offsets, ancestor_ids = _alifestd_parse_ancestors(df)
+    ancestor_offsets = ancestor_offsets.tolist()
+    ancestor_ids = ancestor_ids.tolist()
 
-    return df.set_index('id', drop=False)['parsed_ancestor_list'].to_dict()
+    return {
+        id: ancestor_ids[begin:end]
+        for id, begin, end in zip(
+            df['id'].tolist(), ancestor_offsets, ancestor_offsets[1:],
+        )
+    }
@@ -1,12 +1,89 @@
-from iterpop import iterpop as ip
-from nanto import isanan, nantonone, nantozero
+from nanto import nantonone, nantozero
 import pandas as pd
 import string
 import typing
 
+from ._impl import calc_edge_lengths as _calc_edge_lengths
+from ._impl import CompactTree as _CompactTree
 from ._impl import ete3
-from ._impl import keydefaultdict
-from ._impl import parse_ancestor_list as _parse_ancestor_list
+from ._impl import get_column_values as _get_column_values
+from ._impl import get_setattrs_columns as _get_setattrs_columns
+
+
+def _alife_dataframe_to_ete_trees(
+    df: pd.DataFrame,
+    compact_tree: _CompactTree,
+    setattrs: typing.Optional[typing.Union[
+        typing.Iterable[str],
+        typing.Mapping[str, str],
+    ]] = None,
+    setup_dists: bool = False,
+    *,
+    progress_wrap: typing.Callable = lambda x, **_: x,
+) -> typing.List[ete3.TreeNode]:
+    """Implementation of `alife_dataframe_to_ete_trees`, over precomputed
+    `compact_tree` topology of `df`."""
+
+    # maps row index to node
+    def setup_node(id: int) -> ete3.TreeNode:
+        res = ete3.TreeNode()
+        res.add_features(id=id)
+        return res
+    nodes = [setup_node(id) for id in compact_tree.ids.tolist()]
+
+    attr_columns = _get_setattrs_columns(
+        df,
+        setattrs,
+        reserved_attr_names=(
+            'dist',
+            'origin_time',
+            'name',
+        ),
+        probe_node=setup_node(None),
+    )
+    for attr_name, values in attr_columns:
+        for node, value in zip(nodes, values):
+            node.add_features(**{attr_name: value})
+
+    rows = zip(
+        nodes,
+        compact_tree.parent_index.tolist(),
+        _get_column_values(df, 'origin_time'),
+        _get_column_values(df, 'name'),
+        _get_column_values(df, 'dist', default=1.0),
+    )
+    for (
+        node, parent_index, origin_time, name, dist,
+    ) in progress_wrap(rows, total=len(df)):
+        node.add_features(origin_time=nantonone(origin_time))
+        if name not in ('None', None):
+            node.name = name
+        node.dist = nantozero(dist)
+
+        if parent_index >= 0:
+            nodes[parent_index].add_child(node)
+
+    root_nodes = [nodes[index] for index in compact_tree.roots.tolist()]
+
+    # set up edge lengths
+    if setup_dists and 'origin_time' in df:
+        edge_lengths, is_calculated = _calc_edge_lengths(
+            compact_tree,
+            df['origin_time'],
+            where=(
+                (df['dist'] == 1.0).to_numpy()
+                if 'dist' in df
+                else None
+            ),
+        )
+        for node, edge_length, is_calculated_ in progress_wrap(
+            zip(nodes, edge_lengths.tolist(), is_calculated.tolist()),
+            total=len(nodes),
+        ):
+            if is_calculated_:
+                node.dist = edge_length
+
+    return root_nodes  # Tree is an alias of TreeNode
 
 
 def alife_dataframe_to_ete_trees(
@@ -23,6 +100,9 @@ def alife_dataframe_to_ete_trees(
     data format standards as zero or more ete trees, depending on the number
     of clades with no common ancestor.
 
+    If an integer `ancestor_id` column is present, it is used to link
+    organisms in place of `ancestor_list`.
+
     The following columns will automatically be applied as attributes to
     generated TreeNode objects:
         * dist,
@@ -43,70 +123,10 @@ def alife_dataframe_to_ete_trees(
         Will not override if dist is provided as a column of df.
     """
 
-    df = df.copy()
-
-    df['parsed_ancestor_list'] \
-        = df['ancestor_list'].apply(_parse_ancestor_list)
-
-    # maps id to node
-    def setup_node(id: int) -> ete3.TreeNode:
-        res = ete3.TreeNode()
-        res.add_features(id=id)
-        return res
-    nodes = keydefaultdict(setup_node)
-
-    root_nodes = []
-
-    for __, row in progress_wrap(df.iterrows(), total=len(df)):
-        node = nodes[row['id']]
-
-        if setattrs is not None:
-            for col_name in setattrs:
-                attr_name: str
-                try:
-                    attr_name = setattrs[col_name]
-                except TypeError:
-                    attr_name = col_name
-                assert attr_name not in (
-                    'dist',
-                    'origin_time',
-                    'name',
-                )
-                assert not hasattr(node, attr_name)
-                node.add_features(**{attr_name: row[col_name]})
-
-        node.add_features(
-            origin_time=nantonone(row.get('origin_time', default=None)),
-        )
-        name = row.get('name', default=None)
-        if name not in ('None', None):
-            node.name = name
-        node.dist = nantozero(row.get('dist', 1.0))
-
-        if row['parsed_ancestor_list']:
-            ancestor_id = ip.popsingleton(row['parsed_ancestor_list'])
-            nodes[ancestor_id].add_child(node)
-        else:
-            root_nodes.append(node)
-
-    # set up edge lengths
-    if setup_dists:
-        for id, parent_node in progress_wrap(nodes.items(), total=len(nodes)):
-            for child_node in parent_node.children:
-                if child_node.dist == 1.0 and None not in (
-                    getattr(child_node, 'origin_time', None),
-                    getattr(parent_node, 'origin_time', None),
-                ):
-                    assert child_node.origin_time >= parent_node.origin_time
-                    child_node.dist \
-                        = child_node.origin_time - parent_node.origin_time
-
-        for root_node in root_nodes:
-            if (
-                root_node.dist == 1.0
-                and getattr(root_node, 'origin_time', None) is not None
-            ):
-                assert not isanan(root_node.origin_time)
-                root_node.dist = root_node.origin_time
-
-    return root_nodes  # Tree is an alias of TreeNode
+    return _alife_dataframe_to_ete_trees(
+        df,
+        _CompactTree.from_alife_dataframe(df),
+        setattrs=setattrs,
+        setup_dists=setup_dists,
+        progress_wrap=progress_wrap,
+    )
@@ -1,10 +1,77 @@
 import networkx as nx
+import numpy as np
 import pandas as pd
 import typing
 
 from .alife_dataframe_to_dict_of_lists import alife_dataframe_to_dict_of_lists
 
 
+def _alife_dataframe_to_networkx_digraph(
+    df: pd.DataFrame,
+    dict_of_lists: typing.Dict[int, typing.List[int]],
+    setup_edge_lengths: bool = False,
+) -> nx.DiGraph:
+    """Implementation of `alife_dataframe_to_networkx_digraph`, over
+    precomputed `dict_of_lists` adjacency of `df`."""
+
+    if "branch_length" in df and "edge_length" in df and not (
+        df["branch_length"].equals(df["edge_length"])
+    ):
+        raise ValueError
+
+    g = nx.from_dict_of_lists(dict_of_lists, create_using=nx.DiGraph)
+
+    nx.set_node_attributes(
+        g,
+        df.set_index("id")[[
+            attr
+            for attr in (
+                "branch_length",
+                "edge_length",
+                "length",
+                "weight",
+                "label",
+                "name",
+                "origin_time",
+                "taxon_label",
+            )
+            if attr in df
+        ]].to_dict(orient="index"),
+    )
+
+    if setup_edge_lengths:
+        edges = np.array(list(g.edges), dtype=np.int64).reshape(-1, 2)
+        froms, tos = edges[:, 0], edges[:, 1]
+
+        indexed_df = df.set_index("id")
+        length_col = next(
+            (
+                col
+                for col in ("length", "edge_length", "branch_length")
+                if col in df
+            ),
+            None,
+        )
+        if length_col is not None:
+            lengths = indexed_df[length_col].loc[froms].to_numpy()
+        elif "origin_time" in df:
+            origin_times = indexed_df["origin_time"]
+            lengths = (
+                origin_times.loc[froms].to_numpy()
+                - origin_times.loc[tos].to_numpy()
+            )
+        else:
+            lengths = np.ones(len(froms), dtype=int)
+
+        nx.set_edge_attributes(
+            g,
+            dict(zip(g.edges, lengths.tolist())),
+            name="length",
+        )
+
+    return g
+
+
 # see also https://github.com/alife-data-standards/alife-std-dev-python/blob/f21a63d70077345441b9b52c3f470f5dca1127c1/tests/test_phylogeny_loader.py
 def alife_dataframe_to_networkx_digraph(
     df: pd.DataFrame,
@@ -43,50 +110,8 @@ def alife_dataframe_to_networkx_digraph(
         column of df.
     """
 
-    if "branch_length" in df and "edge_length" in df and not (
-        df["branch_length"].equals(df["edge_length"])
-    ):
-        raise ValueError
-
-    g = nx.from_dict_of_lists(
+    return _alife_dataframe_to_networkx_digraph(
+        df,
         alife_dataframe_to_dict_of_lists(df),
-        create_using=nx.DiGraph,
+        setup_edge_lengths=setup_edge_lengths,
     )
-
-    nx.set_node_attributes(
-        g,
-        df.set_index("id")[[
-            attr
-            for attr in (
-                "branch_length",
-                "edge_length",
-                "length",
-                "weight",
-                "label",
-                "name",
-                "origin_time",
-                "taxon_label",
-            )
-            if attr in df
-        ]].to_dict(orient="index"),
-    )
-
-    if setup_edge_lengths and "length" in df:
-        for from_, to in g.edges:
-            g[from_][to]["length"] = g.nodes[from_]["length"]
-    elif setup_edge_lengths and "edge_length" in df:
-        for from_, to in g.edges:
-            g[from_][to]["length"] = g.nodes[from_]["edge_length"]
-    elif setup_edge_lengths and "branch_length" in df:
-        for from_, to in g.edges:
-            g[from_][to]["length"] = g.nodes[from_]["branch_length"]
-    elif setup_edge_lengths and "origin_time" in df:
-        for from_, to in g.edges:
-            g[from_][to]["length"] = (
-                g.nodes[from_]["origin_time"] - g.nodes[to]["origin_time"]
-            )
-    elif setup_edge_lengths:
-        for from_, to in g.edges:
-            g[from_][to]["length"] = 1
-
-    return g
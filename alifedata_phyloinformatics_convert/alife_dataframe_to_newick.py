@@ -0,0 +1,183 @@
+import io
+from nanto import nantonone
+import pandas as pd
+import re
+import typing
+
+from ._impl import calc_edge_lengths as _calc_edge_lengths
+from ._impl import CompactTree as _CompactTree
+from ._impl import get_column_values as _get_column_values
+
+
+# characters requiring a label to be quoted, as in dendropy's Newick writer
+_protected_chars = re.compile(r'''[()[\]{},;:'"\0\t\n]''')
+
+
+def _escape_label(label: str) -> str:
+    """Protect a node label, matching dendropy's default Newick output."""
+    if '_' not in label and not _protected_chars.search(label):
+        return label.replace(' ', '_').replace('\t', '_')
+    else:
+        return "'" + label.replace("'", "''") + "'"
+
+
+def _render_tag(
+    taxon_label: typing.Any,
+    label: typing.Any,
+    is_leaf: bool,
+) -> str:
+    """Compose a node's Newick label, matching dendropy's default output."""
+    tag_parts = []
+    if taxon_label not in ('None', None):
+        tag_parts.append(str(taxon_label))
+    if not is_leaf and label and label is not None:
+        tag_parts.append(str(label))
+    tag = ' '.join(tag_parts)
+    return _escape_label(tag) if tag else ''
+
+
+def _alife_dataframe_to_newick(
+    df: pd.DataFrame,
+    compact_tree: _CompactTree,
+    file: typing.IO,
+    setup_edge_lengths: bool = False,
+    suppress_unifurcations: bool = False,
+    *,
+    buffer_size: int = 65536,
+) -> None:
+    """Implementation of `alife_dataframe_to_newick`, over precomputed
+    `compact_tree` topology of `df`."""
+
+    edge_lengths = [
+        nantonone(edge_length)
+        for edge_length in _get_column_values(df, 'edge_length')
+    ]
+    if setup_edge_lengths and 'origin_time' in df:
+        calculated_lengths, is_calculated = _calc_edge_lengths(
+            compact_tree,
+            df['origin_time'],
+            where=(
+                df['edge_length'].isna().to_numpy()
+                if 'edge_length' in df
+                else None
+            ),
+        )
+        edge_lengths = [
+            calculated_length if is_calculated_ else edge_length
+            for edge_length, calculated_length, is_calculated_ in zip(
+                edge_lengths,
+                calculated_lengths.tolist(),
+                is_calculated.tolist(),
+            )
+        ]
+
+    labels = _get_column_values(df, 'label')
+    taxon_labels = _get_column_values(df, 'taxon_label')
+    child_offsets = compact_tree.child_offsets.tolist()
+    children = compact_tree.children.tolist()
+
+    def num_children(index: int) -> int:
+        return child_offsets[index + 1] - child_offsets[index]
+
+    # buffer output tokens, flushing to file in large chunks
+    tokens = []
+
+    def write_body(index: int) -> None:
+        tokens.append(_render_tag(
+            taxon_labels[index], labels[index], num_children(index) == 0,
+        ))
+        if edge_lengths[index] is not None:
+            tokens.append(f':{edge_lengths[index]}')
+
+    for root in compact_tree.roots.tolist():
+        tokens.append('[&R] ')
+        # nonnegative entries open nodes, complemented entries close nodes,
+        # and None entries separate siblings
+        stack = [root]
+        while stack:
+            entry = stack.pop()
+            if entry is None:
+                tokens.append(',')
+            elif entry >= 0:
+                index = entry
+                if suppress_unifurcations:
+                    # fold unifurcation chain into its lowest node, summing
+                    # edge lengths bottom-up like dendropy
+                    chain = []
+                    while num_children(index) == 1:
+                        chain.append(index)
+                        index = children[child_offsets[index]]
+                    for unifurcation in reversed(chain):
+                        length = edge_lengths[unifurcation]
+                        if length is None:
+                            continue
+                        elif edge_lengths[index] is None:
+                            edge_lengths[index] = length
+                        else:
+                            edge_lengths[index] += length
+
+                if num_children(index) == 0:
+                    write_body(index)
+                else:
+                    tokens.append('(')
+                    stack.append(~index)
+                    node_children = children[
+                        child_offsets[index]:child_offsets[index + 1]
+                    ]
+                    for child in reversed(node_children[1:]):
+                        stack.append(child)
+                        stack.append(None)
+                    stack.append(node_children[0])
+            else:
+                tokens.append(')')
+                write_body(~entry)
+
+            if len(tokens) >= buffer_size:
+                file.write(''.join(tokens))
+                tokens.clear()
+
+        tokens.append(';\n')
+
+    file.write(''.join(tokens))
+
+
+def alife_dataframe_to_newick(
+    df: pd.DataFrame,
+    setup_edge_lengths: bool = False,
+    *,
+    file: typing.Optional[typing.IO] = None,
+    suppress_unifurcations: bool = False,
+) -> typing.Optional[str]:
+    """Serialize a phylogeny dataframe formatted to the artificial life
+    community data format standards as Newick, without constructing
+    intermediate tree objects.
+
+    Output matches that of `alife_dataframe_to_dendropy_trees` followed by
+    dendropy's Newick writer with default settings, with one line per clade
+    with no common ancestor. Nodes are visited iteratively, so arbitrarily
+    deep trees can be serialized.
+
+    Parameters
+    ----------
+    df:
+        Pandas DataFrame to convert.
+    setup_edge_lengths: bool, optional
+        Should we try to set up edge lengths using the origin_time column?
+        Will not override if edge_length is provided as a column of df.
+    file: optional
+        Text stream to write to. If not provided, output is returned as a
+        string.
+    suppress_unifurcations: bool, optional
+        Should nodes with a single child be elided, as by dendropy's
+        `Tree.suppress_unifurcations`?
+    """
+
+    sink = io.StringIO() if file is None else file
+    _alife_dataframe_to_newick(
+        df,
+        _CompactTree.from_alife_dataframe(df),
+        sink,
+        setup_edge_lengths=setup_edge_lengths,
+        suppress_unifurcations=suppress_unifurcations,
+    )
+    return sink.getvalue() if file is None else None
@@ -1,8 +1,21 @@
-import tempfile
-
 import pandas as pd
 
 from ._impl import phytrack_Systematics
+from ._impl import ram_temporary_file as _ram_temporary_file
+
+
+# columns read by Systematics.load_from_file, with "id" as info column
+_loaded_columns = (
+    "id",
+    "ancestor_list",
+    "origin_time",
+    "destruction_time",
+    "num_orgs",
+    "tot_orgs",
+    "num_offspring",
+    "total_offspring",
+    "depth",
+)
 
 
 def alife_dataframe_to_phylotrack_systematics(
@@ -11,12 +24,20 @@ def alife_dataframe_to_phylotrack_systematics(
     """Open a phylogeny dataframe formatted to the artificial life community
     data format standards as a phylotrackpy Systematics object.
 
+    Data is handed to phylotrackpy through a temporary CSV file, in memory-
+    backed storage where available. Columns not read by phylotrackpy are
+    omitted.
+
     Notes
     -----
     Edge length support is not yet implemented.
     """
-    with tempfile.NamedTemporaryFile() as tmp:
-        df.to_csv(tmp.name, index=False)
+    with _ram_temporary_file(suffix=".csv") as tmp:
+        df.to_csv(
+            tmp.name,
+            columns=[column for column in df if column in _loaded_columns],
+            index=False,
+        )
         res = phytrack_Systematics(lambda x: x)
         res.load_from_file(tmp.name, "id", True)
         return res
@@ -6,12 +6,13 @@ import opytional as opyt
 import pandas as pd
 import typing
 
-from ._impl import rgetattr as _rgetattr
+from ._impl import make_alife_dataframe as _make_alife_dataframe
 
 
 def anytree_tree_to_alife_dataframe(
     tree: anytree.AnyNode,
     *,
+    ancestor_id_only: bool = False,
     progress_wrap: typing.Callable = lambda x, **_: x,
 ) -> pd.DataFrame:
     """Convert a anytree tree to a dataframe formatted to the
@@ -30,6 +31,9 @@ def anytree_tree_to_alife_dataframe(
     ----------
     tree:
         anytree tree to convert.
+    ancestor_id_only: bool, optional
+        Should we emit an integer `ancestor_id` column instead of
+        `ancestor_list`? Organisms with no ancestor list their own id.
     """
 
     # set up node origin times if any edge lengths set
@@ -56,22 +60,32 @@ def anytree_tree_to_alife_dataframe(
                 ):
                     node.origin_time = parent.origin_time + node.edge_length
 
-    # attach ids to nodes, if needed
-    for fallback_id, node in enumerate(anytree.LevelOrderIter(tree)):
+    # fill columns in one pass, attaching ids to nodes if needed
+    ids, parent_nodes = [], []
+    columns = {
+        column_name: []
+        for column_name in (
+            'edge_length', 'label', 'name', 'origin_time', 'taxon_label'
+        )
+    }
+    for fallback_id, node in enumerate(
+        progress_wrap(anytree.LevelOrderIter(tree)),
+    ):
         if not hasattr(node, 'id'):
             node.id = fallback_id
         else:
             assert isinstance(node.id, int)
+        ids.append(node.id)
+        parent_nodes.append(node.parent)
+        for column_name, values in columns.items():
+            values.append(getattr(node, column_name, None))
 
-    return pd.DataFrame.from_records([
-        {
-            'id': node.id,
-            'ancestor_list': f"[{opyt.apply_if(node.parent, lambda x: x.id)}]",
-            'edge_length': getattr(node, 'edge_length', None),
-            'label': getattr(node, 'label', None),
-            'name': getattr(node, 'name', None),
-            'origin_time': getattr(node, 'origin_time', None),
-            'taxon_label': getattr(node, 'taxon_label', None),
-        }
-        for node in progress_wrap(anytree.LevelOrderIter(tree))
-    ]).dropna(axis=1, how="all")
+    return _make_alife_dataframe(
+        ids,
+        [
+            id if parent is None else parent.id
+            for id, parent in zip(ids, parent_nodes)
+        ],
+        columns,
+        ancestor_id_only=ancestor_id_only,
+    ).dropna(axis=1, how="all")
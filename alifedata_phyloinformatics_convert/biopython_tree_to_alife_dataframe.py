@@ -7,6 +7,7 @@ import opytional as opyt
 import pandas as pd
 import typing
 
+from ._impl import make_alife_dataframe as _make_alife_dataframe
 from ._impl import rgetattr as _rgetattr
 
 
@@ -17,6 +18,7 @@ def biopython_tree_to_alife_dataframe(
         typing.Mapping[str, str],
     ]] = None,
     *,
+    ancestor_id_only: bool = False,
     progress_wrap: typing.Callable = lambda x, **_: x,
 ) -> pd.DataFrame:
     """Convert a biopython phylogenetic tree to a dataframe formatted to the
@@ -37,6 +39,9 @@ def biopython_tree_to_alife_dataframe(
         Clade attrs that should be copied as columns into the generated
         dataframe. If a map is provided, attr values in keys will be inserted
         into the dataframe with the corresponding value as the column name.
+    ancestor_id_only: bool, optional
+        Should we emit an integer `ancestor_id` column instead of
+        `ancestor_list`? Organisms with no ancestor list their own id.
     """
 
     # adapted from https://biopython.org/wiki/Phylo_cookbook
@@ -67,13 +72,6 @@ def biopython_tree_to_alife_dataframe(
                     clade.origin_time \
                         = parent.origin_time + clade.branch_length
 
-    # attach ids to clades, if needed
-    for fallback_id, clade in enumerate(tree.find_clades(order='preorder')):
-        if not hasattr(clade, 'id'):
-            clade.id = fallback_id
-        else:
-            assert isinstance(clade.id, int)
-
     assert not any((
         attr in (
             exportattrs.values()
@@ -82,23 +80,50 @@ def biopython_tree_to_alife_dataframe(
         )
         for attr in ('origin_time', 'id', 'branch_length', 'name')
     ))
-    return pd.DataFrame.from_records([
+    export_names = [
+        (
+            attr_name,
+            exportattrs[attr_name]
+            if isinstance(exportattrs, Mapping)
+            else attr_name,
+        )
+        for attr_name in opyt.or_value(exportattrs, [])
+    ]
+
+    # fill columns in one pass, attaching ids to clades if needed
+    ids, parent_nodes, origin_times, branch_lengths, names \
+        = [], [], [], [], []
+    export_values = [[] for __ in export_names]
+    for fallback_id, clade in enumerate(
+        progress_wrap(tree.find_clades(order='preorder')),
+    ):
+        if not hasattr(clade, 'id'):
+            clade.id = fallback_id
+        else:
+            assert isinstance(clade.id, int)
+        ids.append(clade.id)
+        parent_nodes.append(parents[clade])
+        origin_times.append(getattr(clade, 'origin_time', None))
+        branch_lengths.append(clade.branch_length)
+        names.append(clade.name)
+        for (attr_name, __), values in zip(export_names, export_values):
+            values.append(_rgetattr(clade, attr_name))
+
+    return _make_alife_dataframe(
+        ids,
+        [
+            id if parent is None else parent.id
+            for id, parent in zip(ids, parent_nodes)
+        ],
         {
+            'origin_time': origin_times,
+            'branch_length': branch_lengths,
+            'name': names,
             **{
-                'id': clade.id,
-                'ancestor_list': str(
-                    [opyt.apply_if(parents[clade], lambda x: x.id)]
-                ),
-                'origin_time': getattr(clade, 'origin_time', None),
-                'branch_length': clade.branch_length,
-                'name': clade.name,
-            },
-            **{
-                exportattrs[attr_name]
-                if isinstance(exportattrs, Mapping)
-                else attr_name: _rgetattr(clade, attr_name)
-                for attr_name in opyt.or_value(exportattrs, [])
+                column_name: values
+                for (__, column_name), values
+                in zip(export_names, export_values)
             },
-        }
-        for clade in progress_wrap(tree.find_clades(order='preorder'))
-    ])
+        },
+        ancestor_id_only=ancestor_id_only,
+    )
@@ -0,0 +1,63 @@
+from Bio import Phylo
+import dendropy
+import typing
+
+from ._impl import make_dendropy_tree as _make_dendropy_tree
+from ._impl import setup_origin_times as _setup_origin_times
+
+
+def biopython_tree_to_dendropy_tree(
+    tree: Phylo.BaseTree,
+    *,
+    progress_wrap: typing.Callable = lambda x, **_: x,
+) -> dendropy.Tree:
+    """Convert a biopython phylogenetic tree directly to a dendropy tree,
+    without constructing an intermediate alife standard dataframe.
+
+    Clade names are applied as taxon labels. Output matches conversion
+    through `biopython_tree_to_alife_dataframe`, exporting names as
+    `taxon_label`, and `alife_dataframe_to_dendropy_tree` with
+    `setup_edge_lengths`, except that `tree` is not modified. So, clade ids
+    and origin times carry over, and edge lengths are calculated from origin
+    times.
+
+    Parameters
+    ----------
+    tree:
+        biopython tree to convert.
+    """
+    # origin times are set up as by biopython exporter
+    has_branch_lengths = any(
+        clade.branch_length is not None for clade in tree.find_clades()
+    )
+
+    # fill columns in one preorder pass, so parents precede children
+    parent_index_of = {}
+    ids, parent_indices, origin_times, branch_lengths, is_derived, names \
+        = [], [], [], [], [], []
+    for fallback_id, clade in enumerate(
+        progress_wrap(tree.find_clades(order='preorder')),
+    ):
+        for child in clade:
+            parent_index_of[child] = len(ids)
+        ids.append(getattr(clade, 'id', fallback_id))
+        parent_indices.append(
+            -1 if clade is tree.root else parent_index_of[clade],
+        )
+        origin_times.append(getattr(clade, 'origin_time', None))
+        branch_lengths.append(clade.branch_length)
+        is_derived.append(
+            has_branch_lengths and not hasattr(clade, 'origin_time'),
+        )
+        names.append(clade.name)
+
+    return _make_dendropy_tree(
+        ids,
+        parent_indices,
+        _setup_origin_times(
+            parent_indices, origin_times, branch_lengths, is_derived,
+        ),
+        edge_lengths=[None] * len(ids),
+        labels=[None] * len(ids),
+        taxon_labels=names,
+    )
@@ -1,9 +1,13 @@
 import click
-import dendropy
-import pandas as pd
+import concurrent.futures
+import contextlib
+import glob
+import os
 
-from .alife_dataframe_to_dendropy_tree import alife_dataframe_to_dendropy_tree
-from .dendropy_tree_to_alife_dataframe import dendropy_tree_to_alife_dataframe
+from ._impl import open_compressed
+
+# conversion backends are imported within commands, so that help and usage
+# errors don't wait on them
 
 
 @click.group()
@@ -11,14 +15,50 @@ def cli():
     pass
 
 
+def _get_partial_path(output_path):
+    """Name temporary file to write `output_path` through, prefixed to keep
+    output extension, and with it compression."""
+    return os.path.join(
+        os.path.dirname(output_path),
+        f'.partial-{os.path.basename(output_path)}',
+    )
+
+
+@contextlib.contextmanager
+def _open_output(output_path, compression_threads):
+    """Open `output_path` for writing through a temporary file, moved into
+    place only once writing succeeds, so failed conversions leave existing
+    output untouched and are never taken as up to date."""
+    if output_path == '-':
+        with open_compressed(
+            output_path, 'w', threads=compression_threads,
+        ) as output_stream:
+            yield output_stream
+        return
+
+    partial_path = _get_partial_path(output_path)
+    try:
+        with open_compressed(
+            partial_path, 'w', threads=compression_threads,
+        ) as output_stream:
+            yield output_stream
+        os.replace(partial_path, output_path)
+    finally:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+
+
 @cli.command(
     help='convert standard alife phylogeny data to phloinformatics format',
 )
 @click.option(
     '--input-file',
     default='-',
-    help='phyloinformatics data file path; default stdin',
-    type=click.File('r'),
+    help=(
+        'phyloinformatics data file path; default stdin; '
+        'gzip, bz2, xz, and zstd compression detected'
+    ),
+    type=click.Path(exists=True, dir_okay=False, allow_dash=True),
 )
 @click.option(
     '--input-schema',
@@ -30,9 +70,12 @@ def cli():
 )
 @click.option(
     '--output-file',
-    help='alife data file path; default stdout',
+    help=(
+        'alife data file path; default stdout; gzip, bz2, xz, and zstd '
+        'compression applied by extension'
+    ),
     default='-',
-    type=click.File('w'),
+    type=click.Path(dir_okay=False, allow_dash=True),
 )
 @click.option(
     '--output-format',
@@ -44,22 +87,101 @@ def cli():
     default=False,
     help="Compress sequences of nodes with single descendants"
 )
+@click.option(
+    '--all-trees/--first-tree',
+    default=False,
+    help=(
+        'convert every tree in input, offsetting ids and adding a tree_index '
+        'column; default first tree only'
+    ),
+)
+@click.option(
+    '--max-workers',
+    default=1,
+    help='number of processes to parse multi-tree newick input with',
+    type=click.IntRange(min=1),
+)
+@click.option(
+    '--compression-threads',
+    default=1,
+    help='number of threads to compress zstd output with',
+    type=click.IntRange(min=1),
+)
 def toalifedata(
     input_file,
     input_schema,
     output_file,
     output_format,
     suppress_unifurcations,
+    all_trees,
+    max_workers,
+    compression_threads,
 ):
+    with open_compressed(input_file) as input_stream, _open_output(
+        output_file, compression_threads,
+    ) as output_stream:
+        _toalifedata(
+            input_stream,
+            input_schema,
+            output_stream,
+            output_format,
+            suppress_unifurcations,
+            all_trees,
+            max_workers,
+        )
 
-    tree = dendropy.Tree.get(
-        file=input_file,
-        schema=input_schema,
-    )
-    if suppress_unifurcations:
-        tree.suppress_unifurcations()
 
-    converted_df = dendropy_tree_to_alife_dataframe(tree)
+def _toalifedata(
+    input_file,
+    input_schema,
+    output_file,
+    output_format,
+    suppress_unifurcations,
+    all_trees,
+    max_workers,
+):
+    import dendropy
+
+    from ._impl import concat_alife_dataframes
+    from ._impl import mmap_file
+    from .dendropy_tree_to_alife_dataframe \
+        import dendropy_tree_to_alife_dataframe
+    from .newick_to_alife_dataframe import newick_to_alife_dataframe
+
+    # parse newick directly to dataframe, skipping dendropy
+    # and scanning input in place if it is a mappable file
+    if input_schema == 'newick' and not suppress_unifurcations:
+        with mmap_file(input_file) as mapped:
+            converted_df = newick_to_alife_dataframe(
+                input_file if mapped is None else mapped,
+                all_trees=all_trees,
+                max_workers=max_workers,
+            )
+    elif all_trees:
+        def convert(tree):
+            if suppress_unifurcations:
+                tree.suppress_unifurcations()
+            return dendropy_tree_to_alife_dataframe(
+                tree, ancestor_id_only=True,
+            )
+
+        converted_df = concat_alife_dataframes(
+            map(
+                convert,
+                dendropy.Tree.yield_from_files(
+                    [input_file], schema=input_schema,
+                ),
+            ),
+        )
+    else:
+        tree = dendropy.Tree.get(
+            file=input_file,
+            schema=input_schema,
+        )
+        if suppress_unifurcations:
+            tree.suppress_unifurcations()
+
+        converted_df = dendropy_tree_to_alife_dataframe(tree)
 
     {
         'csv': lambda file: converted_df.to_csv(file, index=False),
@@ -84,8 +206,11 @@ def toalifedata(
 @click.option(
     '--input-file',
     default='-',
-    help='alife data file path; default stdin',
-    type=click.File('r'),
+    help=(
+        'alife data file path; default stdin; gzip, bz2, xz, and zstd '
+        'compression detected'
+    ),
+    type=click.Path(exists=True, dir_okay=False, allow_dash=True),
 )
 @click.option(
     '--input-format',
@@ -94,9 +219,12 @@ def toalifedata(
 )
 @click.option(
     '--output-file',
-    help='phyloinformatics data file path; default stdout',
+    help=(
+        'phyloinformatics data file path; default stdout; '
+        'gzip, bz2, xz, and zstd compression applied by extension'
+    ),
     default='-',
-    type=click.File('w'),
+    type=click.Path(dir_okay=False, allow_dash=True),
 )
 @click.option(
     '--output-schema',
@@ -111,36 +239,93 @@ def toalifedata(
     default=False,
     help="Compress sequences of nodes with single descendants"
 )
+@click.option(
+    '--chunksize',
+    default=None,
+    help=(
+        'read csv input this many rows at a time, keeping only columns '
+        'needed for conversion; default read whole file'
+    ),
+    type=click.IntRange(min=1),
+)
+@click.option(
+    '--compression-threads',
+    default=1,
+    help='number of threads to compress zstd output with',
+    type=click.IntRange(min=1),
+)
 def fromalifedata(
     input_file,
     input_format,
     output_file,
     output_schema,
-    suppress_unifurcations
+    suppress_unifurcations,
+    chunksize,
+    compression_threads,
 ):
-    df = {
-        'csv': pd.read_csv,
-        'fwf': pd.read_fwf,
-        'json': pd.read_json,
-        'html': pd.read_html,
-        'excel': pd.read_excel,
-        'hdf': pd.read_hdf,
-        'feather': pd.read_feather,
-        'parquet': pd.read_parquet,
-        'orc': pd.read_orc,
-        'stata': pd.read_stata,
-        'sass': pd.read_sas,
-        'spss': pd.read_spss,
-        'pickle': pd.read_pickle,
-        'sql': pd.read_sql,
-        'gbq': pd.read_gbq,
-    }[input_format](
-        input_file,
-    )
+    if chunksize is not None and input_format != 'csv':
+        raise click.UsageError('--chunksize requires csv input format')
 
-    converted_tree = alife_dataframe_to_dendropy_tree(
-        df,
-        setup_edge_lengths=True,
+    with open_compressed(input_file) as input_stream, _open_output(
+        output_file, compression_threads,
+    ) as output_stream:
+        _fromalifedata(
+            input_stream,
+            input_format,
+            output_stream,
+            output_schema,
+            suppress_unifurcations,
+            chunksize,
+        )
+
+
+def _fromalifedata(
+    input_file,
+    input_format,
+    output_file,
+    output_schema,
+    suppress_unifurcations,
+    chunksize,
+):
+    from iterpop import iterpop as ip
+
+    from ._impl import CompactTree
+    from ._impl import read_alife_csv_chunked
+    from ._impl import read_alife_dataframe
+    from .alife_dataframe_to_dendropy_trees \
+        import _alife_dataframe_to_dendropy_trees
+    from .alife_dataframe_to_newick import _alife_dataframe_to_newick
+
+    if chunksize is not None:
+        df = read_alife_csv_chunked(input_file, chunksize)
+    else:
+        df = read_alife_dataframe(input_file, input_format)
+
+    # every output schema holds exactly one tree
+    compact_tree = CompactTree.from_alife_dataframe(df)
+    if len(compact_tree.roots) != 1:
+        raise click.ClickException(
+            f'{output_schema} output requires exactly one root, '
+            f'but input has {len(compact_tree.roots)}',
+        )
+
+    # serialize newick directly from dataframe, skipping dendropy
+    if output_schema == 'newick':
+        _alife_dataframe_to_newick(
+            df,
+            compact_tree,
+            output_file,
+            setup_edge_lengths=True,
+            suppress_unifurcations=suppress_unifurcations,
+        )
+        return
+
+    converted_tree = ip.popsingleton(
+        _alife_dataframe_to_dendropy_trees(
+            df,
+            compact_tree,
+            setup_edge_lengths=True,
+        ),
     )
 
     if suppress_unifurcations:
@@ -150,3 +335,175 @@ def fromalifedata(
         file=output_file,
         schema=output_schema,
     )
+
+
+@cli.group(
+    help=(
+        'convert many files at once with a pool of worker processes, '
+        'skipping up-to-date outputs'
+    ),
+)
+def batch():
+    pass
+
+
+_compression_extensions = ('.gz', '.bz2', '.xz', '.zst')
+
+
+def _get_batch_inputs(inputs):
+    """Expand each input directory to the files it contains and each input
+    glob to the files it matches, in sorted order."""
+    res = []
+    for input in inputs:
+        if os.path.isdir(input):
+            res.extend(sorted(
+                entry.path
+                for entry in os.scandir(input)
+                if entry.is_file() and not entry.name.startswith('.')
+            ))
+        else:
+            res.extend(sorted(
+                path
+                for path in glob.glob(input, recursive=True)
+                if os.path.isfile(path)
+            ))
+    return list(dict.fromkeys(res))  # drop duplicates, preserving order
+
+
+def _get_batch_output(input_path, output_dir, output_suffix):
+    """Name output for `input_path`, replacing its format and compression
+    extensions with `output_suffix`."""
+    stem = os.path.basename(input_path)
+    if stem.endswith(_compression_extensions):
+        stem = os.path.splitext(stem)[0]
+    stem = os.path.splitext(stem)[0]
+    return os.path.join(output_dir, stem + output_suffix)
+
+
+def _is_up_to_date(input_path, output_path):
+    return os.path.exists(output_path) and (
+        os.path.getmtime(output_path) >= os.path.getmtime(input_path)
+    )
+
+
+def _convert_file(command_name, input_path, output_path, kwargs):
+    """Run single-file command on `input_path`, writing `output_path`."""
+    cli.commands[command_name].callback(
+        input_file=input_path, output_file=output_path, **kwargs,
+    )
+
+
+def _make_batch_command(command, get_default_suffix):
+    """Set up batch counterpart to single-file `command`, sharing its
+    conversion options."""
+
+    def callback(inputs, output_dir, output_suffix, jobs, force, **kwargs):
+        output_suffix = output_suffix or get_default_suffix(kwargs)
+        conversions = {}
+        for input_path in _get_batch_inputs(inputs):
+            output_path = _get_batch_output(
+                input_path, output_dir, output_suffix,
+            )
+            if output_path in conversions:
+                raise click.UsageError(
+                    f'inputs {conversions[output_path]} and {input_path} '
+                    f'both convert to {output_path}',
+                )
+            conversions[output_path] = input_path
+
+        os.makedirs(output_dir, exist_ok=True)
+        pending = [
+            (input_path, output_path)
+            for output_path, input_path in conversions.items()
+            if force or not _is_up_to_date(input_path, output_path)
+        ]
+
+        failures = 0
+
+        def report(input_path, exception):
+            nonlocal failures
+            failures += 1
+            click.echo(
+                f'failed to convert {input_path}: {exception}', err=True,
+            )
+
+        if jobs == 1:
+            for input_path, output_path in pending:
+                try:
+                    _convert_file(
+                        command.name, input_path, output_path, kwargs,
+                    )
+                except Exception as e:
+                    report(input_path, e)
+        else:
+            with concurrent.futures.ProcessPoolExecutor(jobs) as executor:
+                futures = {
+                    executor.submit(
+                        _convert_file,
+                        command.name,
+                        input_path,
+                        output_path,
+                        kwargs,
+                    ): input_path
+                    for input_path, output_path in pending
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    if future.exception() is not None:
+                        report(futures[future], future.exception())
+
+        if failures:
+            raise click.ClickException(
+                f'{failures} of {len(pending)} conversions failed',
+            )
+
+    batch.add_command(click.Command(
+        command.name,
+        callback=callback,
+        help=f'{command.help}, for each input file, directory, or glob',
+        params=[
+            click.Argument(['inputs'], nargs=-1, required=True),
+            click.Option(
+                ['--output-dir'],
+                help='directory to write converted files to',
+                required=True,
+                type=click.Path(file_okay=False),
+            ),
+            click.Option(
+                ['--output-suffix'],
+                help=(
+                    'suffix replacing input file extensions in output file '
+                    'names, e.g., .csv.gz; default output format extension'
+                ),
+            ),
+            click.Option(
+                ['--jobs'],
+                default=1,
+                help=(
+                    'number of files to convert at once, in separate '
+                    'processes'
+                ),
+                type=click.IntRange(min=1),
+            ),
+            click.Option(
+                ['--force/--skip-up-to-date'],
+                default=False,
+                help=(
+                    'reconvert files whose outputs are newer than inputs; '
+                    'default skip them'
+                ),
+            ),
+            *(
+                param
+                for param in command.params
+                if param.name not in ('input_file', 'output_file')
+            ),
+        ],
+    ))
+
+
+_make_batch_command(
+    toalifedata, lambda kwargs: f'.{kwargs["output_format"]}',
+)
+_make_batch_command(
+    fromalifedata, lambda kwargs: f'.{kwargs["output_schema"]}',
+)
@@ -6,6 +6,7 @@ import opytional as opyt
 import pandas as pd
 import typing
 
+from ._impl import make_alife_dataframe as _make_alife_dataframe
 from ._impl import rgetattr as _rgetattr
 
 
@@ -16,6 +17,7 @@ def dendropy_tree_to_alife_dataframe(
         typing.Mapping[str, str],
     ]] = None,
     *,
+    ancestor_id_only: bool = False,
     progress_wrap: typing.Callable = lambda x, **_: x,
 ) -> pd.DataFrame:
     """Convert a dendropy phylogenetic tree to a dataframe formatted to the
@@ -37,6 +39,9 @@ def dendropy_tree_to_alife_dataframe(
         Node attrs that should be copied as columns into the generated
         dataframe. If a map is provided, attr values in keys will be inserted
         into the dataframe with the corresponding value as the column name.
+    ancestor_id_only: bool, optional
+        Should we emit an integer `ancestor_id` column instead of
+        `ancestor_list`? Organisms with no ancestor list their own id.
     """
 
     # set up node origin times if any edge lengths set
@@ -57,13 +62,6 @@ def dendropy_tree_to_alife_dataframe(
                 ) and not isanan(parent.origin_time):
                     node.origin_time = parent.origin_time + node.edge_length
 
-    # attach ids to nodes, if needed
-    for fallback_id, node in enumerate(tree):
-        if not hasattr(node, 'id'):
-            node.id = fallback_id
-        else:
-            assert isinstance(node.id, int)
-
     assert not any((
         attr in (
             exportattrs.values()
@@ -72,24 +70,50 @@ def dendropy_tree_to_alife_dataframe(
         )
         for attr in ('origin_time', 'id', 'edge_length', 'label', 'taxon.label')
     ))
-    return pd.DataFrame.from_records([
+    export_names = [
+        (
+            attr_name,
+            exportattrs[attr_name]
+            if isinstance(exportattrs, Mapping)
+            else attr_name,
+        )
+        for attr_name in opyt.or_value(exportattrs, [])
+    ]
+
+    # fill columns in one pass, attaching ids to nodes if needed
+    ids, parent_nodes, origin_times, edge_lengths, labels, taxon_labels \
+        = [], [], [], [], [], []
+    export_values = [[] for __ in export_names]
+    for fallback_id, node in enumerate(progress_wrap(tree)):
+        if not hasattr(node, 'id'):
+            node.id = fallback_id
+        else:
+            assert isinstance(node.id, int)
+        ids.append(node.id)
+        parent_nodes.append(node.parent_node)
+        origin_times.append(getattr(node, 'origin_time', None))
+        edge_lengths.append(node.edge_length)
+        labels.append(node.label)
+        taxon_labels.append(opyt.apply_if(node.taxon, lambda x: x.label))
+        for (attr_name, __), values in zip(export_names, export_values):
+            values.append(_rgetattr(node, attr_name))
+
+    return _make_alife_dataframe(
+        ids,
+        [
+            id if parent is None else parent.id
+            for id, parent in zip(ids, parent_nodes)
+        ],
         {
+            'origin_time': origin_times,
+            'edge_length': edge_lengths,
+            'label': labels,
+            'taxon_label': taxon_labels,
             **{
-                'id': node.id,
-                'ancestor_list': str(
-                    [opyt.apply_if(node.parent_node, lambda x: x.id)]
-                ),
-                'origin_time': getattr(node, 'origin_time', None),
-                'edge_length': node.edge_length,
-                'label': node.label,
-                'taxon_label': opyt.apply_if(node.taxon, lambda x: x.label),
-            },
-            **{
-                exportattrs[attr_name]
-                if isinstance(exportattrs, Mapping)
-                else attr_name: _rgetattr(node, attr_name)
-                for attr_name in opyt.or_value(exportattrs, [])
+                column_name: values
+                for (__, column_name), values
+                in zip(export_names, export_values)
             },
-        }
-        for node in progress_wrap(tree)
-    ])
+        },
+        ancestor_id_only=ancestor_id_only,
+    )
@@ -0,0 +1,79 @@
+import dendropy
+from nanto import nantonone
+import opytional as opyt
+import treeswift
+import typing
+
+from ._impl import complete_edge_lengths as _complete_edge_lengths
+from ._impl import setup_origin_times as _setup_origin_times
+from .alife_dataframe_to_treeswift_trees import _treeswift_Tree_with_root
+
+
+def dendropy_tree_to_treeswift_tree(
+    tree: dendropy.Tree,
+    *,
+    progress_wrap: typing.Callable = lambda x, **_: x,
+) -> treeswift.Tree:
+    """Convert a dendropy phylogenetic tree directly to a treeswift tree,
+    without constructing an intermediate alife standard dataframe.
+
+    Node ids, origin times, and edge lengths match conversion through
+    `dendropy_tree_to_alife_dataframe` and
+    `alife_dataframe_to_treeswift_tree` with `setup_edge_lengths`. As in
+    that route, dendropy node labels are applied as node labels. Unlike
+    that route, `tree` is not modified, and taxon labels do not fail
+    conversion. As treeswift has no taxa, taxon labels are applied as node
+    labels instead, for nodes without a label of their own.
+
+    Parameters
+    ----------
+    tree:
+        dendropy tree to convert.
+    """
+    # origin times are set up as by dendropy exporter
+    has_edge_lengths = any(node.edge_length is not None for node in tree)
+
+    # fill columns in one preorder pass, so parents precede children
+    node_indices = {}
+    ids, parent_indices, origin_times, edge_lengths, is_derived, labels \
+        = [], [], [], [], [], []
+    for fallback_id, node in enumerate(progress_wrap(tree)):
+        node_indices[node] = len(ids)
+        ids.append(getattr(node, 'id', fallback_id))
+        parent_indices.append(opyt.apply_if_or_value(
+            node.parent_node, node_indices.__getitem__, -1,
+        ))
+        origin_times.append(getattr(node, 'origin_time', None))
+        edge_lengths.append(node.edge_length)
+        is_derived.append(
+            has_edge_lengths and not hasattr(node, 'origin_time'),
+        )
+        labels.append(opyt.or_else(
+            node.label,
+            lambda: opyt.apply_if(node.taxon, lambda x: x.label),
+        ))
+
+    origin_times = [*map(nantonone, _setup_origin_times(
+        parent_indices, origin_times, edge_lengths, is_derived,
+    ))]
+    edge_lengths = _complete_edge_lengths(
+        ids, parent_indices, origin_times, edge_lengths,
+    )
+
+    nodes = []
+    for id, origin_time, edge_length, label in zip(
+        ids, origin_times, edge_lengths, labels,
+    ):
+        node = treeswift.Node(label=label)
+        node.id = id
+        node.origin_time = origin_time
+        opyt.apply_if(
+            opyt.apply_if(edge_length, float), node.set_edge_length,
+        )
+        nodes.append(node)
+
+    for node, parent_index in zip(nodes, parent_indices):
+        if parent_index >= 0:
+            nodes[parent_index].add_child(node)
+
+    return _treeswift_Tree_with_root(nodes[0])
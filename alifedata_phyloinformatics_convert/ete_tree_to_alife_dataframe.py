@@ -5,6 +5,7 @@ import pandas as pd
 import typing
 
 from ._impl import ete3
+from ._impl import make_alife_dataframe as _make_alife_dataframe
 from ._impl import rgetattr as _rgetattr
 
 
@@ -15,6 +16,7 @@ def ete_tree_to_alife_dataframe(
         typing.Mapping[str, str],
     ]] = None,
     *,
+    ancestor_id_only: bool = False,
     progress_wrap: typing.Callable = lambda x, **_: x,
 ) -> pd.DataFrame:
     """Convert a ete phylogenetic tree to a dataframe formatted to the
@@ -35,6 +37,9 @@ def ete_tree_to_alife_dataframe(
         Node attrs that should be copied as columns into the generated
         dataframe. If a map is provided, attr values in keys will be inserted
         into the dataframe with the corresponding value as the column name.
+    ancestor_id_only: bool, optional
+        Should we emit an integer `ancestor_id` column instead of
+        `ancestor_list`? Organisms with no ancestor list their own id.
     """
 
     # set up node origin times if any edge lengths set
@@ -54,13 +59,6 @@ def ete_tree_to_alife_dataframe(
                         origin_time=parent.origin_time + node.dist,
                     )
 
-    # attach ids to nodes, if needed
-    for fallback_id, node in enumerate(tree.traverse()):
-        if not hasattr(node, 'id'):
-            node.add_features(id=fallback_id)
-        else:
-            assert isinstance(node.id, int)
-
     assert not any((
         attr in (
             exportattrs.values()
@@ -69,22 +67,47 @@ def ete_tree_to_alife_dataframe(
         )
         for attr in ('origin_time', 'id', 'dist', 'name')
     ))
-    return pd.DataFrame.from_records([
+    export_names = [
+        (
+            attr_name,
+            exportattrs[attr_name]
+            if isinstance(exportattrs, Mapping)
+            else attr_name,
+        )
+        for attr_name in opyt.or_value(exportattrs, [])
+    ]
+
+    # fill columns in one pass, attaching ids to nodes if needed
+    ids, parent_nodes, origin_times, dists, names = [], [], [], [], []
+    export_values = [[] for __ in export_names]
+    for fallback_id, node in enumerate(progress_wrap(tree.traverse())):
+        if not hasattr(node, 'id'):
+            node.add_features(id=fallback_id)
+        else:
+            assert isinstance(node.id, int)
+        ids.append(node.id)
+        parent_nodes.append(node.up)
+        origin_times.append(getattr(node, 'origin_time', None))
+        dists.append(node.dist)
+        names.append(node.name)
+        for (attr_name, __), values in zip(export_names, export_values):
+            values.append(_rgetattr(node, attr_name))
+
+    return _make_alife_dataframe(
+        ids,
+        [
+            id if parent is None else parent.id
+            for id, parent in zip(ids, parent_nodes)
+        ],
         {
+            'origin_time': origin_times,
+            'dist': dists,
+            'name': names,
             **{
-                'id': node.id,
-                'ancestor_list':
-                    str([opyt.apply_if(node.up, lambda x: x.id)]),
-                'origin_time': getattr(node, 'origin_time', None),
-                'dist': node.dist,
-                'name': node.name,
-            },
-            **{
-                exportattrs[attr_name]
-                if isinstance(exportattrs, Mapping)
-                else attr_name: _rgetattr(node, attr_name)
-                for attr_name in opyt.or_value(exportattrs, [])
+                column_name: values
+                for (__, column_name), values
+                in zip(export_names, export_values)
             },
-        }
-        for node in progress_wrap(tree.traverse())
-    ])
+        },
+        ancestor_id_only=ancestor_id_only,
+    )
@@ -0,0 +1,53 @@
+import dendropy
+import typing
+
+from ._impl import ete3
+from ._impl import make_dendropy_tree as _make_dendropy_tree
+from ._impl import setup_origin_times as _setup_origin_times
+
+
+def ete_tree_to_dendropy_tree(
+    tree: typing.Union[ete3.Tree, ete3.TreeNode],
+    *,
+    progress_wrap: typing.Callable = lambda x, **_: x,
+) -> dendropy.Tree:
+    """Convert an ete phylogenetic tree directly to a dendropy tree, without
+    constructing an intermediate alife standard dataframe.
+
+    Output matches conversion through `ete_tree_to_alife_dataframe` and
+    `alife_dataframe_to_dendropy_tree` with `setup_edge_lengths`, except
+    that `tree` is not modified. So, node ids and origin times carry over,
+    and edge lengths are calculated from origin times.
+
+    Parameters
+    ----------
+    tree:
+        ete tree to convert.
+    """
+    # origin times are set up as by ete exporter, which derives them from
+    # dists of leaves only
+    has_dists = any(leaf.dist != 1.0 for leaf in tree)
+
+    # fill columns in one level order pass, so parents precede children
+    node_indices = {}
+    ids, parent_indices, origin_times, dists, is_derived \
+        = [], [], [], [], []
+    for fallback_id, node in enumerate(progress_wrap(tree.traverse())):
+        node_indices[node] = len(ids)
+        ids.append(getattr(node, 'id', fallback_id))
+        parent_indices.append(-1 if node is tree else node_indices[node.up])
+        origin_times.append(getattr(node, 'origin_time', None))
+        dists.append(node.dist)
+        is_derived.append(
+            has_dists and not hasattr(node, 'origin_time')
+            and (node is tree or node.is_leaf()),
+        )
+
+    return _make_dendropy_tree(
+        ids,
+        parent_indices,
+        _setup_origin_times(parent_indices, origin_times, dists, is_derived),
+        edge_lengths=[None] * len(ids),
+        labels=[None] * len(ids),
+        taxon_labels=[None] * len(ids),
+    )
@@ -0,0 +1,83 @@
+import dendropy
+from nanto import nantonone
+import networkx as nx
+import numbers
+import opytional as opyt
+import typing
+
+from ._impl import make_dendropy_tree as _make_dendropy_tree
+
+
+def networkx_digraph_to_dendropy_tree(
+    graph: nx.DiGraph,
+    *,
+    progress_wrap: typing.Callable = lambda x, **_: x,
+) -> typing.Optional[dendropy.Tree]:
+    """Convert a networkx digraph, with edges directed from child to parent,
+    directly to a dendropy tree, without constructing an intermediate alife
+    standard dataframe.
+
+    Returns None if graph is empty. If two or more clades exist that do not
+    share a common ancestor, ValueError will be raised.
+
+    Output matches conversion through `networkx_digraph_to_alife_dataframe`
+    and `alife_dataframe_to_dendropy_tree` with `setup_edge_lengths`. So,
+    node attributes `edge_length`, `label`, `origin_time`, and `taxon_label`
+    carry over, falling back to attributes of the edge to the node's parent.
+    Missing edge lengths are calculated from origin times. If nodes are not
+    all non-negative integers, they are numbered in order and applied as
+    labels.
+
+    Parameters
+    ----------
+    graph:
+        networkx graph to convert.
+    """
+    if len(graph.nodes) == 0:
+        return None
+
+    is_relabeled = not all(
+        isinstance(x, numbers.Integral) and x >= 0 for x in graph.nodes
+    )
+    if is_relabeled:
+        assert not any("label" in data for __, data in graph.nodes(data=True))
+
+    # nodes are positioned in graph order, which orders siblings as
+    # networkx exporter does
+    node_indices = {node: index for index, node in enumerate(graph.nodes)}
+    ids, parent_indices, origin_times, edge_lengths, labels, taxon_labels \
+        = [], [], [], [], [], []
+    for index, (node, attrs) in enumerate(
+        progress_wrap(graph.nodes(data=True)),
+    ):
+        parent_edges = [*graph.out_edges(node, data=True)]
+        if len(parent_edges) > 1:
+            raise ValueError(
+                f"Node {node} has multiple parents, so graph cannot be "
+                "represented as a tree.",
+            )
+        __, parent, edge_data = next(iter(parent_edges), (None, None, {}))
+
+        def get_attr(attr: str) -> typing.Any:
+            return nantonone(
+                opyt.or_else(attrs.get(attr), lambda: edge_data.get(attr)),
+            )
+
+        ids.append(index if is_relabeled else node)
+        parent_indices.append(
+            opyt.apply_if_or_value(parent, node_indices.__getitem__, -1),
+        )
+        origin_times.append(get_attr("origin_time"))
+        edge_lengths.append(get_attr("edge_length"))
+        labels.append(node if is_relabeled else get_attr("label"))
+        taxon_labels.append(get_attr("taxon_label"))
+
+    num_roots = parent_indices.count(-1)
+    if num_roots != 1:
+        raise ValueError(
+            f"Graph must have exactly one root, but has {num_roots}.",
+        )
+
+    return _make_dendropy_tree(
+        ids, parent_indices, origin_times, edge_lengths, labels, taxon_labels,
+    )
@@ -0,0 +1,58 @@
+import mmap
+import pandas as pd
+import typing
+
+from ._impl import concat_alife_dataframes as _concat_alife_dataframes
+from .newick_to_alife_dataframes import newick_to_alife_dataframes
+
+
+def newick_to_alife_dataframe(
+    newick: typing.Union[str, typing.IO, bytes, mmap.mmap],
+    *,
+    ancestor_id_only: bool = False,
+    all_trees: bool = False,
+    max_workers: typing.Optional[int] = 1,
+) -> pd.DataFrame:
+    """Parse the first tree in Newick data to a dataframe formatted to the
+    artificial life community data format standards, without constructing
+    intermediate tree objects.
+
+    Output matches that of `dendropy_tree_to_alife_dataframe` over the tree
+    read by `dendropy.Tree.get` with default settings. Raises ValueError if
+    data contains no trees. Unless `all_trees` is set, trees after the first
+    are not read.
+
+    Parameters
+    ----------
+    newick:
+        Newick data as a string, a text stream, or a UTF-8 encoded buffer.
+        See `newick_to_alife_dataframes`.
+    ancestor_id_only: bool, optional
+        Should we emit an integer `ancestor_id` column instead of
+        `ancestor_list`? Organisms with no ancestor list their own id.
+    all_trees: bool, optional
+        Should we combine all trees into the returned dataframe? If so, ids
+        of each tree are offset past those of preceding trees and a
+        `tree_index` column is added.
+    max_workers: int, optional
+        Number of worker processes to parse trees with, if `all_trees` is
+        set. See `newick_to_alife_dataframes`.
+
+    See Also
+    ----------
+    newick_to_alife_dataframes
+    """
+    if all_trees:
+        return _concat_alife_dataframes(
+            newick_to_alife_dataframes(
+                newick, ancestor_id_only=True, max_workers=max_workers,
+            ),
+            ancestor_id_only=ancestor_id_only,
+        )
+
+    for df in newick_to_alife_dataframes(
+        newick, ancestor_id_only=ancestor_id_only,
+    ):
+        return df
+
+    raise ValueError("No trees available in Newick data.")
@@ -0,0 +1,293 @@
+import codecs
+import collections
+import concurrent.futures
+import io
+import mmap
+import os
+import typing
+
+import pandas as pd
+
+from ._impl import iter_newick_buffer_tokens as _iter_newick_buffer_tokens
+from ._impl import iter_newick_statements as _iter_newick_statements
+from ._impl import iter_newick_tokens as _iter_newick_tokens
+from ._impl import make_alife_dataframe as _make_alife_dataframe
+
+
+class _NewickTree(typing.NamedTuple):
+    """Per-node columns of a parsed Newick tree, in preorder."""
+
+    parents: typing.List[int]
+    edge_lengths: typing.List[typing.Optional[float]]
+    labels: typing.List[typing.Optional[str]]
+    taxon_labels: typing.List[typing.Optional[str]]
+
+
+def _parse_newick_tree(
+    tokens: typing.Iterator[typing.Tuple[str, bool]],
+    taxa: typing.Dict[str, str],
+) -> typing.Optional[_NewickTree]:
+    """Parse next tree statement from `tokens`, returning None if tokens are
+    exhausted.
+
+    Grammar and blank node handling follow dendropy's Newick reader. Nodes
+    are numbered in creation order, which is preorder, and the root lists
+    itself as parent. Leaf labels are looked up case insensitively in `taxa`,
+    which maps lowercased labels to their first-seen spelling and is shared
+    across trees. Raises ValueError on malformed input.
+    """
+
+    # end of tokens is flagged by a None delimiter, which is malformed
+    # wherever it can be encountered within a tree statement
+    end = (None, True)
+    token, is_delimiter = next(tokens, end)
+    while is_delimiter and token == ";":
+        token, is_delimiter = next(tokens, end)
+    if token is None:
+        return None
+
+    tree = _NewickTree([0], [None], [None], [None])
+    parents, edge_lengths, labels, taxon_labels = tree
+
+    def add_node(parent: int) -> int:
+        parents.append(parent)
+        edge_lengths.append(None)
+        labels.append(None)
+        taxon_labels.append(None)
+        return len(parents) - 1
+
+    seen_taxa = set()
+    # open nodes, with node index, whether a child has been parsed, and
+    # number of tokens handled for children
+    stack = []
+    node, is_internal = 0, False
+    if is_delimiter and token == "(":
+        token, is_delimiter = next(tokens, end)
+        stack.append([node, False, 0])
+
+    while True:
+        if stack and node == stack[-1][0]:
+            # parse children of open node
+            frame = stack[-1]
+            if is_delimiter and token == ",":
+                if not frame[1]:
+                    add_node(node)  # blank node preceding comma
+                token, is_delimiter = next(tokens, end)
+                while is_delimiter and token == ",":
+                    add_node(node)
+                    token, is_delimiter = next(tokens, end)
+                if not frame[1] and is_delimiter and token == ")":
+                    add_node(node)
+                    frame[1] = True
+                frame[2] += 1
+                continue
+            elif is_delimiter and token == ")":
+                if frame[2] == 0:
+                    add_node(node)  # unnamed unifurcation
+                token, is_delimiter = next(tokens, end)
+                stack.pop()
+                is_internal = True
+            else:
+                frame[1] = True
+                frame[2] += 1
+                node = add_node(node)
+                if is_delimiter and token == "(":
+                    token, is_delimiter = next(tokens, end)
+                    stack.append([node, False, 0])
+                    continue
+                is_internal = False
+
+        # parse edge length and label of closed node
+        label_parsed = False
+        while True:
+            if not is_delimiter:
+                if label_parsed:
+                    raise ValueError(
+                        f"Expected ':', ')', ',' or ';' after Newick label "
+                        f"but found '{token}'.",
+                    )
+                elif is_internal:
+                    labels[node] = token
+                else:
+                    key = token.lower()
+                    if key in seen_taxa:
+                        raise ValueError(
+                            f"Duplicate taxon '{token}' in Newick tree.",
+                        )
+                    seen_taxa.add(key)
+                    taxon_labels[node] = taxa.setdefault(key, token)
+                label_parsed = True
+                token, is_delimiter = next(tokens, end)
+            elif token == ":":
+                token, is_delimiter = next(tokens, end)
+                try:
+                    edge_lengths[node] = float(token)
+                except (TypeError, ValueError):
+                    raise ValueError(
+                        "Unexpected end of Newick source."
+                        if token is None
+                        else f"Invalid Newick edge length '{token}'.",
+                    ) from None
+                token, is_delimiter = next(tokens, end)
+            elif token is None:
+                raise ValueError("Unexpected end of Newick source.")
+            elif token in ",)":
+                if not stack:
+                    raise ValueError(
+                        f"Unexpected '{token}' in Newick tree statement.",
+                    )
+                node = stack[-1][0]
+                break
+            elif token == ";":
+                if stack:
+                    raise ValueError(
+                        "Unbalanced parentheses in Newick tree statement.",
+                    )
+                return tree
+            else:
+                raise ValueError("Malformed Newick tree statement.")
+
+
+def _newick_tree_to_alife_dataframe(
+    tree: _NewickTree,
+    ancestor_id_only: bool = False,
+) -> pd.DataFrame:
+    """Assemble alife standard dataframe from parsed Newick tree columns,
+    matching `dendropy_tree_to_alife_dataframe` output."""
+    parents, edge_lengths, labels, taxon_labels = tree
+
+    # set up node origin times if any edge lengths set, as dendropy exporter
+    origin_times = [None] * len(parents)
+    if any(edge_length is not None for edge_length in edge_lengths):
+        origin_times[0] = 0 if edge_lengths[0] is None else edge_lengths[0]
+        for node in range(1, len(parents)):
+            parent_origin_time = origin_times[parents[node]]
+            if (
+                parent_origin_time is not None
+                and edge_lengths[node] is not None
+                and parent_origin_time == parent_origin_time  # not NaN
+            ):
+                origin_times[node] = parent_origin_time + edge_lengths[node]
+
+    return _make_alife_dataframe(
+        range(len(parents)),
+        parents,
+        {
+            'origin_time': origin_times,
+            'edge_length': edge_lengths,
+            'label': labels,
+            'taxon_label': taxon_labels,
+        },
+        ancestor_id_only=ancestor_id_only,
+    )
+
+
+def _parse_newick_statements(
+    newick: str,
+    ancestor_id_only: bool,
+) -> typing.List[pd.DataFrame]:
+    """Parse all trees in `newick`, for use as worker process task."""
+    return [*newick_to_alife_dataframes(
+        newick, ancestor_id_only=ancestor_id_only,
+    )]
+
+
+def _unify_taxon_labels(
+    dfs: typing.Iterable[pd.DataFrame],
+    taxa: typing.Dict[str, str],
+) -> typing.Iterator[pd.DataFrame]:
+    """Respell taxon labels parsed separately to match their first-seen
+    spelling in `taxa`, which maps lowercased labels and is updated."""
+    for df in dfs:
+        labels = df['taxon_label']
+        respellings = {}
+        for label in labels.dropna().unique().tolist():
+            spelling = taxa.setdefault(label.lower(), label)
+            if spelling != label:
+                respellings[label] = spelling
+        if respellings:
+            df['taxon_label'] = labels.replace(respellings)
+        yield df
+
+
+def newick_to_alife_dataframes(
+    newick: typing.Union[str, typing.IO, bytes, mmap.mmap],
+    *,
+    ancestor_id_only: bool = False,
+    chunk_size: int = 1 << 20,
+    max_workers: typing.Optional[int] = 1,
+) -> typing.Iterator[pd.DataFrame]:
+    """Parse each tree in Newick data to a dataframe formatted to the
+    artificial life community data format standards, without constructing
+    intermediate tree objects.
+
+    Trees are yielded one at a time, in order, as they are read, so memory
+    use is bounded by the largest tree. Quoted labels, comments, and files
+    with multiple trees are supported. Output matches that of
+    `dendropy_tree_to_alife_dataframe` over trees read by dendropy's Newick
+    reader with default settings, with taxon labels matched case
+    insensitively across trees. Raises ValueError on malformed input.
+
+    Parameters
+    ----------
+    newick:
+        Newick data as a string, a text stream, or a UTF-8 encoded buffer.
+        Buffers, such as a memory-mapped file, are scanned in place.
+    ancestor_id_only: bool, optional
+        Should we emit an integer `ancestor_id` column instead of
+        `ancestor_list`? Organisms with no ancestor list their own id.
+    chunk_size: int, optional
+        Number of characters to read from stream at a time. With multiple
+        workers, also the minimum amount of text handed to each task.
+    max_workers: int, optional
+        Number of worker processes to parse trees with. If 1, trees are
+        parsed in the calling process. If None, one worker is used per
+        processor. Text is split between tree statements in the calling
+        process, so multiple workers only help for multi-tree data.
+
+    See Also
+    ----------
+    newick_to_alife_dataframe
+    """
+    is_buffer = isinstance(newick, (bytes, bytearray, memoryview, mmap.mmap))
+    if max_workers == 1:
+        tokens = (
+            _iter_newick_buffer_tokens(newick)
+            if is_buffer
+            else _iter_newick_tokens(
+                io.StringIO(newick) if isinstance(newick, str) else newick,
+                chunk_size=chunk_size,
+            )
+        )
+        taxa = {}
+        while True:
+            tree = _parse_newick_tree(tokens, taxa)
+            if tree is None:
+                return
+            yield _newick_tree_to_alife_dataframe(
+                tree, ancestor_id_only=ancestor_id_only,
+            )
+
+    if isinstance(newick, str):
+        stream = io.StringIO(newick)
+    elif is_buffer:
+        stream = codecs.getreader("utf-8")(
+            newick if isinstance(newick, mmap.mmap) else io.BytesIO(newick),
+        )
+    else:
+        stream = newick
+
+    # keep a bounded window of tasks in flight, collecting results in order
+    max_pending = 2 * (max_workers or os.cpu_count() or 1)
+    pending = collections.deque()
+    taxa = {}
+    with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+        for statements in _iter_newick_statements(stream, chunk_size):
+            pending.append(executor.submit(
+                _parse_newick_statements, statements, ancestor_id_only,
+            ))
+            if len(pending) >= max_pending:
+                results = pending.popleft().result()
+                yield from _unify_taxon_labels(results, taxa)
+        for future in pending:
+            yield from _unify_taxon_labels(future.result(), taxa)
@@ -1,8 +1,7 @@
-import tempfile
-
 import pandas as pd
 
 from ._impl import phytrack_Systematics
+from ._impl import ram_temporary_file as _ram_temporary_file
 
 
 def phylotrack_systematics_to_alife_dataframe(
@@ -16,7 +15,7 @@ def phylotrack_systematics_to_alife_dataframe(
     systematics:
         The phylotrackpy Systematics object to convert.
     """
-    with tempfile.NamedTemporaryFile() as tmp:
+    with _ram_temporary_file(suffix=".csv") as tmp:
         systematics.snapshot(tmp.name)
         res = pd.read_csv(tmp.name)
         res["ancestor_list"].replace('["NONE"]', "[None]", inplace=True)
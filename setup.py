@@ -61,6 +61,7 @@ setup(
     install_requires=requirements,
     extras_require={
         'test': test_requirements,
+        'zstd': ['zstandard>=0.15'],
         'docs': ['sphinx', 'alabaster', 'twine==1.14.0', 'mkdocs==1.2.3', 'jinja2==3.0.0', 'pypandoc_binary'],
     },
     license="MIT license",
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+
+'''
+`CompactTree` tests for `alifedata-phyloinformatics-convert` package.
+'''
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from alifedata_phyloinformatics_convert._impl import CompactTree
+
+
+def _children(compact_tree, index):
+    return compact_tree.children[
+        compact_tree.child_offsets[index]:compact_tree.child_offsets[index + 1]
+    ].tolist()
+
+
+def test_topology():
+    compact_tree = CompactTree.from_alife_dataframe(
+        pd.DataFrame({
+            "id": [7, 3, 9, 1, 4],
+            "ancestor_list": ["[none]", "[7]", "[7]", "[3]", "[7]"],
+        }),
+    )
+
+    assert len(compact_tree) == 5
+    assert compact_tree.ids.tolist() == [7, 3, 9, 1, 4]
+    assert compact_tree.ancestor_ids.tolist() == [7, 7, 7, 3, 7]
+    assert compact_tree.parent_index.tolist() == [-1, 0, 0, 1, 0]
+    assert compact_tree.roots.tolist() == [0]
+
+    # children are listed in row order
+    assert compact_tree.child_offsets.tolist() == [0, 3, 4, 4, 4, 4]
+    assert compact_tree.children.tolist() == [1, 2, 4, 3]
+    assert _children(compact_tree, 0) == [1, 2, 4]
+    assert _children(compact_tree, 1) == [3]
+    assert all(_children(compact_tree, index) == [] for index in (2, 3, 4))
+
+    assert compact_tree.to_dict_of_lists() == {
+        7: [], 3: [7], 9: [7], 1: [3], 4: [7],
+    }
+
+
+def test_ancestor_id():
+    compact_tree = CompactTree.from_alife_dataframe(
+        pd.DataFrame({
+            "id": [0, 1, 2, 5],
+            "ancestor_id": [0, 0, 1, 5],
+        }),
+    )
+
+    assert compact_tree.parent_index.tolist() == [-1, 0, 1, -1]
+    assert compact_tree.roots.tolist() == [0, 3]
+    assert compact_tree.child_offsets.tolist() == [0, 1, 2, 2, 2]
+    assert compact_tree.children.tolist() == [1, 2]
+
+
+def test_missing_ancestor():
+    compact_tree = CompactTree.from_alife_dataframe(
+        pd.DataFrame({
+            "id": [0, 1, 2],
+            "ancestor_list": ["[None]", "[8]", "[1]"],
+        }),
+    )
+
+    # rows whose ancestor is absent have no parent, but are not roots
+    assert compact_tree.parent_index.tolist() == [-1, -1, 1]
+    assert compact_tree.roots.tolist() == [0]
+    assert compact_tree.child_offsets.tolist() == [0, 0, 1, 1]
+    assert compact_tree.children.tolist() == [2]
+
+
+def test_empty():
+    compact_tree = CompactTree.from_alife_dataframe(
+        pd.DataFrame({
+            "id": np.array([], dtype=int),
+            "ancestor_list": np.array([], dtype=str),
+        }),
+    )
+
+    assert len(compact_tree) == 0
+    assert compact_tree.roots.tolist() == []
+    assert compact_tree.child_offsets.tolist() == [0]
+    assert compact_tree.children.tolist() == []
+
+
+def test_from_parent_indices():
+    compact_tree = CompactTree.from_parent_indices(
+        np.array([7, 3, 9, 1, 4]),
+        np.array([-1, 0, 0, 1, 0]),
+    )
+
+    assert compact_tree.ancestor_ids.tolist() == [7, 7, 7, 3, 7]
+    assert compact_tree.parent_index.tolist() == [-1, 0, 0, 1, 0]
+    assert compact_tree.roots.tolist() == [0]
+    assert compact_tree.child_offsets.tolist() == [0, 3, 4, 4, 4, 4]
+    assert compact_tree.children.tolist() == [1, 2, 4, 3]
+
+
+def test_multiple_ancestors():
+    with pytest.raises(ValueError):
+        CompactTree.from_alife_dataframe(
+            pd.DataFrame({
+                "id": [0, 1, 2],
+                "ancestor_list": ["[None]", "[0]", "[0,1]"],
+            }),
+        )
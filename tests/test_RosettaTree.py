@@ -5,14 +5,17 @@
 """
 
 from contextlib import redirect_stdout
+import gc
 import io
 from os.path import dirname, realpath
 import pathlib
 import tempfile
+import weakref
 
 import anytree
 from Bio import Phylo as BioPhylo
 import dendropy as dp
+import ete3
 import networkx as nx
 import pandas as pd
 import pytest
@@ -77,6 +80,110 @@ def test_anytree_simple_tree_invalid():
     apc.RosettaTree(expected_df, validate="ignore")
 
 
+@pytest.mark.parametrize("ids", [[0, 1, 2, 1], [0, 1111, 2222, 1111]])
+def test_duplicate_ids_invalid(ids):
+    df = pd.DataFrame(
+        {
+            "id": ids,
+            "ancestor_list": ["[None]", f"[{ids[0]}]", "[None]", "[None]"],
+        }
+    )
+    with pytest.raises(ValueError):
+        apc.RosettaTree(df, validate="error")
+
+
+@pytest.mark.parametrize("validate_mode", ["schema", "sample", "full"])
+def test_validate_mode(validate_mode):
+    valid_df = pd.DataFrame(
+        {
+            "id": [0, 1, 2, 3],
+            "ancestor_list": ["[None]", "[0]", "[0]", "[1]"],
+        }
+    )
+    rosetta_tree = apc.RosettaTree(
+        valid_df,
+        validate="error",
+        validate_mode=validate_mode,
+        validate_sample_frac=0.5,
+    )
+    assert "schema" in rosetta_tree.validation_timings
+    assert ("ancestors" in rosetta_tree.validation_timings) \
+        == (validate_mode != "schema")
+
+    invalid_df = valid_df.assign(id=[0.0, 1.0, 2.0, 3.0])
+    with pytest.raises(ValueError):
+        apc.RosettaTree(
+            invalid_df, validate="error", validate_mode=validate_mode
+        )
+
+
+def test_sexual():
+    original_df = pd.DataFrame(
+        {
+            "id": [0, 1, 7, 9],
+            "ancestor_list": ["[None]", "[None]", "[1,0]", "[1,7]"],
+        }
+    )
+    rosetta_tree = apc.RosettaTree(original_df)
+
+    converted_tree = rosetta_tree.as_networkx
+    assert set(converted_tree.edges) == {(7, 1), (7, 0), (9, 1), (9, 7)}
+    with pytest.raises(ValueError):
+        rosetta_tree.as_dendropy
+
+
+def test_sexual_validate():
+    valid_df = pd.DataFrame(
+        {
+            "id": [0, 1, 7, 9],
+            "ancestor_list": ["[None]", "[none]", "[1,0]", "[1, 7]"],
+        }
+    )
+    apc.RosettaTree(valid_df, validate="error")
+
+    invalid_df = valid_df.assign(
+        ancestor_list=["[None]", "[none]", "[1,0]", "[1,8]"],
+    )
+    with pytest.raises(ValueError):
+        apc.RosettaTree(invalid_df, validate="error")
+    with pytest.warns(UserWarning, match="not a subset of id values"):
+        apc.RosettaTree(invalid_df, validate="warn")
+
+
+@pytest.mark.parametrize(
+    "ancestor_list",
+    ["[0,-1]", "[0,,1]", "[,1]", "[1,]", "[1;0]", "[0,1-]", "[0,1a]"],
+)
+def test_sexual_validate_malformed(ancestor_list):
+    invalid_df = pd.DataFrame(
+        {
+            "id": [0, 1, 7, 9],
+            "ancestor_list": ["[None]", "[none]", "[1,0]", ancestor_list],
+        }
+    )
+    with pytest.raises(ValueError):
+        apc.RosettaTree(invalid_df, validate="error")
+    with pytest.warns(UserWarning):
+        apc.RosettaTree(invalid_df, validate="warn")
+
+
+@pytest.mark.parametrize(
+    "ancestor_list", ["[0,None]", "[NONE,0]", "[0,none,1]", "[0,abc]"],
+)
+def test_sexual_validate_placeholders(ancestor_list):
+    valid_df = pd.DataFrame(
+        {
+            "id": [0, 1, 7, 9],
+            "ancestor_list": ["[None]", "[none]", "[1,0]", ancestor_list],
+        }
+    )
+    apc.RosettaTree(valid_df, validate="error")
+    assert apc.alife_dataframe_to_dict_of_lists(valid_df)[9] == [
+        int(token) for token in ancestor_list[1:-1].split(",")
+        if token.isdigit()
+    ]
+
+
 @pytest.mark.parametrize(
     "original_df",
     [
@@ -663,6 +770,41 @@ def test_from_newick():
     assert apc.RosettaTree.from_newick(data).to_newick() == expected
 
 
+def test_from_local_newick():
+    path = pathlib.Path(
+        f"{dirname(realpath(__file__))}/assets/APG_Angiosperms.newick",
+    )
+    data = path.read_text()
+    expected = apc.RosettaTree(
+        dp.Tree.get(data=data, schema="newick"),
+    ).to_newick()
+
+    assert apc.RosettaTree.from_newick(path).to_newick() == expected
+    assert apc.RosettaTree.from_newick(data).to_newick() == expected
+    with open(path) as file:
+        assert apc.RosettaTree.from_newick(file).to_newick() == expected
+
+
+@pytest.mark.parametrize("schema", ["newick", "nexus"])
+@pytest.mark.parametrize("as_alife", [False, True])
+def test_iter_from_schema(schema, as_alife):
+    tree_list = dp.TreeList.get(
+        data="((A:1,B:2)n:3,C)r; (A,(B,C)x):1; ((A,C),'B');",
+        schema="newick",
+    )
+    data = tree_list.as_string(schema=schema)
+
+    trees = list(
+        apc.RosettaTree.iter_from_schema(schema, data, as_alife=as_alife),
+    )
+    assert len(trees) == len(tree_list) == 3
+    for tree, expected_tree in zip(trees, tree_list):
+        pd.testing.assert_frame_equal(
+            tree if as_alife else tree.as_alife,
+            apc.dendropy_tree_to_alife_dataframe(expected_tree),
+        )
+
+
 def test_from_nexml():
     path = pathlib.Path(
         f"{dirname(realpath(__file__))}/assets/pythonidae.annotated.nexml",
@@ -699,3 +841,171 @@ def test_from_nexus():
     assert apc.RosettaTree.from_nexus(url).to_nexus() == expected
     assert apc.RosettaTree.from_nexus(str(url)).to_nexus() == expected
     assert apc.RosettaTree.from_nexus(data).to_nexus() == expected
+
+
+def test_cache():
+    original_df = pd.read_csv(
+        f"{dirname(realpath(__file__))}/assets/alifedata.csv",
+    )
+    rosetta_tree = apc.RosettaTree(original_df, cache_size=1)
+    dendropy_tree = rosetta_tree.as_dendropy
+    assert rosetta_tree.as_dendropy is dendropy_tree
+
+    # least recently used conversion is evicted
+    networkx_digraph = rosetta_tree.as_networkx
+    assert rosetta_tree.as_networkx is networkx_digraph
+    assert rosetta_tree.as_dendropy is not dendropy_tree
+
+    rosetta_tree.clear_cache()
+    assert rosetta_tree.as_networkx is not networkx_digraph
+
+    uncached_tree = apc.RosettaTree(original_df, cache_size=0)
+    assert uncached_tree.as_dendropy is not uncached_tree.as_dendropy
+
+
+def test_cache_releases_instance():
+    original_df = pd.read_csv(
+        f"{dirname(realpath(__file__))}/assets/alifedata.csv",
+    )
+    rosetta_tree = apc.RosettaTree(original_df)
+    rosetta_tree.as_dendropy
+    rosetta_tree.as_networkx
+
+    ref = weakref.ref(rosetta_tree)
+    del rosetta_tree
+    gc.collect()
+    assert ref() is None
+
+
+@pytest.mark.parametrize("retain_source", ["strong", "weak", "none"])
+def test_retain_source(retain_source):
+    original_df = pd.read_csv(
+        f"{dirname(realpath(__file__))}/assets/alifedata.csv",
+    )
+    dendropy_tree = apc.alife_dataframe_to_dendropy_tree(
+        original_df, setup_edge_lengths=True,
+    )
+    rosetta_tree = apc.RosettaTree(dendropy_tree, retain_source=retain_source)
+    # conversion to alife format is deferred only for strongly held sources
+    assert ("_tree" in vars(rosetta_tree)) == (retain_source != "strong")
+    assert (rosetta_tree.as_dendropy is dendropy_tree) == (
+        retain_source != "none"
+    )
+
+    del dendropy_tree
+    gc.collect()
+    assert isinstance(rosetta_tree.as_dendropy, dp.Tree)
+    assert len(rosetta_tree.as_alife) == len(original_df)
+    assert set(rosetta_tree.as_alife["id"]) == set(original_df["id"])
+
+
+@pytest.mark.parametrize("retain_source", ["strong", "weak", "none"])
+def test_retain_source_modified(retain_source):
+    dendropy_tree = dp.Tree.get(data="((A,B),C);", schema="newick")
+    rosetta_tree = apc.RosettaTree(dendropy_tree, retain_source=retain_source)
+
+    dendropy_tree.seed_node.new_child(taxon=dp.Taxon(label="D"))
+    # retained sources are returned as is, modification included
+    assert ("D" in str(rosetta_tree.as_dendropy)) == (
+        retain_source != "none"
+    )
+    # strongly held sources are converted on demand, after modification,
+    # while others are snapshotted on construction
+    assert ("D" in set(rosetta_tree.as_alife["taxon_label"])) == (
+        retain_source == "strong"
+    )
+
+
+@pytest.mark.parametrize(
+    "original_tree, attr",
+    [
+        (ete3.Tree(f"{dirname(realpath(__file__))}/assets/pythonidae.newick"),
+         "as_dendropy"),
+        (BioPhylo.read(
+            f"{dirname(realpath(__file__))}/assets/pythonidae.newick",
+            "newick",
+        ), "as_dendropy"),
+        (apc.alife_dataframe_to_networkx_digraph(
+            pd.read_csv(f"{dirname(realpath(__file__))}/assets/alifedata.csv"),
+            setup_edge_lengths=True,
+        ), "as_dendropy"),
+        (dp.Tree.get(
+            path=f"{dirname(realpath(__file__))}/assets/pythonidae.newick",
+            schema="newick",
+        ), "as_treeswift"),
+    ],
+)
+def test_direct_conversion(original_tree, attr):
+    rosetta_tree = apc.RosettaTree(original_tree)
+
+    # twice to test caching
+    for __ in range(2):
+        converted_tree = getattr(rosetta_tree, attr)
+        # conversion bypasses alife standard format
+        assert "_tree" not in vars(rosetta_tree)
+        assert converted_tree is not None
+
+    if attr == "as_dendropy":
+        expected_tree = getattr(
+            apc.RosettaTree(original_tree, retain_source="none"), attr,
+        )
+        assert str(converted_tree) == str(expected_tree)
+
+
+@pytest.mark.parametrize("schema", ["newick", "nexus", "nexml"])
+def test_to_schema_cache(schema):
+    original_df = pd.read_csv(
+        f"{dirname(realpath(__file__))}/assets/alifedata.csv",
+    )
+    rosetta_tree = apc.RosettaTree(original_df, cache_size=2)
+
+    # file output is streamed, not cached
+    sink = io.StringIO()
+    rosetta_tree.to_schema(schema, sink)
+    assert ("to_schema", schema) not in rosetta_tree._cache
+
+    text = rosetta_tree.to_schema(schema)
+    assert rosetta_tree.to_schema(schema) is text
+    assert sink.getvalue().strip() == text.strip()
+
+    # cached text is written to files and streams
+    sink = io.StringIO()
+    rosetta_tree.to_schema(schema, sink)
+    assert sink.getvalue() == text
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = pathlib.Path(tmpdir) / "tree"
+        rosetta_tree.to_schema(schema, path)
+        assert path.read_text() == text
+
+    rosetta_tree.clear_cache()
+    assert rosetta_tree.to_schema(schema) is not text
+    assert rosetta_tree.to_schema(schema) == text
+
+    uncached_tree = apc.RosettaTree(original_df, cache_size=0)
+    sink = io.StringIO()
+    uncached_tree.to_schema(schema, sink)
+    assert sink.getvalue().strip() == text.strip()
+
+
+@pytest.mark.parametrize("schema", ["nexus", "nexml"])
+def test_to_schema_defers_conversion(schema):
+    original_df = pd.read_csv(
+        f"{dirname(realpath(__file__))}/assets/alifedata.csv",
+    )
+    dendropy_tree = apc.alife_dataframe_to_dendropy_tree(
+        original_df, setup_edge_lengths=True,
+    )
+    rosetta_tree = apc.RosettaTree(dendropy_tree)
+
+    converted_tree = rosetta_tree.to_schema(schema)
+    assert converted_tree == dendropy_tree.as_string(schema=schema)
+    # served from retained dendropy tree, without alife standard format
+    assert "_tree" not in vars(rosetta_tree)
+    assert "_compact_tree" not in vars(rosetta_tree)
+
+
+def test_to_schema_empty_source():
+    rosetta_tree = apc.RosettaTree(nx.DiGraph())
+    assert rosetta_tree.to_nexus() is None
+    with pytest.raises(ValueError):
+        rosetta_tree.to_nexus(io.StringIO())
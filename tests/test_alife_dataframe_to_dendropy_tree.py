@@ -7,6 +7,7 @@
 
 from os.path import dirname, realpath
 import pandas as pd
+import pytest
 
 import alifedata_phyloinformatics_convert as apc
 
@@ -101,3 +102,73 @@ def test_setattrs_mapping():
         assert isinstance(node.tot_orgs_, int)
         assert node.num_orgs_ >= 0
         assert node.tot_orgs_ >= 0
+
+
+@pytest.mark.parametrize(
+    'setattrs',
+    [
+        ['not_a_column'],
+        {'not_a_column': 'attr'},
+    ],
+)
+def test_setattrs_missing(setattrs):
+    original_df = pd.read_csv(
+        f'{dirname(realpath(__file__))}/assets/alifedata.csv',
+    )
+    with pytest.raises(KeyError):
+        apc.alife_dataframe_to_dendropy_tree(original_df, setattrs=setattrs)
+
+
+@pytest.mark.parametrize('root_ancestor_id', [-1, None])
+def test_ancestor_id_root_marker(root_ancestor_id):
+    df = pd.DataFrame({
+        'id': [0, 1, 2],
+        'ancestor_list': ['[none]', '[0]', '[0]'],
+        'ancestor_id': pd.array([root_ancestor_id, 0, 0], dtype='Int64'),
+    })
+    trees = apc.alife_dataframe_to_dendropy_trees(df)
+    assert len(trees) == 1
+    assert sorted(node.id for node in trees[0]) == [0, 1, 2]
+    assert trees[0].seed_node.id == 0
+
+
+def test_ancestor_id():
+    original_df = pd.read_csv(
+        f'{dirname(realpath(__file__))}/assets/alifedata.csv',
+    )
+    ancestor_id_df = original_df.drop(columns='ancestor_list')
+    ancestor_id_df['ancestor_id'] = original_df['ancestor_list'].replace(
+        '[NONE]', '[1]',
+    ).str.strip('[]').astype(int)
+
+    assert str(apc.alife_dataframe_to_dendropy_tree(original_df)) \
+        == str(apc.alife_dataframe_to_dendropy_tree(ancestor_id_df))
+
+
+def test_progress_wrap():
+    original_df = pd.read_csv(
+        f'{dirname(realpath(__file__))}/assets/alifedata.csv',
+    )
+    totals = []
+
+    def progress_wrap(iterable, total=None):
+        totals.append(total)
+        return iterable
+
+    converted_tree = apc.alife_dataframe_to_dendropy_tree(
+        original_df, progress_wrap=progress_wrap,
+    )
+    assert totals[0] == len(original_df)
+    assert len(converted_tree.nodes()) == len(original_df)
+
+
+def test_setup_edge_lengths_negative():
+    df = pd.DataFrame(
+        {
+            'id': [0, 1, 2],
+            'ancestor_list': ['[None]', '[0]', '[0]'],
+            'origin_time': [5, 7, 3],
+        }
+    )
+    with pytest.raises(AssertionError, match=r'\[2\]'):
+        apc.alife_dataframe_to_dendropy_tree(df, setup_edge_lengths=True)
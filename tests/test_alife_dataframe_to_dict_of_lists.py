@@ -6,14 +6,17 @@
 '''
 
 import pandas as pd
+import pytest
 
 import alifedata_phyloinformatics_convert as apc
 
+
 def test_alife_dataframe_to_dict_of_lists_empty():
     df = pd.DataFrame({'id': [], 'ancestor_list': []})
     expected_output = {}
     assert apc.alife_dataframe_to_dict_of_lists(df) == expected_output
 
+
 def test_alife_dataframe_to_dict_of_lists_asexual():
     df = pd.DataFrame(
         {'id': [0, 1, 7, 9], 'ancestor_list': ['[None]', '[0]', '[1]', '[1]']}
@@ -24,6 +27,7 @@ def test_alife_dataframe_to_dict_of_lists_asexual():
         df.sample(frac=1)
     ) == expected_output
 
+
 def test_alife_dataframe_to_dict_of_lists_sexual():
     df = pd.DataFrame(
         {
@@ -37,3 +41,39 @@ def test_alife_dataframe_to_dict_of_lists_sexual():
     assert apc.alife_dataframe_to_dict_of_lists(
         df.sample(frac=1)
     ) == expected_output
+
+
+def test_alife_dataframe_to_dict_of_lists_none_spellings():
+    df = pd.DataFrame(
+        {
+            'id': [0, 1, 2, 3, 4, 5],
+            'ancestor_list': [
+                '[none]', '[None]', '[NONE]', '[]', '[0]', '[12,3]',
+            ],
+        }
+    )
+
+    expected_output = {0: [], 1: [], 2: [], 3: [], 4: [0], 5: [12, 3]}
+    assert apc.alife_dataframe_to_dict_of_lists(df) == expected_output
+
+
+def test_alife_dataframe_to_dict_of_lists_ancestor_id():
+    df = pd.DataFrame({'id': [0, 1, 7, 9], 'ancestor_id': [0, 0, 1, 1]})
+    expected_output = {0: [], 1: [0], 7: [1], 9: [1]}
+    assert apc.alife_dataframe_to_dict_of_lists(df) == expected_output
+    assert apc.alife_dataframe_to_dict_of_lists(
+        df.sample(frac=1)
+    ) == expected_output
+
+
+@pytest.mark.parametrize('root_ancestor_id', [-1, None])
+def test_alife_dataframe_to_dict_of_lists_ancestor_id_root_marker(
+    root_ancestor_id,
+):
+    df = pd.DataFrame({
+        'id': [0, 1, 2],
+        'ancestor_list': ['[none]', '[0]', '[0]'],
+        'ancestor_id': pd.array([root_ancestor_id, 0, 0], dtype='Int64'),
+    })
+    expected_output = {0: [], 1: [0], 2: [0]}
+    assert apc.alife_dataframe_to_dict_of_lists(df) == expected_output
@@ -7,6 +7,7 @@
 
 from os.path import dirname, realpath
 import pandas as pd
+import pytest
 
 import alifedata_phyloinformatics_convert as apc
 
@@ -105,6 +106,21 @@ def test_setattrs_mapping():
     assert all(node.dist == 1.0 for node in converted_tree)
 
 
+@pytest.mark.parametrize(
+    'setattrs',
+    [
+        ['not_a_column'],
+        {'not_a_column': 'attr'},
+    ],
+)
+def test_setattrs_missing(setattrs):
+    original_df = pd.read_csv(
+        f'{dirname(realpath(__file__))}/assets/alifedata.csv',
+    )
+    with pytest.raises(KeyError):
+        apc.alife_dataframe_to_ete_tree(original_df, setattrs=setattrs)
+
+
 def test_setup_dists():
     original_df = pd.read_csv(
         f'{dirname(realpath(__file__))}/assets/alifedata.csv',
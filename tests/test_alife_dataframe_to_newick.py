@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+
+'''
+`alife_dataframe_to_newick` tests for
+`alifedata-phyloinformatics-convert` package.
+'''
+
+import io
+from os.path import dirname, realpath
+import pandas as pd
+import pytest
+
+import alifedata_phyloinformatics_convert as apc
+
+
+@pytest.mark.parametrize(
+    'original_df',
+    [
+        pd.read_csv(f'{dirname(realpath(__file__))}/assets/alifedata.csv'),
+        pd.read_csv(
+            f'{dirname(realpath(__file__))}/assets/alifedata_minimal.csv',
+        ),
+        pd.read_csv(
+            f'{dirname(realpath(__file__))}/converted_toalifedata/'
+            'pythonidae.annotated.csv',
+        ),
+        pd.DataFrame({
+            'id': [0, 1, 2, 3, 4],
+            'ancestor_list': ['[none]', '[0]', '[1]', '[1]', '[0]'],
+            'edge_length': [None, 0.5, 1, None, 2.25],
+            'label': ['root', 'in ner', None, 'x', 'y'],
+            'taxon_label': [None, None, "it's", 'a_b', 'c:d'],
+        }),
+    ],
+)
+@pytest.mark.parametrize('setup_edge_lengths', [False, True])
+@pytest.mark.parametrize('suppress_unifurcations', [False, True])
+def test_matches_dendropy(
+    original_df, setup_edge_lengths, suppress_unifurcations,
+):
+    dendropy_tree = apc.alife_dataframe_to_dendropy_tree(
+        original_df,
+        setup_edge_lengths=setup_edge_lengths,
+    )
+    if suppress_unifurcations:
+        dendropy_tree.suppress_unifurcations()
+
+    assert apc.alife_dataframe_to_newick(
+        original_df,
+        setup_edge_lengths=setup_edge_lengths,
+        suppress_unifurcations=suppress_unifurcations,
+    ) == dendropy_tree.as_string(schema='newick')
+
+
+def test_file():
+    original_df = pd.read_csv(
+        f'{dirname(realpath(__file__))}/assets/alifedata.csv',
+    )
+    file = io.StringIO()
+    assert apc.alife_dataframe_to_newick(original_df, file=file) is None
+    assert file.getvalue() == apc.alife_dataframe_to_newick(original_df)
+
+
+def test_caterpillar():
+    depth = 100_000
+    original_df = pd.DataFrame({
+        'id': range(depth),
+        'ancestor_list': ['[none]', *(f'[{i}]' for i in range(depth - 1))],
+        'origin_time': range(depth),
+    })
+
+    converted_newick = apc.alife_dataframe_to_newick(
+        original_df,
+        setup_edge_lengths=True,
+    )
+    assert converted_newick == (
+        '[&R] ' + '(' * (depth - 1) + ':1)' * (depth - 1) + ':0;\n'
+    )
+
+    assert apc.alife_dataframe_to_newick(
+        original_df,
+        setup_edge_lengths=True,
+        suppress_unifurcations=True,
+    ) == f'[&R] :{depth - 1};\n'
@@ -70,3 +70,19 @@ def test_minimal_empty():
         f"{dirname(realpath(__file__))}/assets/alifedata_minimal_empty.csv"
     )
     assert apc.alife_dataframe_to_phylotrack_systematics(df).get_num_taxa() == 0
+
+
+def test_unread_columns():
+    original_df = pd.read_csv(
+        f"{dirname(realpath(__file__))}/assets/alifedata.csv",
+    )
+    # columns not read by phylotrackpy do not affect conversion
+    trimmed_df = original_df.drop(columns=["phenotype"])
+    trimmed_df["notes"] = '"quoted, text"'
+
+    converted_tree = apc.alife_dataframe_to_phylotrack_systematics(trimmed_df)
+    reconverted_df = apc.phylotrack_systematics_to_alife_dataframe(
+        converted_tree
+    )
+
+    assert _setify(original_df) == _setify(reconverted_df)
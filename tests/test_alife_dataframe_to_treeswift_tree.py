@@ -7,6 +7,7 @@
 
 from os.path import dirname, realpath
 import pandas as pd
+import pytest
 
 import alifedata_phyloinformatics_convert as apc
 
@@ -101,3 +102,18 @@ def test_setattrs_mapping():
         assert isinstance(node.tot_orgs_, int)
         assert node.num_orgs_ >= 0
         assert node.tot_orgs_ >= 0
+
+
+@pytest.mark.parametrize(
+    'setattrs',
+    [
+        ['not_a_column'],
+        {'not_a_column': 'attr'},
+    ],
+)
+def test_setattrs_missing(setattrs):
+    original_df = pd.read_csv(
+        f'{dirname(realpath(__file__))}/assets/alifedata.csv',
+    )
+    with pytest.raises(KeyError):
+        apc.alife_dataframe_to_treeswift_tree(original_df, setattrs=setattrs)
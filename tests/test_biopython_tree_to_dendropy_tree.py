@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+
+'''
+`biopython_tree_to_dendropy_tree` tests for
+`alifedata-phyloinformatics-convert` package.
+'''
+
+from Bio import Phylo
+import io
+from os.path import dirname, realpath
+import pandas as pd
+import pytest
+
+import alifedata_phyloinformatics_convert as apc
+
+
+def _node_attrs(tree):
+    return [
+        (
+            node.id,
+            node.label,
+            node.taxon and node.taxon.label,
+            node.edge_length,
+            node.origin_time,
+        )
+        for node in tree.preorder_node_iter()
+    ]
+
+
+@pytest.mark.parametrize(
+    "make_tree",
+    [
+        lambda: Phylo.read(
+            f"{dirname(realpath(__file__))}/assets/pythonidae.newick",
+            "newick",
+        ),
+        lambda: Phylo.read(io.StringIO("((A:1,B:2)x:1,C:3)r;"), "newick"),
+        lambda: apc.alife_dataframe_to_biopython_tree(
+            pd.read_csv(
+                f"{dirname(realpath(__file__))}/assets/alifedata.csv",
+            ),
+            setup_branch_lengths=True,
+        ),
+    ],
+)
+def test_matches_alife_dataframe_conversion(make_tree):
+    expected_tree = apc.alife_dataframe_to_dendropy_tree(
+        apc.biopython_tree_to_alife_dataframe(
+            make_tree(),
+            exportattrs={'name': 'taxon_label'},
+        ),
+        setup_edge_lengths=True,
+    )
+
+    converted_tree = apc.biopython_tree_to_dendropy_tree(make_tree())
+    assert _node_attrs(converted_tree) == _node_attrs(expected_tree)
+    assert str(converted_tree) == str(expected_tree)
+    assert converted_tree.is_rooted
+
+
+def test_names():
+    original_tree = Phylo.read(
+        f"{dirname(realpath(__file__))}/assets/pythonidae.newick",
+        "newick",
+    )
+
+    converted_tree = apc.biopython_tree_to_dendropy_tree(original_tree)
+    assert [
+        node.taxon.label for node in converted_tree.leaf_node_iter()
+    ] == [clade.name for clade in original_tree.get_terminals()]
+    # source tree is not modified
+    assert not any(
+        hasattr(clade, "id") or hasattr(clade, "origin_time")
+        for clade in original_tree.find_clades()
+    )
@@ -5,9 +5,14 @@
 `alifedata-phyloinformatics-convert` package.
 '''
 
+import bz2
 from click.testing import CliRunner
 import filecmp
-from os.path import dirname, getsize, realpath
+import gzip
+import lzma
+import os
+from os.path import dirname, getmtime, getsize, realpath
+import pandas as pd
 import tempfile
 
 from alifedata_phyloinformatics_convert import cli
@@ -290,3 +295,302 @@ def test_toalifedata_keepsuppress_unifurcations(input_schema, output_format):
                 f"alifedata.{output_format}",
                 f'{tempdir}/{option}_unifurcations',
             )
+
+
+@pytest.mark.parametrize(
+    "input_schema",
+    [
+        "nexus",
+        "newick",
+    ],
+)
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_toalifedata_all_trees(input_schema, max_workers):
+    runner = CliRunner()
+    scriptdir = dirname(realpath(__file__))
+    with tempfile.TemporaryDirectory() as tempdir:
+        result = runner.invoke(
+            cli.toalifedata,
+            f'--input-file {scriptdir}/assets/alifedata.{input_schema} '
+            f'--input-schema {input_schema} '
+            f'--output-file {tempdir}/first_tree.csv '
+            '--output-format csv '
+        )
+        assert result.exit_code == 0
+        result = runner.invoke(
+            cli.toalifedata,
+            f'--input-file {scriptdir}/assets/alifedata.{input_schema} '
+            f'--input-schema {input_schema} '
+            f'--output-file {tempdir}/all_trees.csv '
+            '--output-format csv '
+            '--all-trees '
+            f'--max-workers {max_workers}'
+        )
+        assert result.exit_code == 0
+
+        first_tree_df = pd.read_csv(f'{tempdir}/first_tree.csv')
+        all_trees_df = pd.read_csv(f'{tempdir}/all_trees.csv')
+        assert (all_trees_df.pop('tree_index') == 0).all()
+        pd.testing.assert_frame_equal(all_trees_df, first_tree_df)
+
+
+@pytest.mark.parametrize(
+    "output_schema",
+    [
+        "nexml",
+        "nexus",
+        "newick",
+    ],
+)
+@pytest.mark.parametrize("chunksize", [1, 7, 100000])
+def test_fromalifedata_chunksize(output_schema, chunksize):
+    runner = CliRunner()
+    scriptdir = dirname(realpath(__file__))
+    with tempfile.TemporaryDirectory() as tempdir:
+        result = runner.invoke(
+            cli.fromalifedata,
+            f'--input-file {scriptdir}/assets/alifedata.csv '
+            '--input-format csv '
+            f'--output-file {tempdir}/alifedata.{output_schema} '
+            f'--output-schema {output_schema} '
+            f'--chunksize {chunksize}'
+        )
+        assert result.exit_code == 0
+        assert filecmp.cmp(
+            f'{scriptdir}/converted_fromalifedata/keep-unifurcations/'
+            f'alifedata.{output_schema}',
+            f'{tempdir}/alifedata.{output_schema}',
+        )
+
+
+def test_fromalifedata_chunksize_requires_csv():
+    runner = CliRunner()
+    scriptdir = dirname(realpath(__file__))
+    result = runner.invoke(
+        cli.fromalifedata,
+        f'--input-file {scriptdir}/assets/alifedata.csv '
+        '--input-format json '
+        '--output-schema newick '
+        '--chunksize 10'
+    )
+    assert result.exit_code != 0
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_fromalifedata_numeric_labels(chunksize):
+    runner = CliRunner()
+    with tempfile.TemporaryDirectory() as tempdir:
+        pd.DataFrame({
+            'id': [0, 1, 2, 3],
+            'ancestor_list': ['[none]', '[0]', '[0]', '[2]'],
+            'trait': ['a', 'b', 'c', 'd'],
+            'taxon_label': ['r', '01', 'x', '2'],
+        }).to_csv(f'{tempdir}/alifedata.csv', index=False)
+        result = runner.invoke(
+            cli.fromalifedata,
+            f'--input-file {tempdir}/alifedata.csv '
+            f'--output-file {tempdir}/alifedata.newick '
+            '--output-schema newick '
+            + ('' if chunksize is None else f'--chunksize {chunksize}')
+        )
+        assert result.exit_code == 0
+        with open(f'{tempdir}/alifedata.newick') as file:
+            assert file.read() == '[&R] (01,(2)x)r;\n'
+
+
+@pytest.mark.parametrize(
+    "output_schema",
+    [
+        "nexml",
+        "nexus",
+        "newick",
+    ],
+)
+@pytest.mark.parametrize(
+    "ancestor_list",
+    [
+        [],
+        ['[none]', '[0]', '[none]'],
+    ],
+)
+def test_fromalifedata_requires_single_root(output_schema, ancestor_list):
+    runner = CliRunner()
+    with tempfile.TemporaryDirectory() as tempdir:
+        pd.DataFrame({
+            'id': range(len(ancestor_list)),
+            'ancestor_list': ancestor_list,
+        }).to_csv(f'{tempdir}/alifedata.csv', index=False)
+        result = runner.invoke(
+            cli.fromalifedata,
+            f'--input-file {tempdir}/alifedata.csv '
+            f'--output-file {tempdir}/alifedata.{output_schema} '
+            f'--output-schema {output_schema}'
+        )
+        assert result.exit_code != 0
+        assert 'exactly one root' in result.output
+
+
+def test_toalifedata_failure_keeps_output():
+    runner = CliRunner()
+    with tempfile.TemporaryDirectory() as tempdir:
+        with open(f'{tempdir}/malformed.newick', 'w') as file:
+            file.write('((A,B);')
+        with open(f'{tempdir}/existing.csv', 'w') as file:
+            file.write('id,ancestor_list\n0,[none]\n')
+        result = runner.invoke(
+            cli.toalifedata,
+            f'--input-file {tempdir}/malformed.newick '
+            '--input-schema newick '
+            f'--output-file {tempdir}/existing.csv'
+        )
+        assert result.exit_code != 0
+        with open(f'{tempdir}/existing.csv') as file:
+            assert file.read() == 'id,ancestor_list\n0,[none]\n'
+        # temporary output is cleaned up
+        assert sorted(os.listdir(tempdir)) == [
+            'existing.csv', 'malformed.newick',
+        ]
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        "toalifedata --input-schema newick",
+        "fromalifedata --output-schema newick",
+    ],
+)
+def test_missing_input_file(command):
+    runner = CliRunner()
+    with tempfile.TemporaryDirectory() as tempdir:
+        result = runner.invoke(
+            cli.cli,
+            f'{command} --input-file {tempdir}/missing '
+            f'--output-file {tempdir}/output',
+        )
+        assert result.exit_code == 2  # usage error
+        assert 'does not exist' in result.output
+        assert os.listdir(tempdir) == []
+
+
+@pytest.mark.parametrize(
+    "extension, decompress",
+    [
+        ("gz", gzip.decompress),
+        ("bz2", bz2.decompress),
+        ("xz", lzma.decompress),
+    ],
+)
+def test_compressed_io(extension, decompress):
+    runner = CliRunner()
+    scriptdir = dirname(realpath(__file__))
+    with tempfile.TemporaryDirectory() as tempdir:
+        result = runner.invoke(
+            cli.fromalifedata,
+            f'--input-file {scriptdir}/assets/alifedata.csv '
+            f'--output-file {tempdir}/alifedata.newick.{extension} '
+            '--output-schema newick '
+        )
+        assert result.exit_code == 0
+        with open(f'{tempdir}/alifedata.newick.{extension}', 'rb') as file:
+            compressed = file.read()
+        with open(
+            f'{scriptdir}/converted_fromalifedata/keep-unifurcations/'
+            'alifedata.newick',
+            'rb',
+        ) as file:
+            assert decompress(compressed) == file.read()
+
+        # compression of input is detected from content, not extension
+        with open(f'{tempdir}/alifedata', 'wb') as file:
+            file.write(compressed)
+        result = runner.invoke(
+            cli.toalifedata,
+            f'--input-file {tempdir}/alifedata '
+            '--input-schema newick '
+            f'--output-file {tempdir}/alifedata.csv '
+        )
+        assert result.exit_code == 0
+        result = runner.invoke(
+            cli.toalifedata,
+            f'--input-file {tempdir}/alifedata.newick.{extension} '
+            '--input-schema newick '
+            f'--output-file {tempdir}/alifedata.csv.{extension} '
+            '--compression-threads 2'
+        )
+        assert result.exit_code == 0
+        with open(f'{tempdir}/alifedata.csv.{extension}', 'rb') as file:
+            with open(f'{tempdir}/alifedata.csv', 'rb') as expected_file:
+                assert decompress(file.read()) == expected_file.read()
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_batch_toalifedata(jobs):
+    runner = CliRunner()
+    scriptdir = dirname(realpath(__file__))
+    with tempfile.TemporaryDirectory() as tempdir:
+        args = (
+            'toalifedata '
+            f'{scriptdir}/assets/pythonidae.newick '
+            f'"{scriptdir}/assets/alifedata.new*" '
+            '--input-schema newick '
+            f'--output-dir {tempdir}/converted '
+            f'--jobs {jobs}'
+        )
+        result = runner.invoke(cli.batch, args)
+        assert result.exit_code == 0
+        assert sorted(os.listdir(f'{tempdir}/converted')) == [
+            'alifedata.csv',
+            'pythonidae.csv',
+        ]
+        result = runner.invoke(
+            cli.toalifedata,
+            f'--input-file {scriptdir}/assets/alifedata.newick '
+            '--input-schema newick '
+            f'--output-file {tempdir}/alifedata.csv '
+        )
+        assert result.exit_code == 0
+        assert filecmp.cmp(
+            f'{tempdir}/alifedata.csv',
+            f'{tempdir}/converted/alifedata.csv',
+        )
+
+        # up-to-date outputs are skipped unless forced
+        os.utime(f'{tempdir}/converted/alifedata.csv', (0, 0))
+        mtime = getmtime(f'{tempdir}/converted/pythonidae.csv')
+        result = runner.invoke(cli.batch, args)
+        assert result.exit_code == 0
+        assert getmtime(f'{tempdir}/converted/alifedata.csv') > 0
+        assert getmtime(f'{tempdir}/converted/pythonidae.csv') == mtime
+
+        os.utime(f'{tempdir}/converted/pythonidae.csv', (2**31, 2**31))
+        result = runner.invoke(cli.batch, f'{args} --force')
+        assert result.exit_code == 0
+        assert getmtime(f'{tempdir}/converted/pythonidae.csv') < 2**31
+
+
+def test_batch_fromalifedata_failure():
+    runner = CliRunner()
+    scriptdir = dirname(realpath(__file__))
+    with tempfile.TemporaryDirectory() as tempdir:
+        os.mkdir(f'{tempdir}/inputs')
+        with open(f'{tempdir}/inputs/bad.csv', 'w') as file:
+            file.write('id,ancestor_list\n0,[1 2]\n')
+        with open(f'{scriptdir}/assets/alifedata.csv') as file:
+            with open(f'{tempdir}/inputs/alifedata.csv', 'w') as copy:
+                copy.write(file.read())
+
+        result = runner.invoke(
+            cli.batch,
+            'fromalifedata '
+            f'{tempdir}/inputs '
+            '--output-schema newick '
+            f'--output-dir {tempdir}/converted '
+            '--output-suffix .nwk',
+        )
+        assert result.exit_code != 0
+        assert os.listdir(f'{tempdir}/converted') == ['alifedata.nwk']
+        assert filecmp.cmp(
+            f'{scriptdir}/converted_fromalifedata/keep-unifurcations/'
+            'alifedata.newick',
+            f'{tempdir}/converted/alifedata.nwk',
+        )
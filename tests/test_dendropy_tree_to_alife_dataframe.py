@@ -155,3 +155,60 @@ def test_exportattrs_mapping():
     assert 'name' in converted_df
     assert {*converted_df['name']} ==  {node.taxon.label for node in original_tree}
     assert len(converted_df['name'].unique()) > 1
+
+
+def test_columns():
+
+    original_tree = dendropy.Tree.get(
+        data='((A:1,B:2)C:3)D;',
+        schema='newick',
+    )
+
+    converted_df = apc.dendropy_tree_to_alife_dataframe(original_tree)
+
+    assert [*converted_df.columns] == [
+        'id', 'ancestor_list', 'origin_time', 'edge_length', 'label',
+        'taxon_label',
+    ]
+    assert converted_df['id'].dtype == 'int64'
+    assert [*converted_df['ancestor_list']] \
+        == ['[None]', '[0]', '[1]', '[1]']
+    assert [*converted_df['origin_time']] == [0, 3, 4, 5]
+    assert [*converted_df['label']] == ['D', 'C', None, None]
+    assert [*converted_df['taxon_label']] == [None, None, 'A', 'B']
+
+
+def test_ancestor_id_only():
+
+    original_tree = dendropy.Tree.get(
+        data='((A:1,B:2)C:3)D;',
+        schema='newick',
+    )
+
+    converted_df = apc.dendropy_tree_to_alife_dataframe(
+        original_tree,
+        ancestor_id_only=True,
+    )
+
+    assert 'ancestor_list' not in converted_df
+    assert [*converted_df['ancestor_id']] == [0, 0, 1, 1]
+
+    reconverted_tree = apc.alife_dataframe_to_dendropy_tree(converted_df)
+    assert reconverted_tree.as_string(schema='newick') \
+        == '[&R] ((A:1.0,B:2.0)C:3.0)D;\n'
+
+
+def test_negative_ids():
+
+    original_tree = dendropy.Tree.get(
+        data='((A:1,B:2)C:3)D;',
+        schema='newick',
+    )
+    for node, id in zip(original_tree.preorder_node_iter(), [-10, -1, 0, 7]):
+        node.id = id
+
+    converted_df = apc.dendropy_tree_to_alife_dataframe(original_tree)
+
+    assert [*converted_df['id']] == [-10, -1, 0, 7]
+    assert [*converted_df['ancestor_list']] \
+        == ['[None]', '[-10]', '[-1]', '[-1]']
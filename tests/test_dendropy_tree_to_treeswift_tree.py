@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+
+'''
+`dendropy_tree_to_treeswift_tree` tests for
+`alifedata-phyloinformatics-convert` package.
+'''
+
+import dendropy as dp
+from os.path import dirname, realpath
+import pandas as pd
+import pytest
+
+import alifedata_phyloinformatics_convert as apc
+
+
+def _node_attrs(tree):
+    return [
+        (node.id, node.label, node.edge_length, node.origin_time)
+        for node in tree.traverse_preorder()
+    ]
+
+
+@pytest.mark.parametrize(
+    "original_df",
+    [
+        pd.read_csv(f"{dirname(realpath(__file__))}/assets/alifedata.csv"),
+        pd.read_csv(
+            f"{dirname(realpath(__file__))}/assets/alifedata_minimal.csv",
+        ),
+    ],
+)
+def test_alifedata(original_df):
+    original_tree = apc.alife_dataframe_to_dendropy_tree(
+        original_df, setup_edge_lengths=True,
+    )
+    expected_tree = apc.alife_dataframe_to_treeswift_tree(
+        original_df, setup_edge_lengths=True,
+    )
+
+    converted_tree = apc.dendropy_tree_to_treeswift_tree(original_tree)
+    assert _node_attrs(converted_tree) == _node_attrs(expected_tree)
+    assert converted_tree.is_rooted
+
+
+def test_labels_match_alife_dataframe_conversion():
+    original_tree = dp.Tree.get(data="((A:1,B:2)x:1,C:3)r;", schema="newick")
+    for node in original_tree.leaf_node_iter():
+        node.label, node.taxon = node.taxon.label, None
+    expected_tree = apc.alife_dataframe_to_treeswift_tree(
+        apc.dendropy_tree_to_alife_dataframe(
+            original_tree.clone(depth=1),
+        ),
+        setup_edge_lengths=True,
+    )
+
+    converted_tree = apc.dendropy_tree_to_treeswift_tree(original_tree)
+    assert _node_attrs(converted_tree) == _node_attrs(expected_tree)
+    assert sorted(
+        node.label for node in converted_tree.traverse_preorder()
+    ) == ["A", "B", "C", "r", "x"]
+
+
+def test_label_precedence():
+    original_tree = dp.Tree.get(data="((A,B)x,C);", schema="newick")
+    leaf_a = original_tree.find_node_with_taxon_label("A")
+    leaf_a.label = "a"
+
+    converted_tree = apc.dendropy_tree_to_treeswift_tree(original_tree)
+    # node labels take precedence over taxon labels, as they alone carry
+    # over through alife dataframe conversion
+    assert sorted(
+        node.label for node in converted_tree.traverse_leaves()
+    ) == ["B", "C", "a"]
+
+
+def test_newick():
+    original_tree = dp.Tree.get(
+        path=f"{dirname(realpath(__file__))}/assets/pythonidae.newick",
+        schema="newick",
+    )
+
+    converted_tree = apc.dendropy_tree_to_treeswift_tree(original_tree)
+    assert converted_tree.num_nodes() == len(original_tree.nodes())
+    # taxon labels are applied as node labels
+    assert sorted(
+        node.label for node in converted_tree.traverse_leaves()
+    ) == sorted(node.taxon.label for node in original_tree.leaf_node_iter())
+    assert sorted(
+        node.edge_length
+        for node in converted_tree.traverse_preorder()
+        if not node.is_root()
+    ) == sorted(
+        node.edge_length
+        for node in original_tree
+        if node.parent_node is not None
+    )
+    # source tree is not modified
+    assert not any(hasattr(node, "id") for node in original_tree)
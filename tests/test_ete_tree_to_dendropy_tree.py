@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+
+'''
+`ete_tree_to_dendropy_tree` tests for
+`alifedata-phyloinformatics-convert` package.
+'''
+
+import ete3
+from os.path import dirname, realpath
+import pandas as pd
+import pytest
+
+import alifedata_phyloinformatics_convert as apc
+
+
+def _node_attrs(tree):
+    return [
+        (
+            node.id,
+            node.label,
+            node.taxon and node.taxon.label,
+            node.edge_length,
+            node.origin_time,
+        )
+        for node in tree.preorder_node_iter()
+    ]
+
+
+@pytest.mark.parametrize(
+    "make_tree",
+    [
+        lambda: ete3.Tree(
+            newick=f'{dirname(realpath(__file__))}/assets/pythonidae.newick',
+        ),
+        lambda: ete3.Tree("((A:1,B:2)x:1,C:3)r;", format=1),
+        lambda: apc.alife_dataframe_to_ete_tree(
+            pd.read_csv(
+                f"{dirname(realpath(__file__))}/assets/alifedata.csv",
+            ),
+            setup_dists=True,
+        ),
+    ],
+)
+def test_matches_alife_dataframe_conversion(make_tree):
+    expected_tree = apc.alife_dataframe_to_dendropy_tree(
+        apc.ete_tree_to_alife_dataframe(make_tree()),
+        setup_edge_lengths=True,
+    )
+
+    converted_tree = apc.ete_tree_to_dendropy_tree(make_tree())
+    assert _node_attrs(converted_tree) == _node_attrs(expected_tree)
+    assert str(converted_tree) == str(expected_tree)
+    assert converted_tree.is_rooted
+
+
+def test_source_not_modified():
+    original_tree = ete3.Tree(
+        newick=f'{dirname(realpath(__file__))}/assets/pythonidae.newick',
+    )
+    apc.ete_tree_to_dendropy_tree(original_tree)
+    assert not any(
+        hasattr(node, "id") or hasattr(node, "origin_time")
+        for node in original_tree.traverse()
+    )
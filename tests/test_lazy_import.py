@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+
+'''
+Import-time tests for
+`alifedata-phyloinformatics-convert` package.
+'''
+
+import subprocess
+import sys
+
+import pytest
+
+_backends = (
+    'anytree',
+    'Bio',
+    'dendropy',
+    'ete3',
+    'networkx',
+    'pandas',
+    'phylotrackpy',
+    'treeswift',
+)
+
+
+def _get_loaded_backends(script):
+    output = subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            f'{script}\n'
+            'import sys\n'
+            'print("loaded:", '
+            f'*(m for m in {_backends!r} if m in sys.modules))\n',
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return output.splitlines()[-1].split()[1:]
+
+
+def test_import_package():
+    assert _get_loaded_backends(
+        'import alifedata_phyloinformatics_convert',
+    ) == []
+
+
+def test_import_cli():
+    assert _get_loaded_backends(
+        'from alifedata_phyloinformatics_convert import cli\n'
+        'try:\n'
+        '    cli.cli(["toalifedata", "--help"])\n'
+        'except SystemExit:\n'
+        '    pass\n',
+    ) == []
+
+
+@pytest.mark.parametrize(
+    'name, backend',
+    [
+        ('alife_dataframe_to_dendropy_tree', 'dendropy'),
+        ('alife_dataframe_to_networkx_digraph', 'networkx'),
+        ('newick_to_alife_dataframe', 'pandas'),
+    ],
+)
+def test_import_on_access(name, backend):
+    loaded_backends = _get_loaded_backends(
+        'import alifedata_phyloinformatics_convert as apc\n'
+        f'apc.{name}\n',
+    )
+    assert backend in loaded_backends
+    assert 'ete3' not in loaded_backends
+
+
+def test_rosetta_tree_access():
+    assert _get_loaded_backends(
+        'import alifedata_phyloinformatics_convert as apc\n'
+        'apc.RosettaTree\n',
+    ) == []
+
+
+@pytest.mark.parametrize(
+    'make_tree, backend',
+    [
+        (
+            'import dendropy\n'
+            'tree = dendropy.Tree.get(data="((A,B),C);", schema="newick")\n',
+            'dendropy',
+        ),
+        (
+            'import networkx\n'
+            'tree = networkx.DiGraph()\n'
+            'tree.add_edges_from([(1, 0), (2, 0)])\n',
+            'networkx',
+        ),
+        (
+            'import treeswift\n'
+            'tree = treeswift.read_tree_newick("((A,B),C);")\n',
+            'treeswift',
+        ),
+    ],
+)
+def test_rosetta_tree_passthrough(make_tree, backend):
+    assert _get_loaded_backends(
+        'import alifedata_phyloinformatics_convert as apc\n'
+        f'{make_tree}'
+        f'assert apc.RosettaTree(tree).as_{backend} is tree\n',
+    ) == [backend]
+
+
+def test_rosetta_tree_conversion():
+    loaded_backends = _get_loaded_backends(
+        'import alifedata_phyloinformatics_convert as apc\n'
+        'import networkx\n'
+        'tree = networkx.DiGraph()\n'
+        'tree.add_edges_from([(1, 0), (2, 0)])\n'
+        'apc.RosettaTree(tree).as_dendropy\n',
+    )
+    assert loaded_backends == ['dendropy', 'networkx', 'pandas']
+
+
+def test_rosetta_tree_from_schema():
+    assert _get_loaded_backends(
+        'import alifedata_phyloinformatics_convert as apc\n'
+        'apc.RosettaTree.from_newick("((A,B),C);").to_newick()\n',
+    ) == ['pandas']
+
+
+def test_submodule_import():
+    import alifedata_phyloinformatics_convert as apc
+    from alifedata_phyloinformatics_convert import alife_dataframe_to_newick
+
+    assert callable(apc.alife_dataframe_to_newick)
+    assert apc.alife_dataframe_to_newick is alife_dataframe_to_newick
+    assert set(apc.__all__) <= set(dir(apc))
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+
+'''
+`networkx_digraph_to_dendropy_tree` tests for
+`alifedata-phyloinformatics-convert` package.
+'''
+
+import networkx as nx
+from os.path import dirname, realpath
+import pandas as pd
+import pytest
+
+import alifedata_phyloinformatics_convert as apc
+
+
+def _node_attrs(tree):
+    return [
+        (
+            node.id,
+            node.label,
+            node.taxon and node.taxon.label,
+            node.edge_length,
+            node.origin_time,
+        )
+        for node in tree.preorder_node_iter()
+    ]
+
+
+@pytest.mark.parametrize(
+    "original_df",
+    [
+        pd.read_csv(f"{dirname(realpath(__file__))}/assets/alifedata.csv"),
+        pd.read_csv(
+            f"{dirname(realpath(__file__))}/assets/alifedata_minimal.csv",
+        ),
+    ],
+)
+@pytest.mark.parametrize("setup_edge_lengths", [True, False])
+def test_matches_alife_dataframe_conversion(original_df, setup_edge_lengths):
+    original_graph = apc.alife_dataframe_to_networkx_digraph(
+        original_df, setup_edge_lengths=setup_edge_lengths,
+    )
+    expected_tree = apc.alife_dataframe_to_dendropy_tree(
+        apc.networkx_digraph_to_alife_dataframe(original_graph),
+        setup_edge_lengths=True,
+    )
+
+    converted_tree = apc.networkx_digraph_to_dendropy_tree(original_graph)
+    assert _node_attrs(converted_tree) == _node_attrs(expected_tree)
+    assert str(converted_tree) == str(expected_tree)
+
+
+@pytest.mark.parametrize("is_relabeled", [True, False])
+def test_labels_match_alife_dataframe_conversion(is_relabeled):
+    graph = nx.DiGraph()
+    graph.add_node(0, label="r", taxon_label="R", origin_time=0)
+    graph.add_node(1, label="x", taxon_label="X", edge_length=1)
+    graph.add_node(2, label="y", taxon_label="Y", origin_time=3)
+    graph.add_edges_from([(1, 0), (2, 1)])
+    if is_relabeled:
+        graph = nx.relabel_nodes(graph, {0: "r", 1: "a", 2: "b"})
+        for __, data in graph.nodes(data=True):
+            data.pop("label", None)
+
+    expected_tree = apc.alife_dataframe_to_dendropy_tree(
+        apc.networkx_digraph_to_alife_dataframe(graph),
+        setup_edge_lengths=True,
+    )
+
+    converted_tree = apc.networkx_digraph_to_dendropy_tree(graph)
+    assert _node_attrs(converted_tree) == _node_attrs(expected_tree)
+    assert str(converted_tree) == str(expected_tree)
+
+
+def test_attrs():
+    graph = nx.DiGraph()
+    graph.add_node("root", origin_time=0)
+    graph.add_node("a", taxon_label="A")
+    graph.add_node("b", origin_time=4)
+    graph.add_edge("a", "root", edge_length=1.5)
+    graph.add_edge("b", "root")
+
+    converted_tree = apc.networkx_digraph_to_dendropy_tree(graph)
+    assert _node_attrs(converted_tree) == [
+        (0, "root", None, 0, 0),
+        (1, "a", "A", 1.5, None),
+        (2, "b", None, 4, 4),
+    ]
+
+
+def test_empty():
+    assert apc.networkx_digraph_to_dendropy_tree(nx.DiGraph()) is None
+
+
+def test_multiple_roots():
+    graph = nx.DiGraph()
+    graph.add_edge(1, 0)
+    graph.add_node(2)
+    with pytest.raises(ValueError):
+        apc.networkx_digraph_to_dendropy_tree(graph)
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+
+'''
+`newick_to_alife_dataframe` tests for
+`alifedata-phyloinformatics-convert` package.
+'''
+
+import dendropy
+import io
+import mmap
+from os.path import dirname, realpath
+import pandas as pd
+import pytest
+
+import alifedata_phyloinformatics_convert as apc
+
+
+@pytest.mark.parametrize(
+    'newick',
+    [
+        *(
+            open(f'{dirname(realpath(__file__))}/assets/{filename}').read()
+            for filename in (
+                'APG_Angiosperms.newick',
+                'alifedata.newick',
+                'pythonidae.newick',
+            )
+        ),
+        'A;',
+        '[&R] ((A:1,B:2)n:3,C)r:0.5;',
+        "('quoted (label)':1,'it''s',under_score)'x y';",
+        '(a[comment],b[[nested]c]d,[c]e:2[c]);',
+        '(,(,),());',
+        '((),(A,),(,B):1);',
+        '(A:1,B:nan)C:2;',
+        '(A:1e-3,B:-2)C;',
+    ],
+)
+def test_matches_dendropy(newick):
+    expected_df = apc.dendropy_tree_to_alife_dataframe(
+        dendropy.Tree.get(data=newick, schema='newick'),
+    )
+    pd.testing.assert_frame_equal(
+        apc.newick_to_alife_dataframe(newick),
+        expected_df,
+    )
+    pd.testing.assert_frame_equal(
+        apc.newick_to_alife_dataframe(io.StringIO(newick)),
+        expected_df,
+    )
+    pd.testing.assert_frame_equal(
+        apc.newick_to_alife_dataframe(newick.encode()),
+        expected_df,
+    )
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 1 << 20])
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_multiple_trees(chunk_size, max_workers):
+    newick = (
+        "[&R] ((A:1,'b''c':2)n:3,C)r; ;\n"
+        "(a,(B,c)x):1[comment];"
+        "(a_b,'C d'[c]:4);"
+    )
+    expected_dfs = [
+        apc.dendropy_tree_to_alife_dataframe(tree)
+        for tree in dendropy.TreeList.get(data=newick, schema='newick')
+    ]
+    converted_dfs = list(apc.newick_to_alife_dataframes(
+        io.StringIO(newick), chunk_size=chunk_size, max_workers=max_workers,
+    ))
+
+    assert len(converted_dfs) == len(expected_dfs) == 3
+    for converted_df, expected_df in zip(converted_dfs, expected_dfs):
+        pd.testing.assert_frame_equal(converted_df, expected_df)
+
+
+def test_ancestor_id_only():
+    converted_df = apc.newick_to_alife_dataframe(
+        '((A,B)n,C)r;', ancestor_id_only=True,
+    )
+    assert converted_df['ancestor_id'].tolist() == [0, 0, 1, 1, 0]
+
+
+def test_caterpillar():
+    depth = 100_000
+    converted_df = apc.newick_to_alife_dataframe(
+        '(' * depth + 'A' + ')' * depth + ';',
+    )
+    assert len(converted_df) == depth + 1
+    assert converted_df['taxon_label'].iloc[-1] == 'A'
+
+
+@pytest.mark.parametrize(
+    'newick',
+    [
+        '',
+        ';;',
+        '(A,B)',
+        '((A,B);',
+        '(A,B));',
+        '(A,B)C D;',
+        '(A,B)(C);',
+        '(A:x,B);',
+        '(A,a);',
+        "('A,B);",
+    ],
+)
+def test_malformed(newick):
+    with pytest.raises(ValueError):
+        apc.newick_to_alife_dataframe(newick)
+    with pytest.raises(ValueError):
+        apc.newick_to_alife_dataframe(newick.encode())
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_mmap(max_workers):
+    path = f'{dirname(realpath(__file__))}/assets/pythonidae.newick'
+    with open(path, 'rb') as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ,
+    ) as mapped:
+        converted_df = apc.newick_to_alife_dataframe(
+            mapped, all_trees=True, max_workers=max_workers,
+        )
+
+    with open(path) as file:
+        expected_df = apc.newick_to_alife_dataframe(file, all_trees=True)
+    pd.testing.assert_frame_equal(converted_df, expected_df)
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+@pytest.mark.parametrize('ancestor_id_only', [False, True])
+def test_all_trees(max_workers, ancestor_id_only):
+    newick = "((A,B)n,C)r;\n('a;b'[;],c);\n(a,(b,c)x);"
+    converted_df = apc.newick_to_alife_dataframe(
+        newick,
+        all_trees=True,
+        ancestor_id_only=ancestor_id_only,
+        max_workers=max_workers,
+    )
+
+    assert converted_df['id'].tolist() == [*range(13)]
+    if ancestor_id_only:
+        assert converted_df['ancestor_id'].tolist() == [
+            0, 0, 1, 1, 0, 5, 5, 5, 8, 8, 8, 10, 10,
+        ]
+    else:
+        assert converted_df['ancestor_list'].tolist() == [
+            '[None]', '[0]', '[1]', '[1]', '[0]',
+            '[None]', '[5]', '[5]',
+            '[None]', '[8]', '[8]', '[10]', '[10]',
+        ]
+    assert converted_df['tree_index'].tolist() == [0] * 5 + [1] * 3 + [2] * 5
+    # taxon labels keep first-seen spelling across trees
+    assert converted_df['taxon_label'].tolist() == [
+        None, None, 'A', 'B', 'C',
+        None, 'a;b', 'C',
+        None, 'A', None, 'B', 'C',
+    ]